@@ -1,8 +1,10 @@
 from django.conf import settings
+from django.urls import URLPattern, URLResolver, path
 from rest_framework.routers import DefaultRouter, SimpleRouter
 
 from poker_club_manager.events.api.urls import router as events_router
-from poker_club_manager.users.api.views import UserViewSet
+from poker_club_manager.timers.api.urls import router as timers_router
+from poker_club_manager.users.api.views import UserViewSet, fetch_matching_names
 
 router = DefaultRouter() if settings.DEBUG else SimpleRouter()
 
@@ -10,4 +12,12 @@ router.register("users", UserViewSet, basename="user")
 
 
 app_name = "api"
-urlpatterns = router.urls + events_router.urls
+urlpatterns: list[URLPattern | URLResolver] = [
+    # Async view; listed before the router so it is not read as a username
+    path(
+        "users/fetch-matching-names/",
+        fetch_matching_names,
+        name="user-fetch-matching-names",
+    ),
+]
+urlpatterns += router.urls + events_router.urls + timers_router.urls
@@ -0,0 +1,24 @@
+"""
+ASGI config for Poker Club Manager project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Long-lived responses such as the timer Server-Sent Events streams need it.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/dev/howto/deployment/asgi/
+
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from django.core.asgi import get_asgi_application
+
+# This allows easy placement of apps within the interior
+# poker_club_manager directory.
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR / "poker_club_manager"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+application = get_asgi_application()
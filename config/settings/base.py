@@ -69,6 +69,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     "django.contrib.humanize",
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -301,6 +302,9 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_PAGINATION_CLASS": (
+        "poker_club_manager.common.api.pagination.IdCursorPagination"
+    ),
 }
 
 # django-cors-headers - https://github.com/adamchainz/django-cors-headers#setup
@@ -327,3 +331,37 @@ POINTS_DEFAULT_DECAY_STRATEGY = env(
     "POINTS_DEFAULT_DECAY_STRATEGY",
     default="global_attendance",
 )
+
+# "database" serves the leaderboard from the materialized table,
+# "redis" mirrors balances into sorted sets at REDIS_URL
+POINTS_LEADERBOARD_BACKEND = env(
+    "POINTS_LEADERBOARD_BACKEND",
+    default="database",
+)
+
+# Checkpoint a membership's balance once this many ledger rows
+# have been written since its last checkpoint
+POINTS_CHECKPOINT_INTERVAL = env.int("POINTS_CHECKPOINT_INTERVAL", default=20)
+
+# Events
+# Seconds after which a running completion job is presumed to belong to a
+# crashed worker and may be claimed again
+EVENTS_COMPLETION_JOB_TIMEOUT_SECONDS = env.int(
+    "EVENTS_COMPLETION_JOB_TIMEOUT_SECONDS",
+    default=600,
+)
+
+# Fragment cache
+# Seconds a rendered HTMX partial may be reused; changes to the data behind
+# a fragment invalidate it earlier through version counters
+FRAGMENT_CACHE_TIMEOUT = env.int("FRAGMENT_CACHE_TIMEOUT", default=300)
+
+# Timers
+# "memory" only reaches streams served by the publishing process;
+# "redis" fans out through pub/sub at REDIS_URL across workers
+TIMERS_BROKER = env("TIMERS_BROKER", default="memory")
+# Seconds between keepalive comments on idle timer streams
+TIMERS_STREAM_HEARTBEAT_SECONDS = env.int(
+    "TIMERS_STREAM_HEARTBEAT_SECONDS",
+    default=15,
+)
@@ -214,3 +214,5 @@ SPECTACULAR_SETTINGS["SERVERS"] = [
 ]
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Every worker must see timer updates published by any other worker
+TIMERS_BROKER = env("TIMERS_BROKER", default="redis")
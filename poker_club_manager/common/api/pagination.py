@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Default API pagination: opaque cursors over a unique ordering, so every
+    page costs the same and no COUNT(*) is issued. Subclasses or views
+    override ``ordering``; it must end with a unique field.
+    """
+
+    ordering: tuple[str, ...] = ("-id",)
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
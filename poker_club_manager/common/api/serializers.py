@@ -0,0 +1,41 @@
+from typing import TYPE_CHECKING
+
+from rest_framework.permissions import SAFE_METHODS
+
+if TYPE_CHECKING:
+    from rest_framework.serializers import Serializer
+
+    _SerializerBase = Serializer
+else:
+    _SerializerBase = object
+
+
+class SparseFieldsetMixin(_SerializerBase):
+    """
+    Lets API clients read a subset of a serializer's fields with
+    ``?fields=a,b``. Applies to serializers built with the request in
+    their context; unknown names are ignored.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        requested = requested_fields(kwargs.get("context", {}).get("request"))
+        if requested is None:
+            return
+
+        for name in set(self.fields) - requested:
+            self.fields.pop(name)
+
+
+def requested_fields(request) -> set[str] | None:
+    """
+    Field names from a read request's ``?fields=`` parameter, or None when
+    every field is wanted.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+
+    value = request.query_params.get("fields", "")
+    fields = {name.strip() for name in value.split(",") if name.strip()}
+    return fields or None
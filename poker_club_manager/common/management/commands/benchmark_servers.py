@@ -0,0 +1,141 @@
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+SERVERS = {
+    "wsgi": ["config.wsgi"],
+    "asgi": ["config.asgi", "-k", "uvicorn_worker.UvicornWorker"],
+}
+READY_TIMEOUT_SECONDS = 30
+
+
+class Command(BaseCommand):
+    help = (
+        "Start gunicorn with sync WSGI workers and with uvicorn ASGI workers "
+        "in turn, load the same paths on each and report requests/sec and "
+        "latency. Uses the current settings and database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help="Path to load; repeat for several (default: /events/, /leaderboard/).",
+        )
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--duration", type=float, default=10)
+        parser.add_argument(
+            "--cookie",
+            default="",
+            help="Cookie header to send, e.g. a sessionid for pages that need a login.",
+        )
+        parser.add_argument(
+            "--server",
+            action="append",
+            dest="servers",
+            choices=SERVERS,
+            help="Only run these servers (default: both).",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or ["/events/", "/leaderboard/"]
+        for name in options["servers"] or SERVERS:
+            port = _free_port()
+            server = subprocess.Popen(  # noqa: S603
+                [
+                    sys.executable,
+                    "-m",
+                    "gunicorn",
+                    *SERVERS[name],
+                    "--workers",
+                    str(options["workers"]),
+                    "--bind",
+                    f"127.0.0.1:{port}",
+                    "--log-level",
+                    "warning",
+                ],
+            )
+            try:
+                base_url = f"http://127.0.0.1:{port}"
+                self._wait_until_ready(base_url + paths[0], server)
+                for path in paths:
+                    self._report(
+                        name,
+                        path,
+                        self._load(base_url + path, options),
+                        options["duration"],
+                    )
+            finally:
+                server.terminate()
+                server.wait()
+
+    def _wait_until_ready(self, url, server):
+        deadline = time.monotonic() + READY_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                msg = "The server exited before accepting requests"
+                raise CommandError(msg)
+            try:
+                urllib.request.urlopen(url, timeout=1).close()  # noqa: S310
+            except urllib.error.HTTPError:
+                return
+            except OSError:
+                time.sleep(0.2)
+            else:
+                return
+        msg = f"The server did not answer {url} in {READY_TIMEOUT_SECONDS}s"
+        raise CommandError(msg)
+
+    def _load(self, url, options):
+        headers = {"Cookie": options["cookie"]} if options["cookie"] else {}
+        deadline = time.monotonic() + options["duration"]
+
+        def client():
+            timings, errors = [], 0
+            while time.monotonic() < deadline:
+                request = urllib.request.Request(url, headers=headers)  # noqa: S310
+                started = time.perf_counter()
+                try:
+                    with urllib.request.urlopen(request, timeout=30) as response:  # noqa: S310
+                        response.read()
+                except OSError:
+                    errors += 1
+                    continue
+                timings.append((time.perf_counter() - started) * 1000)
+            return timings, errors
+
+        with ThreadPoolExecutor(options["concurrency"]) as pool:
+            results = list(
+                pool.map(lambda _: client(), range(options["concurrency"])),
+            )
+
+        timings = sorted(t for client_timings, _ in results for t in client_timings)
+        return timings, sum(errors for _, errors in results)
+
+    def _report(self, name, path, result, duration):
+        timings, errors = result
+        if not timings:
+            self.stdout.write(f"{name} {path}: no successful requests, {errors} errors")
+            return
+
+        p99 = timings[max(0, int(len(timings) * 0.99) - 1)]
+        self.stdout.write(
+            f"{name} {path}: {len(timings) / duration:.1f} req/s, "
+            f"p50 {statistics.median(timings):.1f} ms, p99 {p99:.1f} ms, "
+            f"{errors} errors",
+        )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0004_memberstatistics_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='seasonmembership',
+            index=models.Index(models.F('season'), models.OrderBy(models.F('points'), descending=True), name='membership_season_points_idx'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.9 on 2026-10-18 11:20
+
+from django.db import migrations, models
+
+
+def backfill_counters(apps, schema_editor):
+    # Existing rows start at zero; rebuild them from the participations and
+    # ledger. There is nothing to count on a fresh database, and skipping it
+    # keeps the live models below out of later schema changes' way.
+    SeasonMembership = apps.get_model('common', 'SeasonMembership')
+    if not SeasonMembership.objects.exists():
+        return
+
+    from poker_club_manager.common.models import SeasonMembership as LiveMembership
+    from poker_club_manager.points.statistics import refresh_statistics
+
+    refresh_statistics(LiveMembership.objects.all())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0005_hot_path_indexes'),
+        # refresh_statistics reads participations and the ledger
+        ('events', '0010_event_search_idx'),
+        ('points', '0005_leaderboard_competition_ranks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memberstatistics',
+            name='cashes',
+            field=models.PositiveIntegerField(default=0, verbose_name='Cashes'),
+        ),
+        migrations.AddField(
+            model_name='memberstatistics',
+            name='events_played',
+            field=models.PositiveIntegerField(default=0, verbose_name='Events Played'),
+        ),
+        migrations.AddField(
+            model_name='memberstatistics',
+            name='finish_position_total',
+            field=models.PositiveIntegerField(default=0, verbose_name='Sum of Finishing Positions'),
+        ),
+        migrations.AddField(
+            model_name='memberstatistics',
+            name='finishes',
+            field=models.PositiveIntegerField(default=0, verbose_name='Ranked Finishes'),
+        ),
+        migrations.AddField(
+            model_name='memberstatistics',
+            name='points_lost',
+            field=models.PositiveIntegerField(default=0, verbose_name='Points Lost'),
+        ),
+        migrations.AddField(
+            model_name='memberstatistics',
+            name='points_won',
+            field=models.PositiveIntegerField(default=0, verbose_name='Points Won'),
+        ),
+        migrations.AddField(
+            model_name='memberstatistics',
+            name='total_eliminations',
+            field=models.PositiveIntegerField(default=0, verbose_name='Total Eliminations'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
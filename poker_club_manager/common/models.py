@@ -88,6 +88,13 @@ class SeasonMembership(AbstractTimestampedModel):
 
     class Meta:
         unique_together = ("user", "season")
+        indexes = [
+            models.Index(
+                "season",
+                models.F("points").desc(),
+                name="membership_season_points_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"SeasonProfile {self.id} for User {self.user.username}"
@@ -99,6 +106,20 @@ class MemberStatistics(AbstractTimestampedModel):
         related_name="statistics",
         on_delete=models.CASCADE,
     )
+    # Counters maintained by poker_club_manager.points.statistics
+    events_played = models.PositiveIntegerField(_("Events Played"), default=0)
+    cashes = models.PositiveIntegerField(_("Cashes"), default=0)
+    finishes = models.PositiveIntegerField(_("Ranked Finishes"), default=0)
+    finish_position_total = models.PositiveIntegerField(
+        _("Sum of Finishing Positions"),
+        default=0,
+    )
+    total_eliminations = models.PositiveIntegerField(
+        _("Total Eliminations"),
+        default=0,
+    )
+    points_won = models.PositiveIntegerField(_("Points Won"), default=0)
+    points_lost = models.PositiveIntegerField(_("Points Lost"), default=0)
 
     class Meta:
         verbose_name = _("Member Statistics")
@@ -109,6 +130,24 @@ class MemberStatistics(AbstractTimestampedModel):
 
     @property
     def events_participated(self) -> int:
-        return self.membership.user.participations.filter(
-            event__season=self.membership.season,
-        ).count()
+        return self.events_played
+
+    @property
+    def average_finish(self) -> float | None:
+        if not self.finishes:
+            return None
+        return self.finish_position_total / self.finishes
+
+    @property
+    def itm_rate(self) -> float | None:
+        """
+        Share of played events that were net-positive: the scoring row
+        (payout and bounties less the buy-in) came out above zero.
+        """
+        if not self.events_played:
+            return None
+        return self.cashes / self.events_played
+
+    @property
+    def net_points(self) -> int:
+        return self.points_won - self.points_lost
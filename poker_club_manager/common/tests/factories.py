@@ -0,0 +1,25 @@
+import datetime
+
+from factory import Sequence, SubFactory
+from factory.django import DjangoModelFactory
+
+from poker_club_manager.common.models import Season, SeasonMembership
+from poker_club_manager.users.tests.factories import UserFactory
+
+
+class SeasonFactory(DjangoModelFactory[Season]):
+    name = Sequence(lambda n: f"Season {n}")
+    start_date = datetime.date(2025, 1, 1)
+    is_active = False
+
+    class Meta:
+        model = Season
+
+
+class SeasonMembershipFactory(DjangoModelFactory[SeasonMembership]):
+    user = SubFactory(UserFactory)
+    season = SubFactory(SeasonFactory)
+    points = 0
+
+    class Meta:
+        model = SeasonMembership
@@ -0,0 +1,62 @@
+import datetime
+from http import HTTPStatus
+
+from poker_club_manager.common.tests.factories import (
+    SeasonFactory,
+    SeasonMembershipFactory,
+)
+from poker_club_manager.events.models import EventRSVP
+from poker_club_manager.events.tests.factories import EventFactory
+from poker_club_manager.points.services import refresh_leaderboard
+
+
+def _upcoming_event():
+    start = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(days=3)
+    return EventFactory(start_date=start, end_date=start + datetime.timedelta(hours=4))
+
+
+def test_event_detail_not_modified_until_rsvps_change(client, user):
+    event = _upcoming_event()
+    client.force_login(user)
+    url = f"/events/{event.id}/"
+
+    etag = client.get(url)["ETag"]
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == (
+        HTTPStatus.NOT_MODIFIED
+    )
+
+    EventRSVP.objects.create(event=event, user=user)
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == HTTPStatus.OK
+
+
+def test_event_list_partial_and_page_have_distinct_etags(client, user):
+    _upcoming_event()
+    client.force_login(user)
+
+    page = client.get("/events/")
+    partial = client.get("/events/", HTTP_HX_REQUEST="true")
+
+    assert page["ETag"] != partial["ETag"]
+    assert "HX-Request" in page["Vary"]
+
+
+def test_leaderboard_not_modified_until_standings_change(client, user):
+    season = SeasonFactory(is_active=True)
+    membership = SeasonMembershipFactory(season=season, points=10)
+    refresh_leaderboard(season.id)
+
+    response = client.get("/leaderboard/")
+    assert response["Last-Modified"]
+    etag = response["ETag"]
+    assert client.get("/leaderboard/", HTTP_IF_NONE_MATCH=etag).status_code == (
+        HTTPStatus.NOT_MODIFIED
+    )
+
+    membership.points = 20
+    membership.save()
+    refresh_leaderboard(season.id)
+
+    assert client.get("/leaderboard/", HTTP_IF_NONE_MATCH=etag).status_code == (
+        HTTPStatus.OK
+    )
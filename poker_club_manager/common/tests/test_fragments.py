@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from poker_club_manager.common.utils.fragments import bump_version, get_versions
+from poker_club_manager.events.models import EventRSVP
+from poker_club_manager.events.tests.factories import EventFactory
+
+HX = {"HTTP_HX_REQUEST": "true"}
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def upcoming_event(db):
+    start = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(days=3)
+    return EventFactory(start_date=start, end_date=start + datetime.timedelta(hours=4))
+
+
+def test_bump_version_changes_only_that_scope():
+    before = get_versions(["a", "b"])
+
+    bump_version("a")
+
+    after = get_versions(["a", "b"])
+    assert after[0] != before[0]
+    assert after[1] == before[1]
+
+
+def test_event_cards_are_served_from_cache(
+    client,
+    user,
+    upcoming_event,
+    django_assert_max_num_queries,
+):
+    client.force_login(user)
+    first = client.get("/events/", **HX)
+
+    # Request savepoints, session and user lookups and the three
+    # conditional GET aggregates; the event list query itself is skipped
+    with django_assert_max_num_queries(7):
+        second = client.get("/events/", **HX)
+
+    assert second.content == first.content
+
+
+def test_rsvp_invalidates_cached_fragments(
+    client,
+    user,
+    upcoming_event,
+    django_capture_on_commit_callbacks,
+):
+    client.force_login(user)
+    url = f"/events/_rsvp_button/{upcoming_event.id}"
+    assert b"Cancel RSVP" not in client.get(url, **HX).content
+
+    with django_capture_on_commit_callbacks(execute=True):
+        EventRSVP.objects.create(event=upcoming_event, user=user)
+
+    assert b"Cancel RSVP" in client.get(url, **HX).content
+
+
+def test_cached_fragments_follow_the_clock(client, user, upcoming_event, monkeypatch):
+    client.force_login(user)
+    assert b"Ongoing" not in client.get("/events/", **HX).content
+
+    # Nothing behind the fragment changes, but the event has now started
+    started = upcoming_event.start_date + datetime.timedelta(minutes=1)
+    monkeypatch.setattr(timezone, "now", lambda: started)
+
+    assert b"Ongoing" in client.get("/events/", **HX).content
@@ -0,0 +1,83 @@
+import datetime
+
+from django.db import connection
+from django.test import RequestFactory
+
+from poker_club_manager.common.tests.factories import (
+    SeasonFactory,
+    SeasonMembershipFactory,
+)
+from poker_club_manager.common.utils.db import table_name
+from poker_club_manager.common.utils.pagination import KeysetPaginator, paginate
+from poker_club_manager.events.models import Event
+from poker_club_manager.events.tests.factories import EventFactory
+from poker_club_manager.points.models import LeaderboardEntry
+from poker_club_manager.points.services import refresh_leaderboard
+
+
+def _events(count):
+    start = datetime.datetime(2025, 1, 1, 18, tzinfo=datetime.UTC)
+    # Pairs of events share a start date so the id tie-break is exercised
+    return [
+        EventFactory(start_date=start + datetime.timedelta(days=i // 2))
+        for i in range(count)
+    ]
+
+
+def test_keyset_pages_walk_forwards_and_backwards(db):
+    events = _events(7)
+    paginator = KeysetPaginator(Event.objects.all(), 3, ("start_date", "id"))
+
+    first = paginator.get_page()
+    second = paginator.get_page(first.next_cursor)
+    third = paginator.get_page(second.next_cursor)
+
+    walked = [e.id for page in (first, second, third) for e in page]
+    assert walked == [e.id for e in events]
+    assert not first.has_previous()
+    assert not third.has_next()
+    assert list(paginator.get_page(third.previous_cursor)) == list(second)
+    assert list(paginator.get_page(second.previous_cursor)) == list(first)
+    assert not paginator.get_page(second.previous_cursor).has_previous()
+
+
+def test_keyset_pages_leaderboard_entries(db):
+    season = SeasonFactory()
+    for points in (5, 30, 20, 20, 10):
+        SeasonMembershipFactory(season=season, points=points)
+    refresh_leaderboard(season.id)
+    entries = LeaderboardEntry.objects.filter(season=season)
+    paginator = KeysetPaginator(entries, 2, ("rank", "membership_id"))
+
+    first = paginator.get_page()
+    rest = paginator.get_page(first.next_cursor)
+    last = paginator.get_page(rest.next_cursor)
+
+    ranked = [e.points for page in (first, rest, last) for e in page]
+    assert ranked == [30, 20, 20, 10, 5]
+
+
+def test_invalid_cursor_falls_back_to_first_page(db):
+    events = _events(2)
+    paginator = KeysetPaginator(Event.objects.all(), 5, ("start_date", "id"))
+
+    assert list(paginator.get_page("not-a-cursor")) == events
+
+
+def test_paginate_tracks_page_number_and_total(db):
+    _events(7)
+    if connection.vendor == "postgresql":
+        # The page total comes from the planner's estimate
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {table_name(Event)}")
+    rf = RequestFactory()
+    events = Event.objects.all()
+
+    ordering = ("start_date", "id")
+
+    page, context = paginate(rf.get("/"), events, 3, keyset_ordering=ordering)
+    assert context == {"page": 1, "max_page": 3, "keyset": True, "cursor": ""}
+
+    request = rf.get("/", {"c": page.next_cursor, "p": 2})
+    _, context = paginate(request, events, 3, keyset_ordering=ordering)
+    assert context["page"] == 2  # noqa: PLR2004
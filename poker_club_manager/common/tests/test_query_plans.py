@@ -0,0 +1,127 @@
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from poker_club_manager.common.models import SeasonMembership
+from poker_club_manager.common.tests.factories import (
+    SeasonFactory,
+    SeasonMembershipFactory,
+)
+from poker_club_manager.events.models import EventRSVP
+from poker_club_manager.events.tests.factories import EventFactory
+from poker_club_manager.points.models import PointsLedger
+from poker_club_manager.points.services import refresh_leaderboard
+
+
+@pytest.fixture
+def seeded(db):
+    season = SeasonFactory()
+    events = EventFactory.create_batch(20, season=season)
+    # Other seasons' events, so a season filter is selective
+    EventFactory.create_batch(40, season=SeasonFactory())
+    memberships = SeasonMembershipFactory.create_batch(20, season=season)
+    for points, (event, membership) in enumerate(
+        zip(events, memberships, strict=True),
+    ):
+        EventRSVP.objects.create(event=event, user=membership.user)
+        PointsLedger.objects.create(
+            membership=membership,
+            event=event,
+            points_delta=points,
+            reason="seed",
+        )
+        membership.points = points
+        membership.save(update_fields=["points"])
+    refresh_leaderboard(season.id)
+
+    with connection.cursor() as cursor:
+        # Fresh statistics, whatever earlier tests left behind
+        cursor.execute("ANALYZE")
+        if connection.vendor == "postgresql":
+            # Tiny tables would otherwise always be scanned sequentially
+            cursor.execute("SET enable_seqscan = off")
+    yield SimpleNamespace(season=season, event=events[0], membership=memberships[0])
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("RESET enable_seqscan")
+
+
+def _plans(run) -> str:
+    """
+    EXPLAIN every statement ``run`` sends to the database and return the
+    plans as one string.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        run()
+
+    explain = "EXPLAIN " if connection.vendor == "postgresql" else "EXPLAIN QUERY PLAN "
+    plans = []
+    with connection.cursor() as cursor:
+        for query in queries.captured_queries:
+            sql = query["sql"].strip()
+            if sql.split(None, 1)[0].upper() in {"SELECT", "WITH", "INSERT"}:
+                cursor.execute(explain + sql)
+                plans.extend(" ".join(map(str, row)) for row in cursor.fetchall())
+    return "\n".join(plans)
+
+
+def _get(client, url):
+    def run():
+        assert client.get(url).status_code == 200  # noqa: PLR2004
+
+    return _plans(run)
+
+
+def test_event_list_uses_date_indexes(client, seeded):
+    plan = _get(client, reverse("events:list"))
+
+    # unfinished(): end_date >= now OR (end_date IS NULL AND start_date >= now)
+    assert "event_end_date_idx" in plan
+    assert "event_open_ended_start_idx" in plan
+
+
+def test_event_list_with_finished_uses_start_date_index(client, seeded):
+    plan = _get(client, f"{reverse('events:list')}?include_finished=1&s=date")
+
+    assert "event_start_date_idx" in plan
+
+
+def test_season_history_uses_season_start_index(client, seeded):
+    plan = _get(client, reverse("points:season-history", args=[seeded.season.id]))
+
+    assert "event_season_start_idx" in plan
+
+
+def test_leaderboard_uses_season_rank_index(client, seeded):
+    plan = _get(
+        client,
+        reverse("points:archived-leaderboard", args=[seeded.season.id]),
+    )
+
+    assert "leaderboard_season_rank_idx" in plan
+
+
+def test_incremental_leaderboard_refresh_uses_season_points_index(seeded):
+    SeasonMembership.objects.filter(id=seeded.membership.id).update(points=10)
+
+    plan = _plans(
+        lambda: refresh_leaderboard(
+            seeded.season.id,
+            membership_ids=[seeded.membership.id],
+        ),
+    )
+
+    assert "membership_season_points_idx" in plan
+
+
+def test_manage_rsvps_use_event_status_index(client, user, seeded):
+    user.user_permissions.add(Permission.objects.get(codename="manage_event"))
+    client.force_login(user)
+
+    plan = _get(client, reverse("events:manage", args=[seeded.event.id]))
+
+    assert "rsvp_event_status_idx" in plan
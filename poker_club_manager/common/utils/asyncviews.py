@@ -0,0 +1,44 @@
+from asgiref.sync import sync_to_async
+from django.shortcuts import render
+
+
+async def aget_user(request):
+    """
+    Resolve the user through the async auth API and store it on
+    ``request.user``, so helpers of async views reading it afterwards do
+    not query.
+    """
+    request.user = await request.auser()
+    return request.user
+
+
+async def arender(request, template_name: str, context=None, **kwargs):
+    """
+    ``render`` for async views. Full pages run context processors and tags
+    that may query (``perms``, messages), so they are rendered in a worker
+    thread; evaluate querysets in the view with the async ORM first.
+    """
+    return await sync_to_async(render)(request, template_name, context, **kwargs)
+
+
+async def aiterate(iterable):
+    """
+    Advance a blocking iterable in a worker thread, one item at a time.
+    Under ASGI a StreamingHttpResponse reads a sync iterator to the end
+    before sending anything, so streamed downloads are wrapped in this.
+    Items are always produced on the same thread, which server-side
+    cursors need.
+    """
+    iterator = iter(iterable)
+    done = object()
+
+    def advance():
+        return next(iterator, done)
+
+    try:
+        while (item := await sync_to_async(advance)()) is not done:
+            yield item
+    finally:
+        # Release the cursor when the client disconnects part way
+        if close := getattr(iterator, "close", None):
+            await sync_to_async(close)()
@@ -0,0 +1,111 @@
+import datetime
+import functools
+import hashlib
+from inspect import iscoroutinefunction
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import condition
+
+
+def latest_changes(*querysets) -> tuple:
+    """
+    ``(max(updated_at), count)`` of each queryset. The count catches
+    deletions, which leave no newer ``updated_at`` behind.
+    """
+    changes = []
+    for qs in querysets:
+        latest = qs.order_by().aggregate(last=Max("updated_at"), total=Count("pk"))
+        changes.append((latest["last"], latest["total"]))
+    return tuple(changes)
+
+
+async def alatest_changes(*querysets) -> tuple:
+    changes = []
+    for qs in querysets:
+        latest = await qs.order_by().aaggregate(
+            last=Max("updated_at"),
+            total=Count("pk"),
+        )
+        changes.append((latest["last"], latest["total"]))
+    return tuple(changes)
+
+
+def last_modified(changes: tuple, *moments) -> datetime.datetime | None:
+    """
+    The newest ``updated_at`` among ``changes`` and any extra ``moments``.
+    """
+    candidates = [last for last, _ in changes if last is not None]
+    candidates += [moment for moment in moments if moment is not None]
+    return max(candidates, default=None)
+
+
+def current_minute() -> datetime.datetime:
+    """
+    For pages whose content also changes with the clock (RSVP windows,
+    active events): validators including it expire once a minute.
+    """
+    return timezone.now().replace(second=0, microsecond=0)
+
+
+def _remembered_last_modified(request, *args, **kwargs):
+    return request._page_validators[0]  # noqa: SLF001
+
+
+def _remembered_etag(request, *args, **kwargs):
+    return request._page_validators[1]  # noqa: SLF001
+
+
+def conditional_page(get_validators):
+    """
+    Answer conditional GETs with 304 before the view runs its queries.
+
+    ``get_validators(request, *args, **kwargs)`` returns the page's
+    Last-Modified datetime (or None) and a tuple of values that change
+    whenever the rendered page would; it is called once per request.
+    HTMX partial requests get their own validators. Async views may pass a
+    coroutine function.
+    """
+
+    def decorator(view):
+        def remember(request, last_modified, parts):
+            parts = (*parts, request.headers.get("HX-Request", ""))
+            etag = hashlib.sha256(repr(parts).encode()).hexdigest()
+            request._page_validators = (last_modified, etag)  # noqa: SLF001
+
+        conditional_view = condition(
+            etag_func=_remembered_etag,
+            last_modified_func=_remembered_last_modified,
+        )(view)
+
+        if iscoroutinefunction(view):
+
+            @functools.wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                if iscoroutinefunction(get_validators):
+                    validators = await get_validators(request, *args, **kwargs)
+                else:
+                    validators = await sync_to_async(get_validators)(
+                        request,
+                        *args,
+                        **kwargs,
+                    )
+                remember(request, *validators)
+                response = await conditional_view(request, *args, **kwargs)
+                patch_vary_headers(response, ("HX-Request",))
+                return response
+
+            return async_wrapper
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            remember(request, *get_validators(request, *args, **kwargs))
+            response = conditional_view(request, *args, **kwargs)
+            patch_vary_headers(response, ("HX-Request",))
+            return response
+
+        return wrapper
+
+    return decorator
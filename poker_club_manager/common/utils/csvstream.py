@@ -0,0 +1,62 @@
+import csv
+import itertools
+
+from django.http import StreamingHttpResponse
+
+from poker_club_manager.common.utils.asyncviews import aiterate
+
+CSV_CHUNK_SIZE = 2000
+
+# Spreadsheets run a cell starting with one of these as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _Echo:
+    # csv.writer only needs write(); returning the line lets us yield it
+    def write(self, value):
+        return value
+
+
+def escape_formula(value):
+    """
+    Prefix text that a spreadsheet would evaluate as a formula with a
+    quote, so user-entered names export as plain text. Numbers are kept.
+    """
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def stream_csv(
+    filename: str,
+    header: list[str],
+    queryset,
+    *,
+    chunk_size: int = CSV_CHUNK_SIZE,
+) -> StreamingHttpResponse:
+    """
+    Stream ``queryset`` (a ``values_list`` queryset matching ``header``)
+    as a CSV download. The header is sent before the query runs, and rows
+    are read with ``.iterator()`` and written one chunk at a time, each
+    fetched in a worker thread as ASGI asks for it, so memory does not
+    grow with the number of rows.
+
+    Views returning this must be ``transaction.non_atomic_requests``: the
+    rows are read after the view returns.
+    """
+    writer = csv.writer(_Echo())
+
+    def lines():
+        yield writer.writerow(header)
+        rows = queryset.iterator(chunk_size=chunk_size)
+        for chunk in itertools.batched(rows, chunk_size, strict=False):
+            yield "".join(
+                writer.writerow([escape_formula(value) for value in row])
+                for row in chunk
+            )
+
+    return StreamingHttpResponse(
+        aiterate(lines()),
+        content_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,17 @@
+from django.db import connection
+
+# Model._meta is Django's documented Model _meta API despite the underscore
+
+
+def model_field(model, name: str):
+    """
+    The field ``name`` of ``model``.
+    """
+    return model._meta.get_field(name)  # noqa: SLF001
+
+
+def table_name(model) -> str:
+    """
+    The quoted database table of ``model``, for raw SQL.
+    """
+    return connection.ops.quote_name(model._meta.db_table)  # noqa: SLF001
@@ -0,0 +1,113 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+
+from poker_club_manager.common.utils.conditional import current_minute
+
+VERSION_KEY_PREFIX = "fragment-version"
+FRAGMENT_KEY_PREFIX = "fragment"
+
+
+def _version_key(scope: str) -> str:
+    return f"{VERSION_KEY_PREFIX}:{scope}"
+
+
+def get_versions(scopes: list[str]) -> list[int]:
+    """
+    Current version of each scope. Versions start at the current time so a
+    counter evicted from the cache never reuses an older value.
+    """
+    keys = [_version_key(scope) for scope in scopes]
+    versions = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    for key, version in missing.items():
+        if not cache.add(key, version, timeout=None):
+            missing[key] = cache.get(key, version)
+    versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(scopes: list[str]) -> list[int]:
+    keys = [_version_key(scope) for scope in scopes]
+    versions = await cache.aget_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    for key, version in missing.items():
+        if not await cache.aadd(key, version, timeout=None):
+            missing[key] = await cache.aget(key, version)
+    versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def bump_version(*scopes: str):
+    """
+    Invalidate every fragment rendered under any of ``scopes``.
+    """
+    for scope in scopes:
+        key = _version_key(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def render_cached_fragment(
+    request,
+    template_name: str,
+    get_context,
+    *,
+    scopes: list[str],
+    per_user: bool = False,
+) -> HttpResponse:
+    """
+    Render a partial template, reusing a cached copy while none of its
+    ``scopes`` have been bumped. ``get_context`` is only called on a miss,
+    so the querysets behind the fragment are not run for cache hits.
+    Copies are also keyed on the current minute, since event states such as
+    active or RSVP open change with the clock rather than with the data.
+    Fragments that depend on who is looking must pass ``per_user``.
+    """
+    key = _fragment_key(request, template_name, get_versions(scopes), per_user)
+    content = cache.get(key)
+    if content is None:
+        content = render_to_string(template_name, get_context(), request=request)
+        cache.set(key, content, timeout=settings.FRAGMENT_CACHE_TIMEOUT)
+    return HttpResponse(content)
+
+
+async def arender_cached_fragment(
+    request,
+    template_name: str,
+    get_context,
+    *,
+    scopes: list[str],
+    per_user: bool = False,
+) -> HttpResponse:
+    """
+    ``render_cached_fragment`` for async views; ``get_context`` is a
+    coroutine function whose context must already be evaluated.
+    """
+    versions = await aget_versions(scopes)
+    key = _fragment_key(request, template_name, versions, per_user)
+    content = await cache.aget(key)
+    if content is None:
+        context = await get_context()
+        content = render_to_string(template_name, context, request=request)
+        await cache.aset(key, content, timeout=settings.FRAGMENT_CACHE_TIMEOUT)
+    return HttpResponse(content)
+
+
+def _fragment_key(request, template_name, versions, per_user) -> str:
+    parts = [
+        template_name,
+        request.get_full_path(),
+        current_minute().isoformat(),
+        *map(str, versions),
+    ]
+    if per_user:
+        parts.append(str(request.user.pk))
+    digest = hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+    return f"{FRAGMENT_KEY_PREFIX}:{digest}"
@@ -0,0 +1,223 @@
+import base64
+import binascii
+import json
+import math
+from dataclasses import dataclass
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+
+from .db import model_field
+from .params import parse_int
+
+
+@dataclass
+class KeysetPage:
+    object_list: list
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+
+class KeysetPaginator:
+    """
+    Pages a queryset by seeking past the last row seen instead of using
+    OFFSET, so every page costs the same however deep it is. ``ordering``
+    must be unique per row (end it with the primary key), e.g.
+    ``("start_date", "id")`` or ``("-points", "id")``.
+    """
+
+    def __init__(self, queryset, per_page: int, ordering: tuple[str, ...]):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = ordering
+        self.fields = [
+            model_field(queryset.model, name.removeprefix("-")) for name in ordering
+        ]
+
+    def get_page(self, cursor: str | None = None) -> KeysetPage:
+        """
+        The page after (or, for a "previous" cursor, before) ``cursor``,
+        or the first page when there is no valid cursor.
+        """
+        qs, values, backwards = self._page_queryset(cursor)
+        return self._build_page(list(qs), values, backwards=backwards)
+
+    async def aget_page(self, cursor: str | None = None) -> KeysetPage:
+        qs, values, backwards = self._page_queryset(cursor)
+        rows = [row async for row in qs]
+        return self._build_page(rows, values, backwards=backwards)
+
+    def approximate_count(self) -> int:
+        """
+        The planner's row estimate on PostgreSQL (no COUNT(*) scan), or
+        an exact count elsewhere.
+        """
+        if connections[self.queryset.db].vendor != "postgresql":
+            return self.queryset.count()
+
+        plan = json.loads(self.queryset.order_by().explain(format="json"))
+        return plan[0]["Plan"]["Plan Rows"]
+
+    async def aapproximate_count(self) -> int:
+        if connections[self.queryset.db].vendor != "postgresql":
+            return await self.queryset.acount()
+
+        plan = json.loads(await self.queryset.order_by().aexplain(format="json"))
+        return plan[0]["Plan"]["Plan Rows"]
+
+    def _page_queryset(self, cursor: str | None):
+        try:
+            values, backwards = self.decode_cursor(cursor) if cursor else (None, False)
+        except ValueError:
+            values, backwards = None, False
+
+        ordering = self._reversed_ordering() if backwards else self.ordering
+        qs = self.queryset.order_by(*ordering)
+        if values is not None:
+            qs = qs.filter(self._seek(ordering, values))
+        # One row past the page tells whether there is another
+        return qs[: self.per_page + 1], values, backwards
+
+    def _build_page(self, rows: list, values, *, backwards: bool) -> KeysetPage:
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if backwards:
+            rows.reverse()
+            return KeysetPage(
+                rows,
+                next_cursor=self.encode_cursor(rows[-1]) if rows else None,
+                previous_cursor=(
+                    self.encode_cursor(rows[0], backwards=True) if has_more else None
+                ),
+            )
+
+        return KeysetPage(
+            rows,
+            next_cursor=self.encode_cursor(rows[-1]) if has_more else None,
+            previous_cursor=(
+                self.encode_cursor(rows[0], backwards=True)
+                if rows and values is not None
+                else None
+            ),
+        )
+
+    def encode_cursor(self, obj, *, backwards: bool = False) -> str:
+        values = [field.value_to_string(obj) for field in self.fields]
+        payload = json.dumps([values, backwards])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> tuple[list, bool]:
+        try:
+            values, backwards = json.loads(base64.urlsafe_b64decode(cursor))
+            values = [
+                field.to_python(value)
+                for field, value in zip(self.fields, values, strict=True)
+            ]
+        except (binascii.Error, TypeError, ValidationError) as e:
+            msg = "Invalid cursor"
+            raise ValueError(msg) from e
+        return values, bool(backwards)
+
+    def _reversed_ordering(self) -> tuple[str, ...]:
+        return tuple(
+            name.removeprefix("-") if name.startswith("-") else f"-{name}"
+            for name in self.ordering
+        )
+
+    def _seek(self, ordering: tuple[str, ...], values: list) -> Q:
+        # (a, b) > (x, y) expands to a > x OR (a = x AND b > y)
+        seek = Q()
+        for i, name in enumerate(ordering):
+            field = name.removeprefix("-")
+            lookup = "lt" if name.startswith("-") else "gt"
+            condition = Q(**{f"{field}__{lookup}": values[i]})
+            for previous, value in zip(ordering[:i], values[:i], strict=True):
+                condition &= Q(**{previous.removeprefix("-"): value})
+            seek |= condition
+        return seek
+
+
+def paginate(request, items, per_page: int, *, keyset_ordering=None):
+    """
+    Page ``items`` from the request's ``p`` (page) and ``c`` (cursor)
+    parameters. With a ``keyset_ordering`` the items must be a queryset and
+    are paged by cursor with an approximate page total; otherwise Django's
+    Paginator is used. Returns the page and its page navigator context.
+    """
+    if keyset_ordering is None:
+        paginator = Paginator(items, per_page)
+        page = parse_int(
+            request.GET.get("p"),
+            default=1,
+            min_value=1,
+            max_value=paginator.num_pages,
+        )
+        return paginator.get_page(page), {
+            "page": page,
+            "max_page": paginator.num_pages,
+            "keyset": False,
+        }
+
+    keyset = KeysetPaginator(items, per_page, keyset_ordering)
+    cursor = request.GET.get("c", "")
+    page_obj = keyset.get_page(cursor)
+    count = keyset.approximate_count() if page_obj.has_next() else None
+    return page_obj, _keyset_context(request, page_obj, cursor, per_page, count)
+
+
+async def apaginate(request, items, per_page: int, *, keyset_ordering=None):
+    """
+    ``paginate`` for async views. Keyset pages are read with the async ORM;
+    Django's Paginator has no async API, so other items are paged in a
+    worker thread.
+    """
+    if keyset_ordering is None:
+        return await sync_to_async(_paginate_eagerly)(request, items, per_page)
+
+    paginator = KeysetPaginator(items, per_page, keyset_ordering)
+    cursor = request.GET.get("c", "")
+    page_obj = await paginator.aget_page(cursor)
+    count = await paginator.aapproximate_count() if page_obj.has_next() else None
+    return page_obj, _keyset_context(request, page_obj, cursor, per_page, count)
+
+
+def _paginate_eagerly(request, items, per_page: int):
+    # Evaluate the page here: templates rendered by async views cannot query
+    page, context = paginate(request, items, per_page)
+    page.object_list = list(page.object_list)
+    return page, context
+
+
+def _keyset_context(request, page_obj, cursor, per_page, approximate_count):
+    page = (
+        parse_int(request.GET.get("p"), default=1, min_value=1)
+        if cursor and page_obj.has_previous()
+        else 1
+    )
+    if approximate_count is not None:
+        max_page = max(page + 1, math.ceil(approximate_count / per_page))
+    else:
+        max_page = page
+
+    return {
+        "page": page,
+        "max_page": max_page,
+        "keyset": True,
+        "cursor": cursor,
+    }
@@ -1,8 +1,15 @@
 from django.contrib import admin
 
-from .models import Event, EventRSVP, GuestParticipant, Participant
+from .models import (
+    Event,
+    EventCompletionJob,
+    EventRSVP,
+    GuestParticipant,
+    Participant,
+)
 
 admin.site.register(Event)
 admin.site.register(Participant)
 admin.site.register(EventRSVP)
 admin.site.register(GuestParticipant)
+admin.site.register(EventCompletionJob)
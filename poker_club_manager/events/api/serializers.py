@@ -1,43 +1,129 @@
 from rest_framework import serializers
 
+from poker_club_manager.common.api.serializers import SparseFieldsetMixin
 from poker_club_manager.events.models import (
     Event,
+    EventCompletionJob,
     EventRSVP,
     Participant,
 )
 
 
-class EventRSVPSerializer(serializers.ModelSerializer):
+class EventRSVPSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    username = serializers.CharField(
+        source="user.username",
+        read_only=True,
+        allow_null=True,
+    )
+
     class Meta:
         model = EventRSVP
         fields = [
             "id",
             "event",
             "user",
-            "guest_name",
-            "guest_email",
+            "username",
             "status",
+            "arrival_time",
             "updated_at",
         ]
         read_only_fields = ["event", "user"]
 
 
-class ParticipantSerializer(serializers.ModelSerializer):
+class ParticipantSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    username = serializers.CharField(source="user.username", read_only=True)
+
     class Meta:
         model = Participant
         fields = [
             "id",
             "event",
             "user",
+            "username",
             "final_position",
+            "eliminations",
         ]
         read_only_fields = ["event", "user"]
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     going_count = serializers.IntegerField(read_only=True)
     late_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Event
-        fields = "__all__"
+        fields = [
+            "id",
+            "season",
+            "title",
+            "description",
+            "scoring_strategy",
+            "start_date",
+            "end_date",
+            "location",
+            "going_count",
+            "late_count",
+            "created_at",
+            "updated_at",
+        ]
+
+
+class EventCompletionJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = EventCompletionJob
+        fields = [
+            "id",
+            "event",
+            "status",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+
+BULK_CHECK_IN_MAX_ROWS = 500
+
+
+class GuestCheckInSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=100)
+    email = serializers.EmailField(required=False, allow_blank=True, default="")
+
+
+class BulkCheckInSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        default=list,
+        max_length=BULK_CHECK_IN_MAX_ROWS,
+    )
+    guests = serializers.ListField(
+        child=GuestCheckInSerializer(),
+        required=False,
+        default=list,
+        max_length=BULK_CHECK_IN_MAX_ROWS,
+    )
+
+    def validate(self, attrs):
+        if not attrs["user_ids"] and not attrs["guests"]:
+            msg = "Provide user_ids or guests to check in."
+            raise serializers.ValidationError(msg)
+        return attrs
+
+
+class ParticipantResultSerializer(serializers.Serializer):
+    participant_id = serializers.IntegerField()
+    final_position = serializers.IntegerField(min_value=1)
+    eliminations = serializers.IntegerField(min_value=0, required=False)
+
+
+class GuestResultSerializer(serializers.Serializer):
+    guest_id = serializers.IntegerField()
+    final_position = serializers.IntegerField(min_value=1)
+
+
+class ResultsSerializer(serializers.Serializer):
+    participants = ParticipantResultSerializer(many=True, required=False, default=list)
+    guests = GuestResultSerializer(many=True, required=False, default=list)
+    complete = serializers.BooleanField(required=False, default=False)
@@ -1,8 +1,18 @@
 from rest_framework.routers import DefaultRouter
 
-from .views import EventRSVPViewSet, EventViewSet, ParticipantViewSet
+from .views import (
+    EventCompletionJobViewSet,
+    EventRSVPViewSet,
+    EventViewSet,
+    ParticipantViewSet,
+)
 
 router = DefaultRouter()
 router.register(r"events", EventViewSet, basename="event")
 router.register(r"rsvps", EventRSVPViewSet, basename="rsvp")
 router.register(r"participants", ParticipantViewSet, basename="participant")
+router.register(
+    r"completion-jobs",
+    EventCompletionJobViewSet,
+    basename="completion-job",
+)
@@ -2,28 +2,78 @@ from django.contrib.auth import get_user_model
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 
+from poker_club_manager.common.api.pagination import IdCursorPagination
 from poker_club_manager.common.api.permissions import CanManageEvent
-from poker_club_manager.events.models import Event, EventRSVP, Participant
+from poker_club_manager.common.api.serializers import requested_fields
+from poker_club_manager.events.models import (
+    Event,
+    EventCompletionJob,
+    EventRSVP,
+    Participant,
+)
+from poker_club_manager.events.services import apply_results, bulk_check_in
 
 from .serializers import (
+    BulkCheckInSerializer,
+    EventCompletionJobSerializer,
     EventRSVPSerializer,
     EventSerializer,
     ParticipantSerializer,
+    ResultsSerializer,
 )
 
 User = get_user_model()
 
+RSVP_COUNT_FIELDS = {"going_count", "late_count"}
+
+
+class EventCursorPagination(IdCursorPagination):
+    ordering = ("start_date", "id")
+
 
 class EventViewSet(viewsets.ModelViewSet):
-    queryset = Event.objects.all().annotate_rsvp_count()
+    queryset = Event.objects.all()
     serializer_class = EventSerializer
+    pagination_class = EventCursorPagination
+
+    def get_queryset(self):
+        fields = requested_fields(self.request)
+        # The RSVP counts aggregate over every RSVP; skip them when unused
+        if fields is None or fields & RSVP_COUNT_FIELDS:
+            return Event.objects.annotate_rsvp_count()
+        return super().get_queryset()
 
     def get_permissions(self):
         if self.action in {"rsvp"}:
             return [permissions.IsAuthenticated()]
         return [CanManageEvent()]
 
+    @action(detail=True, methods=["post"])
+    def complete(self, request, pk=None):
+        event = self.get_object()
+        try:
+            job = event.queue_completion()
+        except ValueError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = EventCompletionJobSerializer(job)
+        return Response(
+            serializer.data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={
+                "Location": reverse(
+                    "api:completion-job-detail",
+                    args=[job.id],
+                    request=request,
+                ),
+            },
+        )
+
     @action(detail=True, methods=["post"], url_path="cancel-rsvp")
     def cancel_rsvp(self, request, pk=None):
         event = self.get_object()
@@ -100,6 +150,53 @@ class EventViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK,
         )
 
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="bulk-check-in",
+    )
+    def bulk_check_in(self, request, pk=None):
+        """
+        Check in a batch of users and guests in one transaction; the
+        response has an outcome for every row.
+        """
+        event = self.get_object()
+        serializer = BulkCheckInSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk_check_in(
+            event,
+            serializer.validated_data["user_ids"],
+            serializer.validated_data["guests"],
+        )
+        return Response(results, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["post"])
+    def results(self, request, pk=None):
+        """
+        Record final positions and eliminations for the whole field at
+        once, optionally queueing the event's completion afterwards.
+        """
+        event = self.get_object()
+        serializer = ResultsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            job = apply_results(
+                event,
+                serializer.validated_data["participants"],
+                serializer.validated_data["guests"],
+                complete=serializer.validated_data["complete"],
+            )
+        except ValueError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        data: dict[str, object] = {"status": "results updated"}
+        if job is not None:
+            data["completion_job"] = EventCompletionJobSerializer(job).data
+        return Response(data, status=status.HTTP_200_OK)
+
     @action(
         detail=True,
         methods=["post"],
@@ -125,12 +222,18 @@ class EventViewSet(viewsets.ModelViewSet):
 
 
 class EventRSVPViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = EventRSVP.objects.all()
+    queryset = EventRSVP.objects.select_related("user")
     serializer_class = EventRSVPSerializer
     permission_classes = [CanManageEvent]
 
 
 class ParticipantViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Participant.objects.all()
+    queryset = Participant.objects.select_related("user")
     serializer_class = ParticipantSerializer
     permission_classes = [CanManageEvent]
+
+
+class EventCompletionJobViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = EventCompletionJob.objects.all()
+    serializer_class = EventCompletionJobSerializer
+    permission_classes = [CanManageEvent]
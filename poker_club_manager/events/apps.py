@@ -10,4 +10,4 @@ class EventsConfig(AppConfig):
 
     def ready(self):
         with contextlib.suppress(ImportError):
-            from . import signals  # noqa: F401, PLC0415
+            from . import receivers, signals  # noqa: F401, PLC0415
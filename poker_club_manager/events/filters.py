@@ -30,6 +30,15 @@ class EventListFilter:
 
         return self._apply_order(qs)
 
+    @property
+    def keyset_ordering(self) -> tuple[str, ...] | None:
+        """
+        The unique ordering to page by cursor, if the order allows it.
+        """
+        if self.order == "popular" or (self.order == "relevance" and self.search_query):
+            return None
+        return ("start_date", "id")
+
     def _apply_order(self, qs):
         match self.order:
             case "date":
@@ -38,8 +47,8 @@ class EventListFilter:
             case "popular":
                 return qs.by_popularity()
 
-            case "relevance":
-                return qs.by_start_date()
+            case "relevance" if self.search_query:
+                return qs.by_relevance()
 
             case _:
                 return qs.by_start_date()
@@ -1,3 +1,7 @@
+import csv
+import io
+import json
+
 from django import forms
 
 from poker_club_manager.common.models import Season
@@ -39,3 +43,98 @@ class GuestCheckInForm(forms.ModelForm):
     class Meta:
         model = GuestParticipant
         fields = ["name", "email"]
+
+
+class ResultsUploadForm(forms.Form):
+    """
+    Results as CSV (a header row) or a JSON list of objects. Each row names
+    a participant by ``username`` or a guest by ``guest_name`` and gives a
+    ``final_position`` and, for members, optionally ``eliminations``.
+    """
+
+    file = forms.FileField()
+    complete = forms.BooleanField(required=False)
+
+    def __init__(self, *args, event, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.event = event
+
+    def clean_file(self):
+        upload = self.cleaned_data["file"]
+        try:
+            text = upload.read().decode("utf-8-sig")
+            if upload.name.lower().endswith(".json"):
+                rows = json.loads(text)
+            else:
+                rows = list(csv.DictReader(io.StringIO(text)))
+        except (UnicodeDecodeError, json.JSONDecodeError, csv.Error) as e:
+            msg = f"Could not read the file: {e}"
+            raise forms.ValidationError(msg) from e
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            msg = "JSON results must be a list of objects."
+            raise forms.ValidationError(msg)
+
+        self.participant_rows, self.guest_rows = self._resolve(rows)
+        return upload
+
+    def _resolve(self, rows):
+        participants = dict(
+            self.event.participants.values_list("user__username", "id"),
+        )
+        guests: dict[str, list[int]] = {}
+        for guest_id, name in self.event.guests.values_list("id", "name"):
+            guests.setdefault(name, []).append(guest_id)
+
+        participant_rows, guest_rows, errors = [], [], []
+        for line, row in enumerate(rows, start=1):
+            username = str(row.get("username") or "").strip()
+            guest_name = str(row.get("guest_name") or "").strip()
+            position = _count(row.get("final_position"), minimum=1)
+            if position is None:
+                errors.append(
+                    f"Row {line}: final_position must be a number of 1 or more.",
+                )
+                continue
+            eliminations = None
+            if row.get("eliminations"):
+                eliminations = _count(row["eliminations"], minimum=0)
+                if eliminations is None:
+                    errors.append(
+                        f"Row {line}: eliminations must be a number of 0 or more.",
+                    )
+                    continue
+
+            if username:
+                if username not in participants:
+                    errors.append(f"Row {line}: {username} is not checked in.")
+                    continue
+                participant_rows.append(
+                    {
+                        "participant_id": participants[username],
+                        "final_position": position,
+                        "eliminations": eliminations,
+                    },
+                )
+            elif len(guests.get(guest_name, [])) == 1:
+                guest_rows.append(
+                    {"guest_id": guests[guest_name][0], "final_position": position},
+                )
+            else:
+                errors.append(
+                    f"Row {line}: no single guest named {guest_name!r}."
+                    if guest_name
+                    else f"Row {line}: needs a username or guest_name.",
+                )
+
+        if errors:
+            raise forms.ValidationError(errors)
+        return participant_rows, guest_rows
+
+
+def _count(value, *, minimum: int) -> int | None:
+    # A whole number of at least ``minimum``, or None for anything else
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number >= minimum else None
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from poker_club_manager.events.services import (
+    claim_next_completion_job,
+    run_completion_job,
+)
+
+
+class Command(BaseCommand):
+    help = "Run queued event completions (scoring and decay) outside of requests."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the queue and exit instead of polling forever.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Seconds to sleep between polls when the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            job = claim_next_completion_job()
+            if job is None:
+                if options["once"]:
+                    return
+                time.sleep(options["interval"])
+                continue
+
+            job = run_completion_job(job)
+            self.stdout.write(f"{job} finished")
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_remove_eventrsvp_rsvp_user_or_guest_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventCompletionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Started At')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished At')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='completion_jobs', to='events.event', verbose_name='Event')),
+            ],
+            options={
+                'verbose_name': 'Event Completion Job',
+                'verbose_name_plural': 'Event Completion Jobs',
+                'ordering': ['created_at'],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status__in', ['queued', 'running'])), fields=('event',), name='unique_pending_completion_job')],
+            },
+        ),
+    ]
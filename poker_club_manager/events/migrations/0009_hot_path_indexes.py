@@ -0,0 +1,47 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0005_hot_path_indexes'),
+        ('events', '0008_eventcompletionjob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='event',
+            name='season',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='events', to='common.season', verbose_name='Season'),
+        ),
+        migrations.AlterField(
+            model_name='eventrsvp',
+            name='event',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='rsvps', to='events.event'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_date'], name='event_start_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['end_date'], name='event_end_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('end_date__isnull', True)), fields=['start_date'], name='event_open_ended_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['season', 'start_date'], name='event_season_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventrsvp',
+            index=models.Index(fields=['event', 'status'], name='rsvp_event_status_idx'),
+        ),
+    ]
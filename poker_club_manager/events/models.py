@@ -1,9 +1,12 @@
 import logging
+import re
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.db.models import Count, Exists, OuterRef, Prefetch, Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -19,6 +22,22 @@ MAXIMUM_DAYS_FOR_EVENT_RSVP = 14
 
 logger = logging.getLogger(__name__)
 
+SEARCH_CONFIG = "english"
+# Must match the expression of event_search_idx for the index to be used
+EVENT_SEARCH_VECTOR = SearchVector(
+    "title",
+    weight="A",
+    config=SEARCH_CONFIG,
+) + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+
+
+def prefix_tsquery(query: str) -> str:
+    """
+    Turn free text into a raw tsquery where every word must match
+    as a prefix, e.g. "spring tour" -> "spring:* & tour:*".
+    """
+    return " & ".join(f"{term}:*" for term in re.findall(r"[^\W_]+", query))
+
 
 class EventQuerySet(models.QuerySet):
     def search(self, query: str):
@@ -26,9 +45,21 @@ class EventQuerySet(models.QuerySet):
         if not query:
             return self
 
-        return self.filter(
-            Q(title__icontains=query) | Q(description__icontains=query),
-        )
+        tsquery = prefix_tsquery(query)
+        if not tsquery:
+            return self.none()
+
+        search_query = SearchQuery(tsquery, search_type="raw", config=SEARCH_CONFIG)
+        return self.annotate(
+            search_vector=EVENT_SEARCH_VECTOR,
+            search_rank=SearchRank(EVENT_SEARCH_VECTOR, search_query),
+        ).filter(search_vector=search_query)
+
+    def by_relevance(self):
+        """
+        Best full-text matches first; only meaningful after search().
+        """
+        return self.order_by("-search_rank", "start_date")
 
     def finished(self):
         today = timezone.now()
@@ -54,7 +85,7 @@ class EventQuerySet(models.QuerySet):
         ).order_by("-rsvp_count", "start_date")
 
     def by_start_date(self):
-        return self.order_by("start_date")
+        return self.order_by("start_date", "id")
 
     def annotate_rsvp(self, user):
         if not user.is_authenticated:
@@ -99,6 +130,8 @@ class Event(AbstractTimestampedModel):
         verbose_name=_("Season"),
         null=True,
         blank=True,
+        # Covered by event_season_start_idx
+        db_index=False,
     )
     title = models.CharField(_("Title"), max_length=255)
     description = models.CharField(_("Description"), blank=True, max_length=1024)
@@ -116,6 +149,22 @@ class Event(AbstractTimestampedModel):
         permissions = [
             ("manage_event", "Can manage event"),
         ]
+        indexes = [
+            # finished/unfinished/active and the list ordering
+            models.Index(fields=["start_date"], name="event_start_date_idx"),
+            models.Index(fields=["end_date"], name="event_end_date_idx"),
+            # Only open-ended events, for the end_date IS NULL branch
+            models.Index(
+                fields=["start_date"],
+                condition=Q(end_date__isnull=True),
+                name="event_open_ended_start_idx",
+            ),
+            models.Index(
+                fields=["season", "start_date"],
+                name="event_season_start_idx",
+            ),
+            GinIndex(EVENT_SEARCH_VECTOR, name="event_search_idx"),
+        ]
 
     def __str__(self):
         return self.title or f"Event {self.id}"
@@ -213,6 +262,28 @@ class Event(AbstractTimestampedModel):
 
         event_completed.send(sender=self.__class__, event=self)
 
+    def queue_completion(self) -> "EventCompletionJob":
+        """
+        Queue this event to be completed by a worker instead of
+        running scoring inside the current request.
+        """
+        if not self.is_finished:
+            msg = "Cannot complete an event that is not finished."
+            raise ValueError(msg)
+        if self.completion_jobs.filter(status=EventCompletionJob.SUCCEEDED).exists():
+            msg = "This event has already been completed."
+            raise ValueError(msg)
+
+        job = self.completion_jobs.pending().first()
+        if job is not None:
+            return job
+        try:
+            with transaction.atomic():
+                return EventCompletionJob.objects.create(event=self)
+        except IntegrityError:
+            # Another request queued it between our read and insert
+            return self.completion_jobs.pending().get()
+
 
 class ParticipantQuerySet(models.QuerySet):
     def with_membership_for_season(self, season):
@@ -321,6 +392,8 @@ class EventRSVP(AbstractTimestampedModel):
         Event,
         on_delete=models.CASCADE,
         related_name="rsvps",
+        # Covered by rsvp_event_status_idx
+        db_index=False,
     )
     user = models.ForeignKey(
         "users.User",
@@ -344,6 +417,9 @@ class EventRSVP(AbstractTimestampedModel):
     class Meta:
         verbose_name = _("Event RSVP")
         verbose_name_plural = _("Event RSVPs")
+        indexes = [
+            models.Index(fields=["event", "status"], name="rsvp_event_status_idx"),
+        ]
         constraints = [
             # One RSVP per user per event
             models.UniqueConstraint(
@@ -359,3 +435,73 @@ class EventRSVP(AbstractTimestampedModel):
     @property
     def is_guest(self) -> bool:
         return self.user is None
+
+
+class EventCompletionJobQuerySet(models.QuerySet):
+    def pending(self):
+        return self.filter(
+            status__in=[EventCompletionJob.QUEUED, EventCompletionJob.RUNNING],
+        )
+
+    def queued(self):
+        return self.filter(status=EventCompletionJob.QUEUED)
+
+    def claimable(self, stale_before):
+        """
+        Queued jobs, and running jobs started before ``stale_before`` whose
+        worker presumably died.
+        """
+        return self.filter(
+            models.Q(status=EventCompletionJob.QUEUED)
+            | models.Q(
+                status=EventCompletionJob.RUNNING,
+                started_at__lt=stale_before,
+            ),
+        )
+
+
+class EventCompletionJob(AbstractTimestampedModel):
+    objects = EventCompletionJobQuerySet.as_manager()
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (QUEUED, _("Queued")),
+        (RUNNING, _("Running")),
+        (SUCCEEDED, _("Succeeded")),
+        (FAILED, _("Failed")),
+    ]
+
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="completion_jobs",
+        verbose_name=_("Event"),
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=QUEUED,
+    )
+    started_at = models.DateTimeField(_("Started At"), null=True, blank=True)
+    finished_at = models.DateTimeField(_("Finished At"), null=True, blank=True)
+    error = models.TextField(_("Error"), blank=True)
+
+    class Meta:
+        verbose_name = _("Event Completion Job")
+        verbose_name_plural = _("Event Completion Jobs")
+        ordering = ["created_at"]
+        constraints = [
+            # Only one queued or running completion per event
+            models.UniqueConstraint(
+                fields=["event"],
+                condition=models.Q(status__in=["queued", "running"]),
+                name="unique_pending_completion_job",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Completion job {self.id} for Event {self.event_id} ({self.status})"
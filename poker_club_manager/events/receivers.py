@@ -0,0 +1,29 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from poker_club_manager.common.utils.fragments import bump_version
+
+from .models import Event, EventRSVP, Participant
+
+
+def _bump_on_commit(*scopes: str):
+    # Bumping before commit would let a concurrent request re-cache stale data
+    transaction.on_commit(partial(bump_version, *scopes))
+
+
+@receiver([post_save, post_delete], sender=Event)
+def invalidate_event_fragments(sender, instance, **kwargs):
+    _bump_on_commit("events", f"event:{instance.pk}")
+
+
+@receiver([post_save, post_delete], sender=EventRSVP)
+def invalidate_rsvp_fragments(sender, instance, **kwargs):
+    _bump_on_commit("rsvps", f"event:{instance.event_id}", f"user:{instance.user_id}")
+
+
+@receiver([post_save, post_delete], sender=Participant)
+def invalidate_participant_fragments(sender, instance, **kwargs):
+    _bump_on_commit(f"event:{instance.event_id}", f"user:{instance.user_id}")
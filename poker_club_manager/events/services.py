@@ -0,0 +1,309 @@
+import datetime
+import logging
+from collections import Counter
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from poker_club_manager.common.models import MemberStatistics, SeasonMembership
+from poker_club_manager.common.utils.fragments import bump_version
+
+from .models import Event, EventCompletionJob, EventRSVP, GuestParticipant, Participant
+
+User = get_user_model()
+
+CHECKED_IN = "checked_in"
+ALREADY_CHECKED_IN = "already_checked_in"
+NOT_FOUND = "not_found"
+
+logger = logging.getLogger(__name__)
+
+
+def claim_next_completion_job() -> EventCompletionJob | None:
+    """
+    Atomically move the oldest queued job to running. Rows locked by
+    another worker are skipped, so several workers can share the queue.
+    A worker keeps its job locked while running it, so a running job is
+    only claimed again once it is older than
+    EVENTS_COMPLETION_JOB_TIMEOUT_SECONDS and unlocked, i.e. its worker
+    died.
+    """
+    now = timezone.now()
+    stale_before = now - datetime.timedelta(
+        seconds=settings.EVENTS_COMPLETION_JOB_TIMEOUT_SECONDS,
+    )
+    with transaction.atomic():
+        job = (
+            EventCompletionJob.objects.claimable(stale_before)
+            .select_for_update(skip_locked=True)
+            .order_by("created_at")
+            .first()
+        )
+        if job is None:
+            return None
+        if job.status == EventCompletionJob.RUNNING:
+            logger.warning(
+                "Reclaiming completion job %s, running since %s",
+                job.id,
+                job.started_at,
+            )
+
+        job.status = EventCompletionJob.RUNNING
+        job.started_at = now
+        job.save(update_fields=["status", "started_at", "updated_at"])
+        return job
+
+
+def run_completion_job(job: EventCompletionJob) -> EventCompletionJob:
+    """
+    Run the event completion pipeline for a claimed job and record the outcome.
+    """
+    logger.info("Running completion job %s for event %s", job.id, job.event_id)
+    committed = False
+
+    def mark_committed():
+        nonlocal committed
+        committed = True
+
+    try:
+        with transaction.atomic():
+            # Hold the job row until the outcome commits; claimers skip
+            # locked rows, so a slow run is never picked up a second time
+            locked = _claimed(job).select_for_update(skip_locked=True)
+            if not locked.values_list("pk", flat=True):
+                logger.warning("Completion job %s was claimed elsewhere", job.id)
+                return job
+            # Registered first, so it runs before the pipeline's own hooks
+            transaction.on_commit(mark_committed)
+            job.event.complete_event()
+            _finish_job(job, EventCompletionJob.SUCCEEDED)
+    except Exception as e:
+        if committed:
+            # Scoring is in; only a post-commit hook (cache, Redis) failed
+            logger.exception("Completion job %s post-commit hook failed", job.id)
+        else:
+            logger.exception("Completion job %s failed", job.id)
+            _finish_job(job, EventCompletionJob.FAILED, str(e))
+    return job
+
+
+def _claimed(job: EventCompletionJob):
+    # The job row as long as it is still this claim's, not a reclaim's
+    return EventCompletionJob.objects.filter(
+        pk=job.pk,
+        status=EventCompletionJob.RUNNING,
+        started_at=job.started_at,
+    )
+
+
+def _finish_job(job: EventCompletionJob, status: str, error: str = ""):
+    now = timezone.now()
+    if not _claimed(job).update(
+        status=status,
+        error=error,
+        finished_at=now,
+        updated_at=now,
+    ):
+        logger.warning("Completion job %s was claimed elsewhere", job.id)
+        return
+    job.status = status
+    job.error = error
+    job.finished_at = now
+
+
+@transaction.atomic
+def bulk_check_in(
+    event: Event,
+    user_ids: list[int],
+    guests: list[dict],
+) -> dict[str, list[dict]]:
+    """
+    Check in many users and guests with a fixed number of statements,
+    however many rows there are: what ``add_user_participant`` and
+    ``add_guest_participant`` do per person, including season memberships
+    and marking RSVPs arrived. Returns an outcome per input row, in order.
+    """
+    # Participants have no unique (event, user) constraint, so concurrent
+    # batches are serialised on the event row before reading who is in
+    Event.objects.select_for_update().filter(pk=event.pk).values_list("pk").get()
+    now = timezone.now()
+
+    found = set(User.objects.filter(id__in=user_ids).values_list("id", flat=True))
+    checked_in = set(
+        event.participants.filter(user_id__in=found).values_list("user_id", flat=True),
+    )
+
+    user_results = []
+    new_user_ids = []
+    for user_id in user_ids:
+        if user_id not in found:
+            user_results.append({"user_id": user_id, "status": NOT_FOUND})
+            continue
+        if user_id in checked_in:
+            user_results.append({"user_id": user_id, "status": ALREADY_CHECKED_IN})
+            continue
+        checked_in.add(user_id)
+        new_user_ids.append(user_id)
+        user_results.append({"user_id": user_id, "status": CHECKED_IN})
+
+    if new_user_ids:
+        Participant.objects.bulk_create(
+            Participant(event=event, user_id=user_id) for user_id in new_user_ids
+        )
+        _create_memberships(event, new_user_ids)
+        # update() skips auto_now; conditional GETs rely on updated_at
+        event.rsvps.filter(user_id__in=new_user_ids).exclude(
+            status=EventRSVP.ARRIVED,
+        ).update(status=EventRSVP.ARRIVED, arrival_time=now, updated_at=now)
+
+    guest_results = _check_in_guests(event, guests)
+
+    # Bulk statements send no model signals; invalidate like the receivers
+    transaction.on_commit(
+        partial(
+            bump_version,
+            "rsvps",
+            f"event:{event.id}",
+            *(f"user:{user_id}" for user_id in new_user_ids),
+        ),
+    )
+    return {"users": user_results, "guests": guest_results}
+
+
+def _create_memberships(event: Event, user_ids: list[int]):
+    if event.season_id is None:
+        return
+
+    members = set(
+        SeasonMembership.objects.filter(
+            season_id=event.season_id,
+            user_id__in=user_ids,
+        ).values_list("user_id", flat=True),
+    )
+    created = SeasonMembership.objects.bulk_create(
+        SeasonMembership(season_id=event.season_id, user_id=user_id)
+        for user_id in user_ids
+        if user_id not in members
+    )
+    if created:
+        # bulk_create sends no post_save, so create what the receiver would
+        MemberStatistics.objects.bulk_create(
+            (MemberStatistics(membership=membership) for membership in created),
+            ignore_conflicts=True,
+        )
+
+        from poker_club_manager.points.services import (  # noqa: PLC0415
+            schedule_leaderboard_refresh,
+        )
+
+        schedule_leaderboard_refresh(
+            event.season_id,
+            {membership.id: membership.points for membership in created},
+        )
+
+
+def _check_in_guests(event: Event, guests: list[dict]) -> list[dict]:
+    if not guests:
+        return []
+
+    # A guest is the same guest only with the same name and email
+    keys = [(guest["name"], guest.get("email", "")) for guest in guests]
+    lookup = Q()
+    for name, email in set(keys):
+        lookup |= Q(name=name, email=email)
+    existing = {
+        (guest.name, guest.email): guest for guest in event.guests.filter(lookup)
+    }
+
+    rows = []
+    new_guests = []
+    for key in keys:
+        if key in existing:
+            rows.append((existing[key], ALREADY_CHECKED_IN))
+            continue
+        existing[key] = GuestParticipant(event=event, name=key[0], email=key[1])
+        new_guests.append(existing[key])
+        rows.append((existing[key], CHECKED_IN))
+
+    GuestParticipant.objects.bulk_create(new_guests)
+    return [
+        {"id": guest.id, "name": guest.name, "email": guest.email, "status": status}
+        for guest, status in rows
+    ]
+
+
+@transaction.atomic
+def apply_results(
+    event: Event,
+    participant_rows: list[dict],
+    guest_rows: list[dict],
+    *,
+    complete: bool = False,
+) -> EventCompletionJob | None:
+    """
+    Set ``final_position`` (and ``eliminations`` for members) from result
+    rows keyed by ``participant_id`` / ``guest_id``, in one bulk_update per
+    table. Rows not given keep their values; afterwards the positions of
+    all of the event's participants and guests must be 1..n without gaps
+    or ties. With ``complete`` the event's completion is queued once.
+    """
+    participants = {p.id: p for p in event.participants.select_for_update()}
+    guests = {g.id: g for g in event.guests.select_for_update()}
+
+    now = timezone.now()
+    errors = []
+    changed_participants = []
+    for row in participant_rows:
+        participant = participants.get(row["participant_id"])
+        if participant is None:
+            errors.append(f"Participant {row['participant_id']} is not in this event.")
+            continue
+        participant.final_position = row["final_position"]
+        if row.get("eliminations") is not None:
+            participant.eliminations = row["eliminations"]
+        participant.updated_at = now
+        changed_participants.append(participant)
+
+    changed_guests = []
+    for row in guest_rows:
+        guest = guests.get(row["guest_id"])
+        if guest is None:
+            errors.append(f"Guest {row['guest_id']} is not in this event.")
+            continue
+        guest.final_position = row["final_position"]
+        guest.updated_at = now
+        changed_guests.append(guest)
+
+    positions = [
+        player.final_position
+        for player in [*participants.values(), *guests.values()]
+        if player.final_position is not None
+    ]
+    expected = range(1, len(positions) + 1)
+    if sorted(positions) != list(expected):
+        counts = Counter(positions)
+        tied = sorted(position for position, count in counts.items() if count > 1)
+        missing = sorted(set(expected) - counts.keys())
+        errors.append(
+            "Final positions must be unique and contiguous from 1 "
+            f"(tied: {tied}, missing: {missing}).",
+        )
+    if errors:
+        raise ValueError(" ".join(errors))
+
+    # bulk_update skips auto_now, hence the explicit updated_at
+    Participant.objects.bulk_update(
+        changed_participants,
+        ["final_position", "eliminations", "updated_at"],
+    )
+    GuestParticipant.objects.bulk_update(
+        changed_guests,
+        ["final_position", "updated_at"],
+    )
+    transaction.on_commit(partial(bump_version, f"event:{event.id}"))
+
+    return event.queue_completion() if complete else None
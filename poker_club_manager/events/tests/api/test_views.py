@@ -0,0 +1,155 @@
+import datetime
+
+import pytest
+from django.contrib.auth.models import Permission
+from rest_framework.test import APIClient
+
+from poker_club_manager.common.models import MemberStatistics, SeasonMembership
+from poker_club_manager.events.models import EventRSVP, GuestParticipant
+from poker_club_manager.events.tests.factories import EventFactory, ParticipantFactory
+from poker_club_manager.users.models import User
+from poker_club_manager.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def api_client(user: User) -> APIClient:
+    user.user_permissions.add(Permission.objects.get(codename="manage_event"))
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def test_event_list_is_cursor_paginated(api_client: APIClient):
+    start = datetime.datetime(2025, 1, 1, 18, tzinfo=datetime.UTC)
+    events = [
+        EventFactory(start_date=start + datetime.timedelta(days=i)) for i in range(3)
+    ]
+
+    first = api_client.get("/api/events/", {"page_size": 2}).json()
+    second = api_client.get(first["next"]).json()
+
+    assert [e["id"] for e in first["results"]] == [events[0].id, events[1].id]
+    assert [e["id"] for e in second["results"]] == [events[2].id]
+    assert second["next"] is None
+    assert "count" not in first
+
+
+def test_event_list_sparse_fieldset(api_client: APIClient):
+    EventFactory()
+
+    response = api_client.get("/api/events/", {"fields": "id,title"})
+
+    assert set(response.json()["results"][0]) == {"id", "title"}
+
+
+def test_rsvp_list_avoids_per_row_user_queries(
+    api_client: APIClient,
+    django_assert_max_num_queries,
+):
+    event = EventFactory()
+    for user in UserFactory.create_batch(5):
+        EventRSVP.objects.create(event=event, user=user)
+
+    # Savepoint pair, two permission lookups and one RSVP query
+    with django_assert_max_num_queries(5):
+        response = api_client.get("/api/rsvps/", {"fields": "id,username"})
+
+    results = response.json()["results"]
+    assert len(results) == 5  # noqa: PLR2004
+    assert set(results[0]) == {"id", "username"}
+
+
+def test_bulk_check_in(api_client: APIClient, django_assert_max_num_queries):
+    event = EventFactory()
+    rsvped, walk_in, already = UserFactory.create_batch(3)
+    EventRSVP.objects.create(event=event, user=rsvped, status=EventRSVP.GOING)
+    ParticipantFactory(event=event, user=already)
+    GuestParticipant.objects.create(event=event, name="Sam", email="sam@example.com")
+
+    url = f"/api/events/{event.id}/bulk-check-in/"
+    payload = {
+        "user_ids": [rsvped.id, walk_in.id, already.id, 0],
+        "guests": [
+            {"name": "Sam", "email": "sam@example.com"},
+            {"name": "Sam", "email": "other@example.com"},
+            {"name": "Alex"},
+        ],
+    }
+    # Fixed however many rows: the event lock, lookups, inserts and the
+    # RSVP update
+    with django_assert_max_num_queries(17):
+        response = api_client.post(url, payload, format="json")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert [r["status"] for r in response.json()["users"]] == [
+        "checked_in",
+        "checked_in",
+        "already_checked_in",
+        "not_found",
+    ]
+    assert [r["status"] for r in response.json()["guests"]] == [
+        "already_checked_in",
+        "checked_in",
+        "checked_in",
+    ]
+    assert event.participants.count() == 3  # noqa: PLR2004
+    assert event.guests.count() == 3  # noqa: PLR2004
+    rsvp = EventRSVP.objects.get(event=event, user=rsvped)
+    assert rsvp.status == EventRSVP.ARRIVED
+    assert rsvp.arrival_time is not None
+    members = [rsvped, walk_in]
+    memberships = SeasonMembership.objects.filter(season=event.season, user__in=members)
+    assert memberships.count() == len(members)
+    statistics = MemberStatistics.objects.filter(membership__in=memberships)
+    assert statistics.count() == len(members)
+
+
+def test_bulk_check_in_requires_rows(api_client: APIClient):
+    event = EventFactory()
+
+    response = api_client.post(
+        f"/api/events/{event.id}/bulk-check-in/",
+        {},
+        format="json",
+    )
+
+    assert response.status_code == 400  # noqa: PLR2004
+
+
+def test_results(api_client: APIClient):
+    event = EventFactory()
+    first, second = ParticipantFactory.create_batch(2, event=event)
+
+    response = api_client.post(
+        f"/api/events/{event.id}/results/",
+        {
+            "participants": [
+                {"participant_id": first.id, "final_position": 2},
+                {"participant_id": second.id, "final_position": 1, "eliminations": 4},
+            ],
+        },
+        format="json",
+    )
+
+    assert response.status_code == 200  # noqa: PLR2004
+    second.refresh_from_db()
+    assert (second.final_position, second.eliminations) == (1, 4)
+
+
+def test_results_rejects_ties(api_client: APIClient):
+    event = EventFactory()
+    first, second = ParticipantFactory.create_batch(2, event=event)
+
+    response = api_client.post(
+        f"/api/events/{event.id}/results/",
+        {
+            "participants": [
+                {"participant_id": first.id, "final_position": 1},
+                {"participant_id": second.id, "final_position": 1},
+            ],
+        },
+        format="json",
+    )
+
+    assert response.status_code == 400  # noqa: PLR2004
+    assert "tied: [1]" in response.json()["error"]
@@ -0,0 +1,26 @@
+import datetime
+
+from factory import Sequence, SubFactory
+from factory.django import DjangoModelFactory
+
+from poker_club_manager.common.tests.factories import SeasonFactory
+from poker_club_manager.events.models import Event, Participant
+from poker_club_manager.users.tests.factories import UserFactory
+
+
+class EventFactory(DjangoModelFactory[Event]):
+    season = SubFactory(SeasonFactory)
+    title = Sequence(lambda n: f"Event {n}")
+    start_date = datetime.datetime(2025, 1, 1, 18, tzinfo=datetime.UTC)
+    end_date = datetime.datetime(2025, 1, 1, 23, tzinfo=datetime.UTC)
+
+    class Meta:
+        model = Event
+
+
+class ParticipantFactory(DjangoModelFactory[Participant]):
+    event = SubFactory(EventFactory)
+    user = SubFactory(UserFactory)
+
+    class Meta:
+        model = Participant
@@ -0,0 +1,42 @@
+import pytest
+from django.db import connection
+
+from poker_club_manager.events.filters import EventListFilter
+from poker_club_manager.events.models import Event, prefix_tsquery
+
+from .factories import EventFactory
+
+requires_postgres = pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="full-text search requires PostgreSQL",
+)
+
+
+def test_prefix_tsquery_requires_every_term():
+    assert prefix_tsquery("Spring  tour-nament!") == "Spring:* & tour:* & nament:*"
+
+
+def test_prefix_tsquery_drops_operators():
+    assert prefix_tsquery("&|!") == ""
+
+
+@requires_postgres
+def test_search_matches_word_prefixes(db):
+    match = EventFactory(title="Spring Tournament", description="")
+    EventFactory(title="Cash game", description="Weekly")
+
+    assert list(Event.objects.search("tourn")) == [match]
+
+
+@requires_postgres
+def test_search_ranks_title_matches_first(db):
+    in_description = EventFactory(title="Cash game", description="Bounty night")
+    in_title = EventFactory(title="Bounty special", description="")
+
+    events = EventListFilter(
+        search_query="bounty",
+        order="relevance",
+        include_finished=True,
+    ).apply()
+
+    assert list(events) == [in_title, in_description]
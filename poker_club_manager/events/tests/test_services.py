@@ -0,0 +1,301 @@
+import datetime
+import threading
+from unittest import mock
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.utils import timezone
+
+from poker_club_manager.events.forms import ResultsUploadForm
+from poker_club_manager.events.models import (
+    EventCompletionJob,
+    EventCompletionJobQuerySet,
+    GuestParticipant,
+)
+from poker_club_manager.events.services import (
+    apply_results,
+    claim_next_completion_job,
+    run_completion_job,
+)
+from poker_club_manager.events.tests.factories import EventFactory, ParticipantFactory
+
+
+def test_queue_completion_reuses_pending_job(db):
+    event = EventFactory(season=None)
+
+    job = event.queue_completion()
+
+    assert job.status == EventCompletionJob.QUEUED
+    assert event.queue_completion() == job
+
+
+def test_completion_job_runs_pipeline(db):
+    event = EventFactory(season=None)
+    event.queue_completion()
+
+    job = claim_next_completion_job()
+    assert job.status == EventCompletionJob.RUNNING
+    assert claim_next_completion_job() is None
+
+    with mock.patch("poker_club_manager.events.models.event_completed.send") as send:
+        run_completion_job(job)
+
+    send.assert_called_once()
+    job.refresh_from_db()
+    assert job.status == EventCompletionJob.SUCCEEDED
+    assert job.finished_at is not None
+
+
+def test_completion_job_records_failure(db):
+    event = EventFactory(season=None)
+    job = event.queue_completion()
+
+    with mock.patch(
+        "poker_club_manager.events.models.event_completed.send",
+        side_effect=ValueError("boom"),
+    ):
+        run_completion_job(claim_next_completion_job())
+
+    job.refresh_from_db()
+    assert job.status == EventCompletionJob.FAILED
+    assert job.error == "boom"
+
+
+def test_queue_completion_rejects_completed_event(db):
+    event = EventFactory(season=None)
+    EventCompletionJob.objects.create(
+        event=event,
+        status=EventCompletionJob.SUCCEEDED,
+    )
+
+    with pytest.raises(ValueError, match="already been completed"):
+        event.queue_completion()
+
+
+def test_queue_completion_refetches_job_queued_concurrently(db):
+    event = EventFactory(season=None)
+    existing = EventCompletionJob.objects.create(event=event)
+
+    # Simulate the other request inserting after our pending() read
+    with mock.patch.object(EventCompletionJobQuerySet, "first", return_value=None):
+        assert event.queue_completion() == existing
+
+
+def test_claim_reclaims_stale_running_job(db, settings):
+    settings.EVENTS_COMPLETION_JOB_TIMEOUT_SECONDS = 60
+    event = EventFactory(season=None)
+    job = EventCompletionJob.objects.create(
+        event=event,
+        status=EventCompletionJob.RUNNING,
+        started_at=timezone.now() - datetime.timedelta(seconds=30),
+    )
+    assert claim_next_completion_job() is None
+
+    EventCompletionJob.objects.filter(id=job.id).update(
+        started_at=timezone.now() - datetime.timedelta(minutes=5),
+    )
+    reclaimed = claim_next_completion_job()
+
+    assert reclaimed == job
+    assert reclaimed.started_at > timezone.now() - datetime.timedelta(seconds=5)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_claim_skips_stale_job_its_worker_still_holds(settings):
+    settings.EVENTS_COMPLETION_JOB_TIMEOUT_SECONDS = 60
+    job = EventCompletionJob.objects.create(
+        event=EventFactory(season=None),
+        status=EventCompletionJob.RUNNING,
+        started_at=timezone.now() - datetime.timedelta(minutes=5),
+    )
+    locked, release = threading.Event(), threading.Event()
+
+    def slow_worker():
+        # A live worker holds its job row for the whole run
+        with transaction.atomic():
+            list(EventCompletionJob.objects.select_for_update().filter(id=job.id))
+            locked.set()
+            release.wait(timeout=10)
+        connection.close()
+
+    worker = threading.Thread(target=slow_worker)
+    worker.start()
+    locked.wait(timeout=10)
+    try:
+        assert claim_next_completion_job() is None
+    finally:
+        release.set()
+        worker.join()
+
+    assert claim_next_completion_job() == job
+
+
+def test_completion_job_skips_run_reclaimed_elsewhere(db):
+    event = EventFactory(season=None)
+    event.queue_completion()
+    job = claim_next_completion_job()
+    EventCompletionJob.objects.filter(id=job.id).update(
+        started_at=job.started_at + datetime.timedelta(minutes=10),
+    )
+
+    with mock.patch("poker_club_manager.events.models.event_completed.send") as send:
+        run_completion_job(job)
+
+    send.assert_not_called()
+    job.refresh_from_db()
+    assert job.status == EventCompletionJob.RUNNING
+
+
+@pytest.mark.django_db(transaction=True)
+def test_completion_job_succeeds_when_post_commit_hook_fails():
+    event = EventFactory(season=None)
+    event.queue_completion()
+    job = claim_next_completion_job()
+
+    def complete_event():
+        transaction.on_commit(mock.Mock(side_effect=ConnectionError("redis")))
+
+    with mock.patch.object(
+        type(job.event),
+        "complete_event",
+        side_effect=complete_event,
+    ):
+        run_completion_job(job)
+
+    job.refresh_from_db()
+    assert job.status == EventCompletionJob.SUCCEEDED
+
+
+@pytest.fixture
+def field(db):
+    event = EventFactory(season=None)
+    first, second = ParticipantFactory.create_batch(2, event=event)
+    guest = GuestParticipant.objects.create(event=event, name="Sam")
+    return event, first, second, guest
+
+
+def test_apply_results(field, django_assert_num_queries):
+    event, first, second, guest = field
+
+    # Two locked reads, one bulk UPDATE per table and the savepoint pair
+    with django_assert_num_queries(6):
+        job = apply_results(
+            event,
+            [
+                {"participant_id": first.id, "final_position": 2, "eliminations": 1},
+                {"participant_id": second.id, "final_position": 1},
+            ],
+            [{"guest_id": guest.id, "final_position": 3}],
+        )
+
+    assert job is None
+    first.refresh_from_db()
+    guest.refresh_from_db()
+    assert (first.final_position, first.eliminations) == (2, 1)
+    assert guest.final_position == 3  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    "positions",
+    [(1, 1, 2), (1, 2, 4), (0, 1, 2)],
+)
+def test_apply_results_rejects_invalid_positions(field, positions):
+    event, first, second, guest = field
+
+    with pytest.raises(ValueError, match="unique and contiguous"):
+        apply_results(
+            event,
+            [
+                {"participant_id": first.id, "final_position": positions[0]},
+                {"participant_id": second.id, "final_position": positions[1]},
+            ],
+            [{"guest_id": guest.id, "final_position": positions[2]}],
+        )
+
+    first.refresh_from_db()
+    assert first.final_position is None
+
+
+def test_apply_results_rejects_other_events_participants(field):
+    event, _first, _, _ = field
+    outsider = ParticipantFactory()
+
+    with pytest.raises(ValueError, match="not in this event"):
+        apply_results(
+            event,
+            [{"participant_id": outsider.id, "final_position": 1}],
+            [],
+        )
+
+
+def test_apply_results_queues_completion(field):
+    event, first, second, guest = field
+
+    job = apply_results(
+        event,
+        [
+            {"participant_id": first.id, "final_position": 1},
+            {"participant_id": second.id, "final_position": 2},
+        ],
+        [{"guest_id": guest.id, "final_position": 3}],
+        complete=True,
+    )
+
+    assert job.status == EventCompletionJob.QUEUED
+
+
+def test_results_upload_form_resolves_csv_rows(field):
+    event, first, _second, guest = field
+    csv = (
+        "username,guest_name,final_position,eliminations\n"
+        f"{first.user.username},,1,3\n"
+        ",Sam,2,\n"
+    )
+
+    form = ResultsUploadForm(
+        {},
+        {"file": SimpleUploadedFile("results.csv", csv.encode())},
+        event=event,
+    )
+
+    assert form.is_valid(), form.errors
+    assert form.participant_rows == [
+        {"participant_id": first.id, "final_position": 1, "eliminations": 3},
+    ]
+    assert form.guest_rows == [{"guest_id": guest.id, "final_position": 2}]
+
+
+def test_results_upload_form_reports_unknown_players(field):
+    event, *_ = field
+    rows = b'[{"username": "nobody", "final_position": 1}, {"final_position": 2}]'
+
+    form = ResultsUploadForm(
+        {},
+        {"file": SimpleUploadedFile("results.json", rows)},
+        event=event,
+    )
+
+    assert not form.is_valid()
+    assert len(form.errors["file"]) == 2  # noqa: PLR2004
+
+
+def test_results_upload_form_rejects_out_of_range_counts(field):
+    event, first, second, _guest = field
+    csv = (
+        "username,final_position,eliminations\n"
+        f"{first.user.username},1,-1\n"
+        f"{second.user.username},0,\n"
+    )
+
+    form = ResultsUploadForm(
+        {},
+        {"file": SimpleUploadedFile("results.csv", csv.encode())},
+        event=event,
+    )
+
+    assert not form.is_valid()
+    assert form.errors["file"] == [
+        "Row 1: eliminations must be a number of 0 or more.",
+        "Row 2: final_position must be a number of 1 or more.",
+    ]
@@ -0,0 +1,78 @@
+import asyncio
+import csv
+
+import pytest
+from django.contrib.auth.models import Permission
+from django.contrib.messages import get_messages
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncClient
+from django.urls import reverse
+
+from poker_club_manager.events.models import EventRSVP, GuestParticipant
+from poker_club_manager.events.tests.factories import EventFactory, ParticipantFactory
+from poker_club_manager.users.models import User
+from poker_club_manager.users.tests.factories import UserFactory
+
+
+def _rows(client: AsyncClient, url: str) -> list[list[str]]:
+    async def download():
+        response = await client.get(url)
+        # An async stream, so ASGI sends it chunk by chunk
+        assert response.is_async
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    return list(csv.reader(asyncio.run(download()).decode().splitlines()))
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_roster_streams_manage_rows(user: User):
+    event = EventFactory()
+    ParticipantFactory(event=event, user__username="bravo", final_position=2)
+    ParticipantFactory(event=event, user__username="alpha", final_position=1)
+    GuestParticipant.objects.create(event=event, name="@Guest", final_position=3)
+    EventRSVP.objects.create(event=event, user=UserFactory(username="carol"))
+    EventRSVP.objects.create(
+        event=event,
+        user=UserFactory(),
+        status=EventRSVP.ARRIVED,
+    )
+    client = AsyncClient()
+    client.force_login(user)
+
+    def url(roster):
+        return reverse("events:export_roster", args=[event.id, roster])
+
+    forbidden = asyncio.run(client.get(url("participants")))
+    assert forbidden.status_code == 403  # noqa: PLR2004
+
+    user.user_permissions.add(Permission.objects.get(codename="manage_event"))
+
+    participants = _rows(client, url("participants"))
+    assert participants[0][0] == "username"
+    assert [(row[0], row[3]) for row in participants[1:]] == [
+        ("alpha", "1"),
+        ("bravo", "2"),
+    ]
+    assert _rows(client, url("guests"))[1:] == [["'@Guest", "", "3"]]
+    assert [row[0] for row in _rows(client, url("rsvps"))[1:]] == ["carol"]
+    assert asyncio.run(client.get(url("ledger"))).status_code == 404  # noqa: PLR2004
+
+
+def test_upload_results_reports_each_form_error(client, user: User):
+    event = EventFactory()
+    user.user_permissions.add(Permission.objects.get(codename="manage_event"))
+    client.force_login(user)
+    csv_file = SimpleUploadedFile(
+        "results.csv",
+        b"username,guest_name,final_position\nnobody,,1\n,,x\n",
+    )
+
+    response = client.post(
+        reverse("events:upload_results", args=[event.id]),
+        {"file": csv_file},
+    )
+
+    assert [str(m) for m in get_messages(response.wsgi_request)] == [
+        "Row 1: nobody is not checked in.",
+        "Row 2: final_position must be a number of 1 or more.",
+    ]
@@ -10,6 +10,16 @@ urlpatterns = [
     path("<int:event_id>/check-in", views.check_in, name="check_in"),
     path("create/", views.create_event, name="create"),
     path("<int:event_id>/manage/", views.manage_event, name="manage"),
+    path(
+        "<int:event_id>/manage/results/",
+        views.upload_results,
+        name="upload_results",
+    ),
+    path(
+        "<int:event_id>/manage/export/<slug:roster>.csv",
+        views.export_roster,
+        name="export_roster",
+    ),
 ]
 
 # Partials
@@ -1,24 +1,71 @@
 import logging
 from types import SimpleNamespace
 
+from django.contrib import messages
 from django.core.exceptions import PermissionDenied
-from django.core.paginator import Paginator
+from django.db import transaction
 from django.http import Http404, HttpRequest
-from django.shortcuts import get_object_or_404, redirect, render
+from django.shortcuts import aget_object_or_404, get_object_or_404, redirect, render
+from django.utils.decorators import method_decorator
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_http_methods
 from django.views.generic import DetailView
 
+from poker_club_manager.common.utils.asyncviews import aget_user, arender
+from poker_club_manager.common.utils.conditional import (
+    alatest_changes,
+    conditional_page,
+    current_minute,
+    last_modified,
+)
+from poker_club_manager.common.utils.csvstream import stream_csv
+from poker_club_manager.common.utils.fragments import (
+    arender_cached_fragment,
+    render_cached_fragment,
+)
+from poker_club_manager.common.utils.pagination import apaginate
 from poker_club_manager.common.utils.params import parse_int
 
 from .filters import EventListFilter
-from .forms import EventForm, GuestCheckInForm
-from .models import Event, EventRSVP
+from .forms import EventForm, GuestCheckInForm, ResultsUploadForm
+from .models import Event, EventRSVP, Participant
+from .services import apply_results
 
 logger = logging.getLogger(__name__)
 
 
-def list_events(request: HttpRequest):
+async def _event_list_validators(request: HttpRequest):
+    user_id = (await aget_user(request)).pk
+    # Popularity ordering depends on everyone's RSVPs, the cards only on ours
+    rsvps = (
+        EventRSVP.objects.all()
+        if request.GET.get("s") == "popular"
+        else EventRSVP.objects.filter(user_id=user_id)
+    )
+    changes = await alatest_changes(
+        Event.objects.all(),
+        rsvps,
+        Participant.objects.filter(user_id=user_id),
+    )
+    minute = current_minute()
+    return last_modified(changes, minute), (changes, user_id, minute)
+
+
+async def _event_detail_validators(request: HttpRequest, event_id: int):
+    user = await aget_user(request)
+    changes = await alatest_changes(
+        Event.objects.filter(pk=event_id),
+        EventRSVP.objects.filter(event_id=event_id),
+        Participant.objects.filter(event_id=event_id),
+    )
+    minute = current_minute()
+    return last_modified(changes, minute), (changes, user.pk, minute)
+
+
+@transaction.non_atomic_requests
+@conditional_page(_event_list_validators)
+async def list_events(request: HttpRequest):
+    user = await aget_user(request)
     default_filters = SimpleNamespace(
         {
             "order": "relevance",
@@ -35,15 +82,10 @@ def list_events(request: HttpRequest):
         default_filters.include_finished,
     )
 
-    events = (
-        EventListFilter(
-            search_query=search_query,
-            order=order,
-            include_finished=include_finished == "1",
-        )
-        .apply()
-        .annotate_rsvp(request.user)
-        .annotate_check_in(request.user)
+    event_filter = EventListFilter(
+        search_query=search_query,
+        order=order,
+        include_finished=include_finished == "1",
     )
 
     events_per_page = parse_int(
@@ -53,31 +95,39 @@ def list_events(request: HttpRequest):
         max_value=50,
     )
 
-    paginator = Paginator(events, events_per_page)
-    logger.info(
-        "Paginating events: %d per page, %d total pages",
-        events_per_page,
-        paginator.num_pages,
-    )
-
-    page = parse_int(
-        request.GET.get("p"),
-        default=1,
-        min_value=1,
-        max_value=paginator.num_pages,
-    )
-    page_events = paginator.get_page(page)
-
-    context = {"events": page_events, "page": page, "max_page": paginator.num_pages}
+    async def get_context():
+        events = event_filter.apply().annotate_rsvp(user).annotate_check_in(user)
+        page_events, page_context = await apaginate(
+            request,
+            events,
+            events_per_page,
+            keyset_ordering=event_filter.keyset_ordering,
+        )
+        logger.info(
+            "Paginating events: %d per page, %d total pages",
+            events_per_page,
+            page_context["max_page"],
+        )
+        return {"events": page_events, **page_context}
 
     if request.headers.get("HX-Request") == "true":
-        return render(request, "events/list.html#event-cards", context=context)
+        # Cards show the viewer's RSVP and check-in state
+        scopes = ["events", f"user:{user.pk}"]
+        if order == "popular":
+            scopes.append("rsvps")
+        return await arender_cached_fragment(
+            request,
+            "events/list.html#event-cards",
+            get_context,
+            scopes=scopes,
+            per_user=True,
+        )
 
-    return render(
+    return await arender(
         request,
         "events/list.html",
         context={
-            **context,
+            **await get_context(),
             "filters": SimpleNamespace(
                 {
                     "order": order,
@@ -91,6 +141,8 @@ def list_events(request: HttpRequest):
     )
 
 
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+@method_decorator(conditional_page(_event_detail_validators), name="get")
 class EventDetailView(DetailView):
     model = Event
     template_name = "events/detail.html"
@@ -105,6 +157,15 @@ class EventDetailView(DetailView):
             .annotate_rsvp(user)
         )
 
+    async def get(self, request, *args, **kwargs):
+        await aget_user(request)
+        self.object = await aget_object_or_404(
+            self.get_queryset(),
+            pk=self.kwargs[self.pk_url_kwarg],
+        )
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
+
 
 def check_into_first_active(request: HttpRequest):
     event = Event.objects.active().first()
@@ -185,7 +246,7 @@ def manage_event(request: HttpRequest, event_id: int):
         pk=event_id,
     )
 
-    if not request.user.has_perm("events.manage_event", event):
+    if not request.user.has_perm("events.manage_event"):
         raise PermissionDenied
 
     context = {
@@ -197,24 +258,113 @@ def manage_event(request: HttpRequest, event_id: int):
     return render(request, "events/manage.html", context=context)
 
 
+# Columns of each roster download, as (header, lookup) pairs
+ROSTER_COLUMNS = {
+    "participants": [
+        ("username", "user__username"),
+        ("name", "user__name"),
+        ("email", "user__email"),
+        ("final_position", "final_position"),
+        ("eliminations", "eliminations"),
+    ],
+    "guests": [
+        ("name", "name"),
+        ("email", "email"),
+        ("final_position", "final_position"),
+    ],
+    "rsvps": [
+        ("username", "user__username"),
+        ("name", "user__name"),
+        ("status", "status"),
+    ],
+}
+
+
+@transaction.non_atomic_requests
+def export_roster(request: HttpRequest, event_id: int, roster: str):
+    event = get_object_or_404(Event, pk=event_id)
+
+    if not request.user.has_perm("events.manage_event"):
+        raise PermissionDenied
+    if roster not in ROSTER_COLUMNS:
+        raise Http404
+
+    # The same rows manage_event lists
+    querysets = {
+        "participants": event.participants.order_by("user__username", "id"),
+        "guests": event.guests.order_by("name", "id"),
+        "rsvps": event.rsvps.unarrived().order_by("user__username", "id"),
+    }
+    headers, lookups = zip(*ROSTER_COLUMNS[roster], strict=True)
+    return stream_csv(
+        f"event-{event.id}-{roster}.csv",
+        list(headers),
+        querysets[roster].values_list(*lookups),
+    )
+
+
+@require_http_methods(["POST"])
+def upload_results(request: HttpRequest, event_id: int):
+    event = get_object_or_404(Event, pk=event_id)
+
+    if not request.user.has_perm("events.manage_event"):
+        raise PermissionDenied
+
+    form = ResultsUploadForm(request.POST, request.FILES, event=event)
+    if not form.is_valid():
+        for errors in form.errors.as_data().values():
+            for error in errors:
+                messages.error(request, "; ".join(error.messages))
+        return redirect("events:manage", event_id=event.id)
+
+    try:
+        job = apply_results(
+            event,
+            form.participant_rows,
+            form.guest_rows,
+            complete=form.cleaned_data["complete"],
+        )
+    except ValueError as e:
+        messages.error(request, str(e))
+    else:
+        messages.success(
+            request,
+            _("Results saved; completion queued.") if job else _("Results saved."),
+        )
+    return redirect("events:manage", event_id=event.id)
+
+
 @require_http_methods(["GET", "POST"])
 def rsvp_button(request: HttpRequest, event_id: int, rsvp_status=EventRSVP.GOING):
+    if request.method == "GET":
+        return render_cached_fragment(
+            request,
+            "events/partials/rsvp_button.html",
+            lambda: _rsvp_button_context(request, event_id),
+            scopes=[f"event:{event_id}", f"user:{request.user.pk}"],
+            per_user=True,
+        )
+
     event = get_object_or_404(Event.objects.annotate_rsvp(request.user), pk=event_id)
     rsvped = event.is_rsvped
 
-    if request.method == "POST":
-        if not request.user.is_authenticated:
-            raise PermissionDenied
+    if not request.user.is_authenticated:
+        raise PermissionDenied
 
-        if rsvped:
-            event.cancel_rsvp_user(request.user)
-            rsvped = False
-        else:
-            event.rsvp_user(request.user, rsvp_status)
-            rsvped = True
+    if rsvped:
+        event.cancel_rsvp_user(request.user)
+        rsvped = False
+    else:
+        event.rsvp_user(request.user, rsvp_status)
+        rsvped = True
 
     return render(
         request,
         "events/partials/rsvp_button.html",
         {"event": event, "rsvped": rsvped},
     )
+
+
+def _rsvp_button_context(request: HttpRequest, event_id: int):
+    event = get_object_or_404(Event.objects.annotate_rsvp(request.user), pk=event_id)
+    return {"event": event, "rsvped": event.is_rsvped}
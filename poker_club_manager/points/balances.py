@@ -0,0 +1,160 @@
+import datetime
+
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from poker_club_manager.common.models import Season, SeasonMembership
+from poker_club_manager.events.models import Event
+
+from .models import BalanceCheckpoint, PointsLedger
+
+
+def _ledger_cutoff(
+    event: Event | None = None,
+    at: datetime.datetime | None = None,
+) -> tuple[int | None, datetime.datetime | None]:
+    """
+    Resolve "as of event X / date D" into the last ledger id and timestamp
+    that should be counted. An event with no ledger rows falls back to its
+    end date.
+    """
+    if event is None:
+        return None, at
+
+    last_ledger_id = PointsLedger.objects.filter(event=event).aggregate(
+        last=Max("id"),
+    )["last"]
+    if last_ledger_id is None:
+        return None, event.end_date or event.start_date
+    return last_ledger_id, at
+
+
+def annotate_points_as_of(
+    memberships,
+    *,
+    last_ledger_id: int | None = None,
+    at: datetime.datetime | None = None,
+):
+    """
+    Annotate memberships with ``points_as_of``: their nearest checkpoint
+    plus the ledger rows written after it, up to the cutoff.
+    """
+    checkpoints = BalanceCheckpoint.objects.filter(membership=OuterRef("pk"))
+    ledger = PointsLedger.objects.filter(
+        membership=OuterRef("pk"),
+        id__gt=OuterRef("checkpoint_ledger_id"),
+    )
+    if last_ledger_id is not None:
+        checkpoints = checkpoints.filter(ledger_id__lte=last_ledger_id)
+        ledger = ledger.filter(id__lte=last_ledger_id)
+    if at is not None:
+        checkpoints = checkpoints.filter(as_of__lte=at)
+        ledger = ledger.filter(created_at__lte=at)
+
+    checkpoints = checkpoints.order_by("-ledger_id")
+    tail = ledger.order_by().values("membership")
+
+    return memberships.annotate(
+        checkpoint_ledger_id=Coalesce(
+            Subquery(checkpoints.values("ledger_id")[:1]),
+            Value(0),
+        ),
+        checkpoint_points=Coalesce(
+            Subquery(checkpoints.values("points")[:1]),
+            Value(0),
+        ),
+    ).annotate(
+        points_as_of=F("checkpoint_points")
+        + Coalesce(
+            Subquery(
+                tail.annotate(total=Sum("points_delta")).values("total"),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        ),
+        ledger_tail=Coalesce(
+            Subquery(
+                tail.annotate(total=Count("id")).values("total"),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        ),
+        last_ledger_id=Subquery(
+            ledger.order_by("-id").values("id")[:1],
+        ),
+        last_ledger_at=Subquery(
+            ledger.order_by("-id").values("created_at")[:1],
+        ),
+    )
+
+
+def balance_as_of(
+    membership: SeasonMembership,
+    *,
+    event: Event | None = None,
+    at: datetime.datetime | None = None,
+) -> int:
+    """
+    A membership's balance as of an event or a point in time.
+    """
+    last_ledger_id, at = _ledger_cutoff(event, at)
+    return (
+        annotate_points_as_of(
+            SeasonMembership.objects.filter(pk=membership.pk),
+            last_ledger_id=last_ledger_id,
+            at=at,
+        )
+        .values_list("points_as_of", flat=True)
+        .get()
+    )
+
+
+def standings_as_of(
+    season: Season,
+    *,
+    event: Event | None = None,
+    at: datetime.datetime | None = None,
+):
+    """
+    Season memberships annotated with ``points_as_of`` and ordered by it.
+    """
+    last_ledger_id, at = _ledger_cutoff(event, at)
+    return annotate_points_as_of(
+        SeasonMembership.objects.filter(season=season).select_related("user"),
+        last_ledger_id=last_ledger_id,
+        at=at,
+    ).order_by("-points_as_of", "id")
+
+
+def create_checkpoints(season: Season | None = None, *, min_tail: int = 1) -> int:
+    """
+    Checkpoint every membership with at least ``min_tail`` ledger rows since
+    its last checkpoint. Returns the number of checkpoints written.
+    """
+    last_ledger_id = PointsLedger.objects.aggregate(last=Max("id"))["last"]
+    if last_ledger_id is None:
+        return 0
+
+    memberships = SeasonMembership.objects.all()
+    if season is not None:
+        memberships = memberships.filter(season=season)
+
+    pending = (
+        annotate_points_as_of(memberships, last_ledger_id=last_ledger_id)
+        .filter(ledger_tail__gte=max(1, min_tail))
+        .values_list("id", "last_ledger_id", "last_ledger_at", "points_as_of")
+    )
+    checkpoints = BalanceCheckpoint.objects.bulk_create(
+        [
+            BalanceCheckpoint(
+                membership_id=membership_id,
+                ledger_id=ledger_id,
+                as_of=as_of,
+                points=points,
+            )
+            for membership_id, ledger_id, as_of, points in pending
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    return len(checkpoints)
@@ -1,5 +1,5 @@
-from poker_club_manager.points.scoring.base import DecayStrategy
-from poker_club_manager.points.scoring.standard import GlobalAttendanceDecayStrategy
+from .base import DecayStrategy
+from .standard import GlobalAttendanceDecayStrategy
 
 DEFAULT_STRATEGY = GlobalAttendanceDecayStrategy
 
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from poker_club_manager.points.models import PointsLedger
+from poker_club_manager.points.services import apply_scoring
+
 if TYPE_CHECKING:
     from poker_club_manager.events.models import Event
 
@@ -14,3 +17,23 @@ class DecayStrategy(ABC):
         Apply points for this event.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def calculate_balances(
+        self,
+        total_participants: int,
+        balances: dict[int, int],
+    ) -> dict[int, int]:
+        """
+        Calculate decay deltas from in-memory balances keyed by membership id.
+        """
+        raise NotImplementedError
+
+    def apply(self, event: "Event", reason: str) -> int:
+        """
+        Calculate and persist decay for this event, returning the number
+        of memberships affected. Strategies that can express their decay
+        in SQL should override this to avoid loading memberships.
+        """
+        deltas = self.calculate(event)
+        return len(apply_scoring(event, deltas, reason, kind=PointsLedger.DECAY))
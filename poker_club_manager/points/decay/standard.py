@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from poker_club_manager.points.services import apply_decay
+
 from .base import DecayStrategy
 
 if TYPE_CHECKING:
@@ -9,26 +11,47 @@ if TYPE_CHECKING:
 class GlobalAttendanceDecayStrategy(DecayStrategy):
     key = "global_attendance"
 
+    # After 100 points, each player is treated as the same
+    POINTS_CAP = 100
+
+    def decay_rate(self, total_participants: int) -> float:
+        """
+        The more participants in the event, the higher the decay.
+        """
+        return min(0.05, total_participants / 1000)  # Max 5% decay
+
     def calculate_decay(self, total_participants: int, points: int) -> int:
         """
         Decay points based on global attendance.
-        The more participants in the event, the higher the decay.
         """
-        decay_rate = min(0.05, total_participants / 1000)  # Max 5% decay
-        return round(points * decay_rate)
+        return round(points * self.decay_rate(total_participants))
 
     def calculate(self, event: "Event") -> dict[int, int]:
+        balances = dict(
+            event.season.memberships.filter(points__gt=0).values_list("id", "points"),
+        )
+        return self.calculate_balances(event.get_total_participants(), balances)
+
+    def calculate_balances(
+        self,
+        total_participants: int,
+        balances: dict[int, int],
+    ) -> dict[int, int]:
         deltas = {}
-
-        memberships = event.season.memberships.filter(points__gt=0)
-
-        # After 100 points, each player is treated as the same
-        for m in memberships:
-            clamped_points = min(100, max(0, m.points))
-            decayed_points = self.calculate_decay(
-                event.total_participants,
+        for membership_id, points in balances.items():
+            if points <= 0:
+                continue
+            clamped_points = min(self.POINTS_CAP, points)
+            deltas[membership_id] = -self.calculate_decay(
+                total_participants,
                 clamped_points,
             )
-            deltas[m.id] = -decayed_points
-
         return deltas
+
+    def apply(self, event: "Event", reason: str) -> int:
+        return apply_decay(
+            event,
+            rate=self.decay_rate(event.get_total_participants()),
+            cap=self.POINTS_CAP,
+            reason=reason,
+        )
@@ -0,0 +1,214 @@
+import io
+import itertools
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.db.models import QuerySet
+
+from poker_club_manager.common.models import Season, SeasonMembership
+from poker_club_manager.events.models import EventRSVP, Participant
+
+from .models import PointsLedger
+
+EXPORT_CHUNK_SIZE = 5000
+
+PARQUET = "parquet"
+ARROW = "arrow"
+
+EXTENSIONS = {
+    PARQUET: "parquet",
+    ARROW: "arrow",
+}
+
+CONTENT_TYPES = {
+    PARQUET: "application/vnd.apache.parquet",
+    ARROW: "application/vnd.apache.arrow.file",
+}
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    """
+    One season table: its columns as ``(name, lookup, type)`` triples,
+    where type is one of ``int``, ``str`` or ``datetime``.
+    """
+
+    key: str
+    columns: tuple[tuple[str, str, str], ...]
+    get_queryset: Callable[[Season], QuerySet]
+
+    def schema(self, pa):
+        types = {
+            "int": pa.int64(),
+            "str": pa.string(),
+            "datetime": pa.timestamp("us", tz="UTC"),
+        }
+        return pa.schema([(name, types[kind]) for name, _, kind in self.columns])
+
+    def rows(self, season: Season, chunk_size: int) -> Iterator[tuple]:
+        # values_list rows off a server-side cursor: no model instances
+        # and never more than one chunk in memory
+        return (
+            self.get_queryset(season)
+            .order_by("id")
+            .values_list(*(lookup for _, lookup, _ in self.columns))
+            .iterator(chunk_size=chunk_size)
+        )
+
+
+EXPORT_TABLES = {
+    table.key: table
+    for table in (
+        ExportTable(
+            "ledger",
+            (
+                ("id", "id", "int"),
+                ("membership_id", "membership_id", "int"),
+                ("user_id", "membership__user_id", "int"),
+                ("event_id", "event_id", "int"),
+                ("kind", "kind", "str"),
+                ("points_delta", "points_delta", "int"),
+                ("reason", "reason", "str"),
+                ("created_at", "created_at", "datetime"),
+            ),
+            lambda season: PointsLedger.objects.filter(membership__season=season),
+        ),
+        ExportTable(
+            "results",
+            (
+                ("id", "id", "int"),
+                ("event_id", "event_id", "int"),
+                ("user_id", "user_id", "int"),
+                ("final_position", "final_position", "int"),
+                ("eliminations", "eliminations", "int"),
+                ("event_start_date", "event__start_date", "datetime"),
+                ("event_end_date", "event__end_date", "datetime"),
+            ),
+            lambda season: Participant.objects.filter(event__season=season),
+        ),
+        ExportTable(
+            "rsvps",
+            (
+                ("id", "id", "int"),
+                ("event_id", "event_id", "int"),
+                ("user_id", "user_id", "int"),
+                ("status", "status", "str"),
+                ("arrival_time", "arrival_time", "datetime"),
+                ("created_at", "created_at", "datetime"),
+            ),
+            lambda season: EventRSVP.objects.filter(event__season=season),
+        ),
+        ExportTable(
+            "memberships",
+            (
+                ("id", "id", "int"),
+                ("user_id", "user_id", "int"),
+                ("points", "points", "int"),
+                ("created_at", "created_at", "datetime"),
+            ),
+            lambda season: SeasonMembership.objects.filter(season=season),
+        ),
+    )
+}
+
+
+def _pyarrow():
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.parquet  # noqa: PLC0415
+
+    return pa
+
+
+def _open_writer(pa, file_format: str, sink, schema):
+    if file_format == PARQUET:
+        return pa.parquet.ParquetWriter(sink, schema)
+    if file_format == ARROW:
+        return pa.ipc.new_file(sink, schema)
+    msg = f"Unknown export format: {file_format}"
+    raise ValueError(msg)
+
+
+def _write_batches(
+    table: ExportTable,
+    season: Season,
+    sink,
+    file_format: str,
+    chunk_size: int,
+) -> Iterator[int]:
+    """
+    Write the table to ``sink`` one record batch (a Parquet row group) per
+    chunk, yielding the number of rows after each one.
+    """
+    pa = _pyarrow()
+    schema = table.schema(pa)
+    with _open_writer(pa, file_format, sink, schema) as writer:
+        rows = table.rows(season, chunk_size)
+        for chunk in itertools.batched(rows, chunk_size, strict=False):
+            columns = zip(*chunk, strict=True)
+            writer.write_batch(
+                pa.record_batch(
+                    [
+                        pa.array(column, type=field.type)
+                        for column, field in zip(columns, schema, strict=True)
+                    ],
+                    schema=schema,
+                ),
+            )
+            yield len(chunk)
+
+
+def write_table(
+    table: ExportTable,
+    season: Season,
+    path: Path,
+    *,
+    file_format: str = PARQUET,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> int:
+    """
+    Export one table of ``season`` to the file at ``path``; returns the
+    number of rows written.
+    """
+    with path.open("wb") as sink:
+        return sum(_write_batches(table, season, sink, file_format, chunk_size))
+
+
+class _ChunkSink(io.RawIOBase):
+    # Collects what the writer emits until the response takes it
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_table(
+    table: ExportTable,
+    season: Season,
+    *,
+    file_format: str = PARQUET,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Export one table of ``season`` as an iterator of bytes, for a
+    StreamingHttpResponse.
+    """
+    sink = _ChunkSink()
+    for _ in _write_batches(table, season, sink, file_format, chunk_size):
+        yield sink.drain()
+    yield sink.drain()
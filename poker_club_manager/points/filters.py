@@ -1,13 +1,16 @@
 from dataclasses import dataclass
 
-from poker_club_manager.common.models import Season, SeasonMembership
+from poker_club_manager.common.models import Season
+
+from .leaderboards import DatabaseLeaderboard, SeasonStandings, get_leaderboard_backend
+from .models import LeaderboardEntry
 
 
 @dataclass(frozen=True)
 class SeasonMemberListFilter:
     """
     Applies list-time filtering and ordering
-    to Event querysets based on user intent.
+    to materialized leaderboard entries based on user intent.
     """
 
     search_query: str | None = None
@@ -17,15 +20,37 @@ class SeasonMemberListFilter:
         """
         Entry point used by views.
         """
+        if season and self.keyset_ordering is None:
+            return SeasonStandings(get_leaderboard_backend(), season.id)
+        return self.entries(season)
+
+    def entries(self, season: Season):
+        """
+        The filtered, ordered materialized entries, whichever backend
+        serves the standings.
+        """
         if season:
-            qs = SeasonMembership.objects.filter(season=season)
+            qs = LeaderboardEntry.objects.filter(season=season)
         else:
-            qs = SeasonMembership.objects.all()
+            qs = LeaderboardEntry.objects.all()
 
         if self.search_query:
             qs = qs.search(self.search_query)
 
         return self._apply_order(qs)
 
+    @property
+    def keyset_ordering(self) -> tuple[str, ...] | None:
+        """
+        The unique ordering to page by cursor. Entries are paged by cursor
+        unless unfiltered standings are served by a non-database backend.
+        """
+        if not self.search_query and not isinstance(
+            get_leaderboard_backend(),
+            DatabaseLeaderboard,
+        ):
+            return None
+        return ("rank", "membership_id")
+
     def _apply_order(self, qs):
-        return qs.order_by("-points")
+        return qs.ranked()
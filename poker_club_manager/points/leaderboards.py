@@ -0,0 +1,265 @@
+import contextlib
+import functools
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from poker_club_manager.common.models import SeasonMembership
+
+from .models import LeaderboardEntry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LeaderboardRow:
+    membership_id: int
+    rank: int
+    points: int
+    display_name: str
+
+
+class LeaderboardBackend(ABC):
+    """
+    Serves ranked standings for a season and is kept in sync with
+    SeasonMembership.points after scoring commits. Every backend uses
+    competition ranks (1, 2, 2, 4), like the materialized table.
+    """
+
+    key: str
+
+    @abstractmethod
+    def count(self, season_id: int) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def page(self, season_id: int, start: int, stop: int) -> list[LeaderboardRow]:
+        """
+        Rows ranked ``start`` (inclusive) to ``stop`` (exclusive), best first.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def rank(self, season_id: int, membership_id: int) -> int | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def record(self, season_id: int, deltas: dict[int, int]):
+        """
+        Mirror committed point deltas (keyed by membership id).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def rebuild(self, season_id: int):
+        """
+        Resynchronise the season from SeasonMembership.points.
+        """
+        raise NotImplementedError
+
+    def top(self, season_id: int, n: int) -> list[LeaderboardRow]:
+        return self.page(season_id, 0, n)
+
+
+class DatabaseLeaderboard(LeaderboardBackend):
+    """
+    Reads the materialized LeaderboardEntry table.
+    """
+
+    key = "database"
+
+    def count(self, season_id):
+        return LeaderboardEntry.objects.filter(season_id=season_id).count()
+
+    def page(self, season_id, start, stop):
+        entries = LeaderboardEntry.objects.filter(season_id=season_id).ranked()
+        return [
+            LeaderboardRow(e.membership_id, e.rank, e.points, e.display_name)
+            for e in entries[start:stop]
+        ]
+
+    def rank(self, season_id, membership_id):
+        return (
+            LeaderboardEntry.objects.filter(
+                season_id=season_id,
+                membership_id=membership_id,
+            )
+            .values_list("rank", flat=True)
+            .first()
+        )
+
+    def record(self, season_id, deltas):
+        # The materialized table is refreshed by services.refresh_leaderboard
+        pass
+
+    def rebuild(self, season_id):
+        from .services import refresh_leaderboard  # noqa: PLC0415
+
+        refresh_leaderboard(season_id)
+
+
+class RedisLeaderboard(LeaderboardBackend):
+    """
+    Mirrors balances into one sorted set per season so page, rank and
+    top-N lookups are O(log N).
+    """
+
+    key = "redis"
+
+    KEY_PREFIX = "points:leaderboard"
+    REBUILD_CHUNK_SIZE = 5000
+
+    def __init__(self, client=None):
+        self.client = client if client is not None else _redis_client()
+
+    def season_key(self, season_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{season_id}"
+
+    def count(self, season_id):
+        return self.client.zcard(self.season_key(season_id))
+
+    def page(self, season_id, start, stop):
+        if stop <= start:
+            return []
+
+        key = self.season_key(season_id)
+        scores = self.client.zrevrange(key, start, stop - 1, withscores=True)
+        if not scores:
+            return []
+
+        names = _display_names([int(member) for member, _ in scores])
+
+        rows = []
+        previous_score, previous_rank = None, None
+        for position, (member, score) in enumerate(scores, start=start + 1):
+            if previous_score is None:
+                rank = self.client.zcount(key, f"({score}", "+inf") + 1
+            elif score == previous_score:
+                rank = previous_rank
+            else:
+                rank = position
+            membership_id = int(member)
+            rows.append(
+                LeaderboardRow(
+                    membership_id,
+                    rank,
+                    int(score),
+                    names.get(membership_id, ""),
+                ),
+            )
+            previous_score, previous_rank = score, rank
+        return rows
+
+    def rank(self, season_id, membership_id):
+        key = self.season_key(season_id)
+        score = self.client.zscore(key, membership_id)
+        if score is None:
+            return None
+        return self.client.zcount(key, f"({score}", "+inf") + 1
+
+    def record(self, season_id, deltas):
+        if not deltas:
+            return
+
+        import redis  # noqa: PLC0415
+
+        key = self.season_key(season_id)
+        try:
+            if not self.client.exists(key):
+                # Incrementing a set that was never built (or was evicted)
+                # would leave only these members in it. The balances are
+                # committed by now, so the rebuild already includes deltas.
+                self.rebuild(season_id)
+                return
+            with self.client.pipeline(transaction=True) as pipe:
+                for membership_id, delta in deltas.items():
+                    pipe.zincrby(key, delta, membership_id)
+                pipe.execute()
+        except redis.RedisError:
+            logger.exception("Could not record leaderboard deltas for %s", key)
+            # Drop the now stale set so the next record rebuilds it
+            with contextlib.suppress(redis.RedisError):
+                self.client.delete(key)
+
+    def rebuild(self, season_id):
+        key = self.season_key(season_id)
+        staging_key = f"{key}:rebuild"
+        balances = (
+            SeasonMembership.objects.filter(season_id=season_id)
+            .values_list("id", "points")
+            .iterator(chunk_size=self.REBUILD_CHUNK_SIZE)
+        )
+
+        self.client.delete(staging_key)
+        chunk = {}
+        for membership_id, points in balances:
+            chunk[membership_id] = points
+            if len(chunk) >= self.REBUILD_CHUNK_SIZE:
+                self.client.zadd(staging_key, chunk)
+                chunk = {}
+        if chunk:
+            self.client.zadd(staging_key, chunk)
+
+        # Swap the rebuilt set in atomically
+        if self.client.exists(staging_key):
+            self.client.rename(staging_key, key)
+        else:
+            self.client.delete(key)
+
+
+class SeasonStandings:
+    """
+    Lazily sliced standings for one season, usable with Django's Paginator.
+    """
+
+    def __init__(self, backend: LeaderboardBackend, season_id: int):
+        self.backend = backend
+        self.season_id = season_id
+
+    def count(self) -> int:
+        return self.backend.count(self.season_id)
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.backend.page(
+                self.season_id,
+                index.start or 0,
+                index.stop if index.stop is not None else self.count(),
+            )
+        rows = self.backend.page(self.season_id, index, index + 1)
+        if not rows:
+            raise IndexError(index)
+        return rows[0]
+
+
+@functools.cache
+def _redis_client():
+    import redis  # noqa: PLC0415
+
+    return redis.Redis.from_url(settings.REDIS_URL)
+
+
+def _display_names(membership_ids: list[int]) -> dict[int, str]:
+    return {
+        membership_id: name or username
+        for membership_id, name, username in SeasonMembership.objects.filter(
+            id__in=membership_ids,
+        ).values_list("id", "user__name", "user__username")
+    }
+
+
+DEFAULT_BACKEND = DatabaseLeaderboard
+
+BACKEND_MAP = {
+    DatabaseLeaderboard.key: DatabaseLeaderboard,
+    RedisLeaderboard.key: RedisLeaderboard,
+}
+
+
+def get_leaderboard_backend() -> LeaderboardBackend:
+    return BACKEND_MAP.get(settings.POINTS_LEADERBOARD_BACKEND, DEFAULT_BACKEND)()
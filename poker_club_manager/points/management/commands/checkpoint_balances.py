@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from poker_club_manager.common.models import Season
+from poker_club_manager.points.balances import create_checkpoints
+
+
+class Command(BaseCommand):
+    help = "Write ledger-derived balance checkpoints for every membership."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--season",
+            type=int,
+            default=None,
+            help="Only checkpoint memberships of this season id.",
+        )
+        parser.add_argument(
+            "--min-tail",
+            type=int,
+            default=1,
+            help="Only checkpoint memberships with this many new ledger rows.",
+        )
+
+    def handle(self, *args, **options):
+        season = (
+            Season.objects.get(id=options["season"])
+            if options["season"] is not None
+            else None
+        )
+        written = create_checkpoints(season, min_tail=options["min_tail"])
+        self.stdout.write(f"Wrote {written} balance checkpoints")
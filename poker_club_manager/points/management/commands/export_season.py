@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from poker_club_manager.common.models import Season
+from poker_club_manager.points.exports import (
+    EXPORT_CHUNK_SIZE,
+    EXPORT_TABLES,
+    EXTENSIONS,
+    PARQUET,
+    write_table,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Export a season's ledger, results, RSVPs and memberships to Parquet "
+        "or Arrow IPC files, streaming each table in chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("season", type=int, help="Season id to export.")
+        parser.add_argument(
+            "--format",
+            choices=sorted(EXTENSIONS),
+            default=PARQUET,
+        )
+        parser.add_argument(
+            "--table",
+            action="append",
+            choices=sorted(EXPORT_TABLES),
+            help="Only export these tables (repeatable); defaults to all.",
+        )
+        parser.add_argument("--output-dir", type=Path, default=Path())
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        season = Season.objects.filter(id=options["season"]).first()
+        if season is None:
+            msg = f"Season {options['season']} does not exist"
+            raise CommandError(msg)
+
+        output_dir = options["output_dir"]
+        output_dir.mkdir(parents=True, exist_ok=True)
+        extension = EXTENSIONS[options["format"]]
+
+        for key in options["table"] or EXPORT_TABLES:
+            path = output_dir / f"season-{season.id}-{key}.{extension}"
+            written = write_table(
+                EXPORT_TABLES[key],
+                season,
+                path,
+                file_format=options["format"],
+                chunk_size=options["chunk_size"],
+            )
+            self.stdout.write(f"Wrote {written} rows to {path}")
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from poker_club_manager.common.models import SeasonMembership
+from poker_club_manager.points.statistics import refresh_statistics
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute member statistics from participations and the points "
+        "ledger for one or every season, repairing any drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--season",
+            type=int,
+            default=None,
+            help="Only rebuild this season id.",
+        )
+
+    def handle(self, *args, **options):
+        memberships = SeasonMembership.objects.all()
+        if options["season"] is not None:
+            memberships = memberships.filter(season_id=options["season"])
+
+        written = refresh_statistics(memberships)
+        self.stdout.write(f"Rebuilt statistics for {written} memberships")
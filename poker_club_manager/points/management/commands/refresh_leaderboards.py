@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from poker_club_manager.common.models import Season
+from poker_club_manager.points.leaderboards import (
+    DatabaseLeaderboard,
+    get_leaderboard_backend,
+)
+from poker_club_manager.points.services import refresh_leaderboard
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the materialized leaderboard and the configured leaderboard "
+        "backend for one or every season, repairing any drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--season",
+            type=int,
+            default=None,
+            help="Only refresh this season id.",
+        )
+
+    def handle(self, *args, **options):
+        written = refresh_leaderboard(options["season"])
+        self.stdout.write(f"Refreshed {written} leaderboard entries")
+
+        backend = get_leaderboard_backend()
+        if isinstance(backend, DatabaseLeaderboard):
+            return
+
+        season_ids = (
+            [options["season"]]
+            if options["season"] is not None
+            else Season.objects.values_list("id", flat=True)
+        )
+        for season_id in season_ids:
+            backend.rebuild(season_id)
+        self.stdout.write(f"Rebuilt {backend.key} leaderboard backend")
@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from poker_club_manager.common.models import Season
+from poker_club_manager.points.decay import DECAY_STRATEGY_MAP, get_decay_strategy
+from poker_club_manager.points.replay import replay_season
+from poker_club_manager.points.scoring import STRATEGY_MAP, get_scoring_strategy
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute a season's ledger and balances by replaying every completed "
+        "event in order with the chosen scoring and decay strategies."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("season_id", type=int)
+        parser.add_argument(
+            "--scoring",
+            choices=sorted(STRATEGY_MAP),
+            default=None,
+            help="Scoring strategy for every event (defaults to each event's own).",
+        )
+        parser.add_argument(
+            "--decay",
+            choices=sorted(DECAY_STRATEGY_MAP),
+            default=None,
+            help="Decay strategy (defaults to POINTS_DEFAULT_DECAY_STRATEGY).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only print the balance changes without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        season = Season.objects.filter(id=options["season_id"]).first()
+        if season is None:
+            msg = f"Season {options['season_id']} does not exist."
+            raise CommandError(msg)
+
+        decay_key = options["decay"] or settings.POINTS_DEFAULT_DECAY_STRATEGY
+        result = replay_season(
+            season,
+            get_decay_strategy(decay_key),
+            get_scoring_strategy(options["scoring"]) if options["scoring"] else None,
+            dry_run=options["dry_run"],
+        )
+
+        for membership_id, (before, after) in sorted(result.diff.items()):
+            self.stdout.write(
+                f"{membership_id}: {before} -> {after} ({after - before:+d})",
+            )
+
+        verb = "Would write" if options["dry_run"] else "Wrote"
+        self.stdout.write(
+            f"Replayed {result.events_replayed} events. {verb} "
+            f"{len(result.ledger)} ledger rows; {len(result.diff)} balances changed.",
+        )
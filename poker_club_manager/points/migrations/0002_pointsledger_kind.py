@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0004_memberstatistics_and_more'),
+        ('events', '0007_remove_eventrsvp_rsvp_user_or_guest_and_more'),
+        ('points', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='pointsledger',
+            name='unique_points_per_event',
+        ),
+        migrations.AddField(
+            model_name='pointsledger',
+            name='kind',
+            field=models.CharField(choices=[('scoring', 'Scoring'), ('decay', 'Decay')], default='scoring', max_length=10),
+        ),
+        migrations.AddConstraint(
+            model_name='pointsledger',
+            constraint=models.UniqueConstraint(fields=('membership', 'event', 'kind'), name='unique_points_per_event'),
+        ),
+    ]
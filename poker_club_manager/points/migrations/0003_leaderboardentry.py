@@ -0,0 +1,49 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0004_memberstatistics_and_more'),
+        ('points', '0002_pointsledger_kind'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('rank', models.PositiveIntegerField()),
+                ('points', models.IntegerField()),
+                ('display_name', models.CharField(max_length=255)),
+                ('membership', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entry', to='common.seasonmembership')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to='common.season')),
+            ],
+            options={
+                'ordering': ['rank', 'membership_id'],
+                'indexes': [models.Index(fields=['season', 'rank', 'membership'], name='leaderboard_season_rank_idx')],
+            },
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO points_leaderboardentry
+                    (created_at, updated_at, season_id, membership_id, rank, points, display_name)
+                SELECT
+                    NOW(),
+                    NOW(),
+                    m.season_id,
+                    m.id,
+                    DENSE_RANK() OVER (PARTITION BY m.season_id ORDER BY m.points DESC),
+                    m.points,
+                    COALESCE(NULLIF(u.name, ''), u.username)
+                FROM common_seasonmembership AS m
+                JOIN users_user AS u ON u.id = m.user_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
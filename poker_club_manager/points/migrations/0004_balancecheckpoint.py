@@ -0,0 +1,32 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0004_memberstatistics_and_more'),
+        ('points', '0003_leaderboardentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BalanceCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('ledger_id', models.PositiveBigIntegerField()),
+                ('as_of', models.DateTimeField()),
+                ('points', models.IntegerField()),
+                ('membership', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balance_checkpoints', to='common.seasonmembership')),
+            ],
+            options={
+                'ordering': ['-ledger_id'],
+                'indexes': [models.Index(fields=['membership', 'as_of'], name='checkpoint_as_of_idx')],
+                'constraints': [models.UniqueConstraint(fields=('membership', 'ledger_id'), name='unique_checkpoint_per_ledger_entry')],
+            },
+        ),
+    ]
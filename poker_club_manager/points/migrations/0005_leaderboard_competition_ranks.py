@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('points', '0004_balancecheckpoint'),
+    ]
+
+    operations = [
+        # Entries were materialized with dense ranks; every backend now
+        # uses competition ranks (1, 2, 2, 4)
+        migrations.RunSQL(
+            sql="""
+                UPDATE points_leaderboardentry AS e
+                SET rank = r.rank
+                FROM (
+                    SELECT
+                        id,
+                        RANK() OVER (PARTITION BY season_id ORDER BY points DESC) AS rank
+                    FROM points_leaderboardentry
+                ) AS r
+                WHERE e.id = r.id AND e.rank <> r.rank
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -4,6 +4,14 @@ from poker_club_manager.common.models import AbstractTimestampedModel
 
 
 class PointsLedger(AbstractTimestampedModel):
+    SCORING = "scoring"
+    DECAY = "decay"
+
+    KIND_CHOICES = [
+        (SCORING, "Scoring"),
+        (DECAY, "Decay"),
+    ]
+
     membership = models.ForeignKey(
         "common.SeasonMembership",
         on_delete=models.CASCADE,
@@ -16,6 +24,11 @@ class PointsLedger(AbstractTimestampedModel):
         blank=True,
         related_name="points_ledger",
     )
+    kind = models.CharField(
+        max_length=10,
+        choices=KIND_CHOICES,
+        default=SCORING,
+    )
     points_delta = models.IntegerField()
     reason = models.CharField(max_length=255)
 
@@ -23,10 +36,91 @@ class PointsLedger(AbstractTimestampedModel):
         ordering = ["-created_at"]
         constraints = [
             models.UniqueConstraint(
-                fields=["membership", "event"],
+                fields=["membership", "event", "kind"],
                 name="unique_points_per_event",
             ),
         ]
 
     def __str__(self):
         return f"{self.membership_id} | {self.points_delta:+d} | {self.reason}"
+
+
+class LeaderboardEntryQuerySet(models.QuerySet):
+    def search(self, query: str):
+        return self.filter(
+            models.Q(membership__user__username__icontains=query)
+            | models.Q(membership__user__name__icontains=query),
+        )
+
+    def ranked(self):
+        return self.order_by("rank", "membership_id")
+
+
+class LeaderboardEntry(AbstractTimestampedModel):
+    """
+    Materialized standings for a season, refreshed from
+    SeasonMembership.points whenever scoring commits.
+    """
+
+    objects = LeaderboardEntryQuerySet.as_manager()
+
+    season = models.ForeignKey(
+        "common.Season",
+        on_delete=models.CASCADE,
+        related_name="leaderboard_entries",
+    )
+    membership = models.OneToOneField(
+        "common.SeasonMembership",
+        on_delete=models.CASCADE,
+        related_name="leaderboard_entry",
+    )
+    rank = models.PositiveIntegerField()
+    points = models.IntegerField()
+    display_name = models.CharField(max_length=255)
+
+    class Meta:
+        ordering = ["rank", "membership_id"]
+        indexes = [
+            models.Index(
+                fields=["season", "rank", "membership"],
+                name="leaderboard_season_rank_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} {self.display_name} ({self.points})"
+
+
+class BalanceCheckpoint(AbstractTimestampedModel):
+    """
+    A membership's ledger-derived balance after every ledger row up to and
+    including ``ledger_id``, so historical balances only need the ledger
+    rows written since the nearest checkpoint.
+    """
+
+    membership = models.ForeignKey(
+        "common.SeasonMembership",
+        on_delete=models.CASCADE,
+        related_name="balance_checkpoints",
+    )
+    ledger_id = models.PositiveBigIntegerField()
+    as_of = models.DateTimeField()
+    points = models.IntegerField()
+
+    class Meta:
+        ordering = ["-ledger_id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["membership", "ledger_id"],
+                name="unique_checkpoint_per_ledger_entry",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["membership", "as_of"],
+                name="checkpoint_as_of_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.membership_id} | {self.points} as of ledger {self.ledger_id}"
@@ -1,13 +1,23 @@
 import logging
+from functools import partial
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
+from poker_club_manager.common.models import MemberStatistics, SeasonMembership
+from poker_club_manager.common.utils.fragments import bump_version
 from poker_club_manager.events.signals import event_completed
 
+from .balances import create_checkpoints
 from .decay import get_decay_strategy
+from .models import LeaderboardEntry, PointsLedger
 from .scoring import get_scoring_strategy
-from .services import apply_scoring
+from .services import apply_scoring, schedule_leaderboard_refresh
+from .statistics import record_ledger_deltas, refresh_statistics
 
 logger = logging.getLogger(__name__)
 
@@ -52,18 +62,77 @@ def handle_event_completion(sender, event, **kwargs):
         f"Event {event.id} point scoring using {strategy.key}",
     )
 
-    # Apply global decay strategies
-    # More inefficient to do it here but keeps the code simple
-    # and not really built for scale (50000+) anyways
+    # Global decay runs as a single set-based statement over the season
     decay_strategy = get_decay_strategy(settings.POINTS_DEFAULT_DECAY_STRATEGY)
-    decay_deltas = decay_strategy.calculate(event)
+    decayed = decay_strategy.apply(
+        event,
+        f"Event {event.id} decay using {decay_strategy.key}",
+    )
     logger.info(
-        "Calculated decay deltas for event %s using strategy %s",
+        "Applied decay to %s memberships for event %s using strategy %s",
+        decayed,
         event.id,
         decay_strategy.key,
     )
-    apply_scoring(
-        event,
-        decay_deltas,
-        f"Event {event.id} decay using {decay_strategy.key}",
+
+    checkpoints = create_checkpoints(
+        event.season,
+        min_tail=settings.POINTS_CHECKPOINT_INTERVAL,
+    )
+    logger.info("Wrote %s balance checkpoints for event %s", checkpoints, event.id)
+
+
+@receiver(event_completed)
+def handle_event_statistics(sender, event, **kwargs):
+    if not event.season:
+        return
+    # Ledger counters are kept up to date as rows are written; this picks
+    # up the event's results for everyone who played it
+    refreshed = refresh_statistics(
+        SeasonMembership.objects.filter(
+            season=event.season,
+            user__participations__event=event,
+        ),
+    )
+    logger.info("Refreshed statistics of %s members for event %s", refreshed, event.id)
+
+
+@receiver(post_save, sender=SeasonMembership)
+def handle_membership_created(sender, instance, created, **kwargs):
+    if created:
+        MemberStatistics.objects.get_or_create(membership=instance)
+        schedule_leaderboard_refresh(instance.season_id, {instance.id: instance.points})
+
+
+@receiver(post_save, sender=PointsLedger)
+def handle_ledger_saved(sender, instance, created, **kwargs):
+    # Scoring bulk-inserts its ledger rows and invalidates through
+    # schedule_leaderboard_refresh; this covers single manual adjustments
+    if created:
+        record_ledger_deltas(
+            {instance.membership_id: instance.points_delta},
+            kind=instance.kind,
+        )
+    season_id = (
+        SeasonMembership.objects.filter(id=instance.membership_id)
+        .values_list("season_id", flat=True)
+        .first()
+    )
+    transaction.on_commit(lambda: bump_version(f"season:{season_id}"))
+
+
+@receiver(post_save, sender=get_user_model())
+def handle_user_saved(sender, instance, created, **kwargs):
+    if created:
+        return
+    # Leaderboard entries denormalize the name shown for the user
+    display_name = instance.name or instance.username
+    stale = LeaderboardEntry.objects.filter(membership__user=instance).exclude(
+        display_name=display_name,
     )
+    season_ids = set(stale.values_list("season_id", flat=True))
+    if not season_ids:
+        return
+    stale.update(display_name=display_name, updated_at=timezone.now())
+    for season_id in season_ids:
+        transaction.on_commit(partial(bump_version, f"season:{season_id}"))
@@ -0,0 +1,242 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Sum
+from django.utils import timezone
+
+from poker_club_manager.common.models import Season, SeasonMembership
+from poker_club_manager.events.models import (
+    Event,
+    EventCompletionJob,
+    GuestParticipant,
+    Participant,
+)
+
+from .decay import DecayStrategy
+from .models import BalanceCheckpoint, PointsLedger
+from .scoring import (
+    EventResults,
+    ParticipantResult,
+    ScoringStrategy,
+    get_scoring_strategy,
+)
+from .services import LEDGER_BATCH_SIZE, schedule_leaderboard_rebuild
+from .statistics import refresh_statistics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplayResult:
+    season_id: int
+    events_replayed: int = 0
+    ledger: list[PointsLedger] = field(default_factory=list)
+    balances: dict[int, int] = field(default_factory=dict)
+    previous_balances: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def diff(self) -> dict[int, tuple[int, int]]:
+        """
+        Memberships whose balance changes, as ``{id: (before, after)}``.
+        """
+        return {
+            membership_id: (self.previous_balances.get(membership_id, 0), points)
+            for membership_id, points in self.balances.items()
+            if self.previous_balances.get(membership_id, 0) != points
+        }
+
+
+def load_season_results(season: Season) -> list[tuple[str, EventResults]]:
+    """
+    Load the scoring strategy key and results of every scored event in a
+    season in chronological order, using a constant number of queries.
+
+    Only events that have actually been completed count: those with
+    ledger rows or a succeeded completion job. A finished event nobody
+    has completed yet is left for its completion job.
+    """
+    completed = Exists(
+        PointsLedger.objects.filter(event=OuterRef("pk")),
+    ) | Exists(
+        EventCompletionJob.objects.filter(
+            event=OuterRef("pk"),
+            status=EventCompletionJob.SUCCEEDED,
+        ),
+    )
+    strategy_keys = dict(
+        Event.objects.filter(completed, season=season)
+        .finished()
+        .exclude(scoring_strategy="")
+        .order_by("start_date", "id")
+        .values_list("id", "scoring_strategy"),
+    )
+    events = list(strategy_keys)
+
+    memberships = dict(
+        SeasonMembership.objects.filter(season=season).values_list("user_id", "id"),
+    )
+    guest_counts = dict(
+        GuestParticipant.objects.filter(event_id__in=events)
+        .values("event_id")
+        .annotate(total=Count("id"))
+        .values_list("event_id", "total"),
+    )
+
+    participants = defaultdict(list)
+    rows = (
+        Participant.objects.filter(event_id__in=events)
+        .values_list("event_id", "user_id", "final_position", "eliminations")
+        .iterator(chunk_size=LEDGER_BATCH_SIZE)
+    )
+    for event_id, user_id, final_position, eliminations in rows:
+        participants[event_id].append(
+            ParticipantResult(
+                user_id=user_id,
+                membership_id=memberships.get(user_id),
+                rank=final_position,
+                eliminations=eliminations,
+            ),
+        )
+
+    return [
+        (
+            strategy_keys[event_id],
+            EventResults(
+                event_id=event_id,
+                season_id=season.id,
+                total_participants=len(participants[event_id])
+                + guest_counts.get(event_id, 0),
+                participants=tuple(participants[event_id]),
+            ),
+        )
+        for event_id in events
+    ]
+
+
+def replay_season(
+    season: Season,
+    decay_strategy: DecayStrategy,
+    scoring_strategy: ScoringStrategy | None = None,
+    *,
+    dry_run: bool = False,
+) -> ReplayResult:
+    """
+    Recompute a season's standings by replaying every completed event in
+    memory with the given strategies. Unless ``dry_run`` is set, the event
+    ledger and balances are replaced in one transaction, with the season's
+    memberships locked from the moment their balances are read. Ledger rows
+    not tied to an event (manual adjustments) are kept and carried over.
+
+    Without a ``scoring_strategy`` each event uses its own.
+    """
+    with transaction.atomic():
+        return _replay_season(
+            season,
+            decay_strategy,
+            scoring_strategy,
+            dry_run=dry_run,
+        )
+
+
+def _replay_season(
+    season: Season,
+    decay_strategy: DecayStrategy,
+    scoring_strategy: ScoringStrategy | None,
+    *,
+    dry_run: bool,
+) -> ReplayResult:
+    memberships = SeasonMembership.objects.filter(season=season)
+    if not dry_run:
+        # Hold the balances until the rewrite commits so points scored
+        # meanwhile are not overwritten by a stale diff
+        memberships = memberships.select_for_update()
+
+    result = ReplayResult(season_id=season.id)
+    result.previous_balances = dict(memberships.values_list("id", "points"))
+
+    balances = dict.fromkeys(result.previous_balances, 0)
+    adjustments = (
+        PointsLedger.objects.filter(membership__season=season, event__isnull=True)
+        .values("membership_id")
+        .annotate(total=Sum("points_delta"))
+        .values_list("membership_id", "total")
+    )
+    for membership_id, total in adjustments:
+        balances[membership_id] += total
+
+    strategies = {}
+    for strategy_key, results in load_season_results(season):
+        strategy = scoring_strategy
+        if strategy is None:
+            if strategy_key not in strategies:
+                strategies[strategy_key] = get_scoring_strategy(strategy_key)
+            strategy = strategies[strategy_key]
+
+        deltas = strategy.calculate_results(results)
+        reason = f"Event {results.event_id} point scoring using {strategy.key}"
+        for membership_id, delta in deltas.items():
+            balances[membership_id] += delta
+            result.ledger.append(
+                PointsLedger(
+                    membership_id=membership_id,
+                    event_id=results.event_id,
+                    kind=PointsLedger.SCORING,
+                    points_delta=delta,
+                    reason=reason,
+                ),
+            )
+
+        decay = decay_strategy.calculate_balances(results.total_participants, balances)
+        reason = f"Event {results.event_id} decay using {decay_strategy.key}"
+        for membership_id, delta in decay.items():
+            if not delta:
+                continue
+            balances[membership_id] += delta
+            result.ledger.append(
+                PointsLedger(
+                    membership_id=membership_id,
+                    event_id=results.event_id,
+                    kind=PointsLedger.DECAY,
+                    points_delta=delta,
+                    reason=reason,
+                ),
+            )
+
+        result.events_replayed += 1
+
+    result.balances = balances
+    logger.info(
+        "Replayed %s events for season %s: %s ledger rows, %s balances changed",
+        result.events_replayed,
+        season.id,
+        len(result.ledger),
+        len(result.diff),
+    )
+
+    if not dry_run:
+        _write_replay(season, result)
+    return result
+
+
+def _write_replay(season: Season, result: ReplayResult):
+    now = timezone.now()
+    with transaction.atomic():
+        BalanceCheckpoint.objects.filter(membership__season=season).delete()
+        PointsLedger.objects.filter(
+            membership__season=season,
+            event__isnull=False,
+        ).delete()
+        PointsLedger.objects.bulk_create(result.ledger, batch_size=LEDGER_BATCH_SIZE)
+        SeasonMembership.objects.bulk_update(
+            [
+                SeasonMembership(id=membership_id, points=points, updated_at=now)
+                for membership_id, (_, points) in result.diff.items()
+            ],
+            ["points", "updated_at"],
+            batch_size=LEDGER_BATCH_SIZE,
+        )
+        # The ledger was replaced wholesale, so recount rather than fold in
+        refresh_statistics(SeasonMembership.objects.filter(season=season))
+        schedule_leaderboard_rebuild(season.id)
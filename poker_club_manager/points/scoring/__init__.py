@@ -1,5 +1,6 @@
 from .base import ScoringStrategy
 from .bounty import BountyScoringStrategy
+from .results import EventResults, ParticipantResult
 from .standard import BuyInDistributionScoringStrategy
 
 DEFAULT_STRATEGY = BuyInDistributionScoringStrategy
@@ -15,8 +16,11 @@ def get_scoring_strategy(strategy: str):
 
 
 __all__ = [
+    "STRATEGY_MAP",
     "BountyScoringStrategy",
     "BuyInDistributionScoringStrategy",
+    "EventResults",
+    "ParticipantResult",
     "ScoringStrategy",
     "get_scoring_strategy",
 ]
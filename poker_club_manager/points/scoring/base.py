@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from .results import EventResults
+
 if TYPE_CHECKING:
     from poker_club_manager.events.models import Event
 
@@ -8,9 +10,15 @@ if TYPE_CHECKING:
 class ScoringStrategy(ABC):
     key: str
 
-    @abstractmethod
     def calculate(self, event: "Event") -> dict[int, int]:
         """
         Apply points for this event.
         """
+        return self.calculate_results(EventResults.load(event))
+
+    @abstractmethod
+    def calculate_results(self, results: EventResults) -> dict[int, int]:
+        """
+        Calculate point deltas, keyed by membership id, from a results snapshot.
+        """
         raise NotImplementedError
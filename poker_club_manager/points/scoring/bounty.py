@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from .base import ScoringStrategy
 
 if TYPE_CHECKING:
-    from poker_club_manager.events.models import Event
+    from .results import EventResults
 
 
 class BountyScoringStrategy(ScoringStrategy):
@@ -16,20 +16,22 @@ class BountyScoringStrategy(ScoringStrategy):
         total_participants: int,
         rank: int,
         eliminations: int,
-    ) -> float:
+    ) -> int:
         return round(eliminations * self.POINTS_PER_BUY_IN)
 
-    def calculate(self, event: "Event") -> dict[int, int]:
-        deltas = {}
+    def calculate_results(self, results: "EventResults") -> dict[int, int]:
+        deltas: dict[int, int] = {}
 
-        for p in event.participations.all():
-            membership = p.season_membership
-            if membership is None:
+        for p in results.participants:
+            if p.membership_id is None:
                 continue
 
             # Award based on curve, eliminations then deduct buy-in points
-            deltas[membership.id] = (
-                self.calculate_points(event.total_participants, p.rank, p.eliminations)
-            ) - self.POINTS_PER_BUY_IN
+            points = self.calculate_points(
+                results.total_participants,
+                0 if p.rank is None else p.rank,
+                p.eliminations,
+            )
+            deltas[p.membership_id] = points - self.POINTS_PER_BUY_IN
 
         return deltas
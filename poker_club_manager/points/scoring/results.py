@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.db.models import OuterRef, Subquery
+
+from poker_club_manager.common.models import SeasonMembership
+
+if TYPE_CHECKING:
+    from poker_club_manager.events.models import Event
+
+
+@dataclass(frozen=True)
+class ParticipantResult:
+    user_id: int
+    membership_id: int | None
+    rank: int | None
+    eliminations: int
+
+
+@dataclass(frozen=True)
+class EventResults:
+    """
+    Immutable snapshot of everything a scoring strategy needs for an event,
+    so strategies never touch the ORM themselves.
+    """
+
+    event_id: int
+    season_id: int | None
+    total_participants: int
+    participants: tuple[ParticipantResult, ...]
+
+    @classmethod
+    def load(cls, event: "Event") -> "EventResults":
+        """
+        Load the results of an event in two queries: one for participants
+        (with their season membership) and one for the guest count.
+        """
+        participants = event.participants.all()
+        if event.season_id is not None:
+            participants = participants.annotate(
+                membership_id=Subquery(
+                    SeasonMembership.objects.filter(
+                        season_id=event.season_id,
+                        user_id=OuterRef("user_id"),
+                    ).values("id")[:1],
+                ),
+            )
+            rows = participants.values_list(
+                "user_id",
+                "membership_id",
+                "final_position",
+                "eliminations",
+            )
+        else:
+            rows = [
+                (user_id, None, final_position, eliminations)
+                for user_id, final_position, eliminations in participants.values_list(
+                    "user_id",
+                    "final_position",
+                    "eliminations",
+                )
+            ]
+
+        results = tuple(ParticipantResult(*row) for row in rows)
+        return cls(
+            event_id=event.id,
+            season_id=event.season_id,
+            total_participants=len(results) + event.guests.count(),
+            participants=results,
+        )
@@ -1,16 +1,32 @@
+import functools
 import logging
 import math
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from .base import ScoringStrategy
 
 if TYPE_CHECKING:
-    from poker_club_manager.events.models import Event
+    from .results import EventResults
 
 logger = logging.getLogger(__name__)
 
 
-# Not the most efficient but whatever
+@functools.lru_cache(maxsize=512)
+def zipf_payout_table(total: int, alpha: float, points_per_buy_in: int) -> tuple:
+    """
+    Payouts for every paid rank of a field of ``total`` players, indexed
+    by ``rank - 1``. The top 15% of the field share the buy-in pool along
+    a Zipf curve. Cached per field size since events reuse the same sizes.
+    """
+    m = math.ceil(0.15 * total)
+    weights = [i**-alpha for i in range(1, m + 1)]
+    z = sum(weights)
+
+    t = points_per_buy_in * total
+    return tuple(round(t * w / z) for w in weights)
+
+
 class BuyInDistributionScoringStrategy(ScoringStrategy):
     key = "buy_in_distribution"
 
@@ -22,31 +38,36 @@ class BuyInDistributionScoringStrategy(ScoringStrategy):
         rank: int,
         alpha=1.25,
     ) -> int:
-        if total < self.POINTS_PER_BUY_IN or rank < 1:
-            return 0
-
-        m = math.ceil(0.15 * total)
-        if rank > m:
-            return 0
-
-        weights = [i**-alpha for i in range(1, m + 1)]
-        z = sum(weights)
-
-        t = self.POINTS_PER_BUY_IN * total
-        return round(t * (rank**-alpha) / z)
-
-    def calculate(self, event: "Event") -> dict[int, int]:
-        deltas = {}
-        total = event.get_total_participants()
-
-        for p in event.participations.all():
-            membership = p.season_membership
-            if membership is None:
-                continue
-            rank = 0 if p.rank is None else p.rank
-            # Award based on curve, eliminations then deduct buy-in points
-            deltas[membership.id] = (
-                self.calculate_points(total, rank) + p.eliminations
-            ) - self.POINTS_PER_BUY_IN
-
-        return deltas
+        return self.calculate_many(total, [rank], alpha=alpha)[0]
+
+    def calculate_many(
+        self,
+        total: int,
+        ranks: Iterable[int],
+        alpha=1.25,
+    ) -> list[int]:
+        """
+        Payouts for many ranks of the same field using one cached table.
+        """
+        if total < self.POINTS_PER_BUY_IN:
+            return [0 for _ in ranks]
+
+        table = zipf_payout_table(total, alpha, self.POINTS_PER_BUY_IN)
+        return [table[rank - 1] if 1 <= rank <= len(table) else 0 for rank in ranks]
+
+    def calculate_results(self, results: "EventResults") -> dict[int, int]:
+        members = [
+            (p.membership_id, p)
+            for p in results.participants
+            if p.membership_id is not None
+        ]
+        payouts = self.calculate_many(
+            results.total_participants,
+            [0 if p.rank is None else p.rank for _, p in members],
+        )
+
+        # Award based on curve, eliminations then deduct buy-in points
+        return {
+            membership_id: payout + p.eliminations - self.POINTS_PER_BUY_IN
+            for (membership_id, p), payout in zip(members, payouts, strict=True)
+        }
@@ -1,27 +1,296 @@
-from django.db import transaction
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
 
-from .models import PointsLedger, SeasonMembership
+from poker_club_manager.common.models import SeasonMembership
+from poker_club_manager.common.utils.db import table_name
+from poker_club_manager.common.utils.fragments import bump_version
 
+from .leaderboards import DatabaseLeaderboard, get_leaderboard_backend
+from .models import LeaderboardEntry, PointsLedger
+from .statistics import record_ledger_deltas
+
+LEDGER_BATCH_SIZE = 1000
+
+
+def apply_scoring(
+    event,
+    deltas: dict[int, int],
+    reason: str,
+    *,
+    kind: str = PointsLedger.SCORING,
+) -> list[PointsLedger]:
+    """
+    Apply a set of point deltas (keyed by membership id) for an event.
+
+    Balances are updated with a single set-based UPDATE and every ledger
+    row is written with one bulk insert, so the number of queries does not
+    grow with the size of the event.
+    """
+    if not deltas:
+        return []
 
-def apply_scoring(event, deltas: dict, reason: str):
     with transaction.atomic():
-        memberships = SeasonMembership.objects.select_for_update().filter(
-            season=event.season,
-            user_id__in=deltas.keys(),
-        )
-        membership_map = {m.user_id: m for m in memberships}
-
-        for user_id, points in deltas.items():
-            membership = membership_map.get(user_id)
-            if not membership:
-                continue
-
-            membership.points += points
-            membership.save(update_fields=["points"])
-
-            PointsLedger.objects.create(
-                membership=membership,
-                event=event,
-                points_delta=points,
-                reason=reason,
-            )
+        # Lock in a stable order so concurrent completions cannot deadlock
+        membership_ids = list(
+            SeasonMembership.objects.select_for_update()
+            .filter(season=event.season, id__in=deltas.keys())
+            .order_by("id")
+            .values_list("id", flat=True),
+        )
+        if not membership_ids:
+            return []
+
+        SeasonMembership.objects.filter(id__in=membership_ids).update(
+            points=F("points")
+            + Case(
+                *[
+                    When(id=membership_id, then=Value(deltas[membership_id]))
+                    for membership_id in membership_ids
+                ],
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+            updated_at=timezone.now(),
+        )
+        schedule_leaderboard_refresh(
+            event.season_id,
+            {membership_id: deltas[membership_id] for membership_id in membership_ids},
+        )
+        record_ledger_deltas(
+            {membership_id: deltas[membership_id] for membership_id in membership_ids},
+            kind=kind,
+        )
+
+        return PointsLedger.objects.bulk_create(
+            [
+                PointsLedger(
+                    membership_id=membership_id,
+                    event=event,
+                    kind=kind,
+                    points_delta=deltas[membership_id],
+                    reason=reason,
+                )
+                for membership_id in membership_ids
+            ],
+            batch_size=LEDGER_BATCH_SIZE,
+        )
+
+
+def apply_decay(event, *, rate: float, cap: int, reason: str) -> int:
+    """
+    Decay every positive balance in the event's season by
+    ``round(min(cap, points) * rate)`` entirely inside the database.
+
+    The balances and their matching ledger rows are written by a single
+    statement, so no memberships are loaded into Python. Rounding uses
+    double precision ``round`` to match Python's ``round``. Memberships
+    already decayed for the event are skipped, so applying it again is a
+    no-op. Returns the number of memberships that were decayed.
+    """
+    if rate <= 0:
+        return 0
+
+    membership_table = table_name(SeasonMembership)
+    ledger_table = table_name(PointsLedger)
+
+    sql = f"""
+        WITH decay AS (
+            SELECT id, ROUND(LEAST(%(cap)s, points) * %(rate)s::double precision)::integer AS amount
+            FROM {membership_table}
+            WHERE season_id = %(season_id)s AND points > 0
+                AND NOT EXISTS (
+                    SELECT 1 FROM {ledger_table} AS l
+                    WHERE l.membership_id = {membership_table}.id
+                        AND l.event_id = %(event_id)s AND l.kind = %(kind)s
+                )
+            FOR UPDATE
+        ), decayed AS (
+            UPDATE {membership_table} AS m
+            SET points = m.points - decay.amount, updated_at = NOW()
+            FROM decay
+            WHERE m.id = decay.id AND decay.amount > 0
+            RETURNING m.id, decay.amount
+        )
+        INSERT INTO {ledger_table}
+            (created_at, updated_at, membership_id, event_id, kind, points_delta, reason)
+        SELECT NOW(), NOW(), id, %(event_id)s, %(kind)s, -amount, %(reason)s
+        FROM decayed
+        RETURNING membership_id, points_delta
+    """  # noqa: E501, S608
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            sql,
+            {
+                "cap": cap,
+                "rate": rate,
+                "season_id": event.season_id,
+                "event_id": event.id,
+                "kind": PointsLedger.DECAY,
+                "reason": reason,
+            },
+        )
+        decayed = dict(cursor.fetchall())
+        schedule_leaderboard_refresh(event.season_id, decayed)
+        record_ledger_deltas(decayed, kind=PointsLedger.DECAY)
+        return len(decayed)
+
+
+def refresh_leaderboard(
+    season_id: int | None = None,
+    membership_ids=None,
+) -> int:
+    """
+    Recompute the materialized leaderboard for a season (or every season)
+    with a competition rank over points (1, 2, 2, 4), as every leaderboard
+    backend ranks. Only rows whose rank, points or display name changed
+    are written. Returns the number of rows written.
+
+    Given the ``membership_ids`` whose points changed, only the entries
+    whose rank can have moved are recomputed: those between the lowest and
+    highest of the changed members' old and new points.
+    """
+    if season_id is not None and membership_ids is not None:
+        written = _refresh_leaderboard_range(season_id, list(membership_ids))
+        if written is not None:
+            return written
+
+    membership_table = table_name(SeasonMembership)
+    user_table = table_name(get_user_model())
+    leaderboard_table = table_name(LeaderboardEntry)
+    season_filter = (
+        "WHERE m.season_id = %(season_id)s" if season_id is not None else "WHERE TRUE"
+    )
+
+    sql = f"""
+        INSERT INTO {leaderboard_table}
+            (created_at, updated_at, season_id, membership_id, rank, points, display_name)
+        SELECT
+            %(now)s,
+            %(now)s,
+            m.season_id,
+            m.id,
+            RANK() OVER (PARTITION BY m.season_id ORDER BY m.points DESC),
+            m.points,
+            COALESCE(NULLIF(u.name, ''), u.username)
+        FROM {membership_table} AS m
+        JOIN {user_table} AS u ON u.id = m.user_id
+        {season_filter}
+        {_LEADERBOARD_UPSERT.format(leaderboard_table=leaderboard_table)}
+    """  # noqa: E501, S608
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {"season_id": season_id, "now": timezone.now()})
+        return cursor.rowcount
+
+
+_LEADERBOARD_UPSERT = """
+    ON CONFLICT (membership_id) DO UPDATE SET
+        rank = excluded.rank,
+        points = excluded.points,
+        display_name = excluded.display_name,
+        updated_at = excluded.updated_at
+    WHERE {leaderboard_table}.rank <> excluded.rank
+        OR {leaderboard_table}.points <> excluded.points
+        OR {leaderboard_table}.display_name <> excluded.display_name
+"""
+
+
+def _refresh_leaderboard_range(season_id: int, membership_ids: list[int]) -> int | None:
+    """
+    A member's competition rank is one more than the number of members
+    with more points, so moving from ``old`` to ``new`` points only changes
+    the ranks of members between the two. Entries in that range are ranked
+    within it and offset by the count above it. Returns None when a member
+    has no entry yet: a new member shifts everyone below, so the caller
+    falls back to a full refresh.
+    """
+    if not membership_ids:
+        return 0
+    entries = LeaderboardEntry.objects.filter(membership_id__in=membership_ids)
+    if entries.count() < len(set(membership_ids)):
+        return None
+
+    membership_table = table_name(SeasonMembership)
+    user_table = table_name(get_user_model())
+    leaderboard_table = table_name(LeaderboardEntry)
+
+    sql = f"""
+        WITH changed AS (
+            SELECT m.points AS new_points, e.points AS old_points
+            FROM {membership_table} AS m
+            JOIN {leaderboard_table} AS e ON e.membership_id = m.id
+            WHERE m.id = ANY(%(membership_ids)s)
+        ), bounds AS (
+            SELECT
+                LEAST(MIN(new_points), MIN(old_points)) AS low,
+                GREATEST(MAX(new_points), MAX(old_points)) AS high
+            FROM changed
+        )
+        INSERT INTO {leaderboard_table}
+            (created_at, updated_at, season_id, membership_id, rank, points, display_name)
+        SELECT
+            %(now)s,
+            %(now)s,
+            m.season_id,
+            m.id,
+            (
+                SELECT COUNT(*) FROM {membership_table} AS above
+                WHERE above.season_id = %(season_id)s AND above.points > bounds.high
+            ) + RANK() OVER (ORDER BY m.points DESC),
+            m.points,
+            COALESCE(NULLIF(u.name, ''), u.username)
+        FROM {membership_table} AS m
+        JOIN {user_table} AS u ON u.id = m.user_id
+        CROSS JOIN bounds
+        WHERE m.season_id = %(season_id)s
+            AND m.points BETWEEN bounds.low AND bounds.high
+        {_LEADERBOARD_UPSERT.format(leaderboard_table=leaderboard_table)}
+    """  # noqa: E501, S608
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql,
+            {
+                "season_id": season_id,
+                "membership_ids": membership_ids,
+                "now": timezone.now(),
+            },
+        )
+        return cursor.rowcount
+
+
+def schedule_leaderboard_refresh(season_id: int | None, deltas: dict[int, int]):
+    """
+    Refresh the season's leaderboard once the current transaction commits,
+    and mirror the committed deltas into the configured leaderboard backend.
+    """
+    if season_id is None:
+        return
+
+    def refresh():
+        refresh_leaderboard(season_id, deltas.keys())
+        get_leaderboard_backend().record(season_id, deltas)
+        bump_version(f"season:{season_id}")
+
+    # The ledger is already committed: a failure here is logged rather than
+    # raised to the caller, and refresh_leaderboards repairs any drift
+    transaction.on_commit(refresh, robust=True)
+
+
+def schedule_leaderboard_rebuild(season_id: int):
+    """
+    Fully rebuild the season's leaderboard and backend once the current
+    transaction commits, for changes too broad to express as deltas.
+    """
+
+    def rebuild():
+        refresh_leaderboard(season_id)
+        backend = get_leaderboard_backend()
+        if not isinstance(backend, DatabaseLeaderboard):
+            backend.rebuild(season_id)
+        bump_version(f"season:{season_id}")
+
+    transaction.on_commit(rebuild, robust=True)
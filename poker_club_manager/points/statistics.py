@@ -0,0 +1,134 @@
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from poker_club_manager.common.models import MemberStatistics
+from poker_club_manager.events.models import Event, Participant
+
+from .models import PointsLedger
+
+STATISTICS_BATCH_SIZE = 1000
+
+COUNTER_FIELDS = (
+    "events_played",
+    "cashes",
+    "finishes",
+    "finish_position_total",
+    "total_eliminations",
+    "points_won",
+    "points_lost",
+)
+
+
+def _total(qs, aggregate):
+    return Coalesce(
+        Subquery(
+            qs.annotate(total=aggregate).values("total"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def refresh_statistics(memberships) -> int:
+    """
+    Recompute every counter of ``memberships`` from the participations and
+    ledger behind them, and upsert them with one statement per batch.
+
+    An event counts as played once it has finished (``Event.finished``, so
+    an event without an end date counts from its start). A "cash" is a
+    net-positive event: a positive scoring ledger row, which is the payout
+    plus any bounties less the buy-in. Returns the number of rows written.
+    """
+    played = (
+        Participant.objects.filter(
+            user_id=OuterRef("user_id"),
+            event__season_id=OuterRef("season_id"),
+            event__in=Event.objects.finished(),
+        )
+        .order_by()
+        .values("user_id")
+    )
+    ledger = (
+        PointsLedger.objects.filter(membership=OuterRef("pk"))
+        .order_by()
+        .values("membership")
+    )
+
+    rows = memberships.order_by().annotate(
+        events_played=_total(played, Count("id")),
+        finishes=_total(played.filter(final_position__isnull=False), Count("id")),
+        finish_position_total=_total(played, Sum("final_position")),
+        total_eliminations=_total(played, Sum("eliminations")),
+        cashes=_total(
+            ledger.filter(kind=PointsLedger.SCORING, points_delta__gt=0),
+            Count("id"),
+        ),
+        points_won=_total(ledger.filter(points_delta__gt=0), Sum("points_delta")),
+        points_lost=-_total(ledger.filter(points_delta__lt=0), Sum("points_delta")),
+    )
+
+    statistics = [
+        MemberStatistics(
+            membership_id=row["id"],
+            **{field: row[field] for field in COUNTER_FIELDS},
+        )
+        for row in rows.values("id", *COUNTER_FIELDS).iterator()
+    ]
+    MemberStatistics.objects.bulk_create(
+        statistics,
+        update_conflicts=True,
+        unique_fields=["membership"],
+        update_fields=[*COUNTER_FIELDS, "updated_at"],
+        batch_size=STATISTICS_BATCH_SIZE,
+    )
+    return len(statistics)
+
+
+def record_ledger_deltas(deltas: dict[int, int], *, kind: str):
+    """
+    Fold freshly written ledger deltas (keyed by membership id) into the
+    counters with one set-based UPDATE, creating missing rows first.
+    """
+    deltas = {membership_id: delta for membership_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    MemberStatistics.objects.bulk_create(
+        [MemberStatistics(membership_id=membership_id) for membership_id in deltas],
+        ignore_conflicts=True,
+        batch_size=STATISTICS_BATCH_SIZE,
+    )
+
+    won = {m: delta for m, delta in deltas.items() if delta > 0}
+    lost = {m: -delta for m, delta in deltas.items() if delta < 0}
+    updates = {"updated_at": timezone.now()}
+    if won:
+        updates["points_won"] = _increment("points_won", won)
+        if kind == PointsLedger.SCORING:
+            updates["cashes"] = _increment("cashes", dict.fromkeys(won, 1))
+    if lost:
+        updates["points_lost"] = _increment("points_lost", lost)
+
+    MemberStatistics.objects.filter(membership_id__in=deltas.keys()).update(**updates)
+
+
+def _increment(field: str, amounts: dict[int, int]):
+    return F(field) + Case(
+        *[
+            When(membership_id=membership_id, then=Value(amount))
+            for membership_id, amount in amounts.items()
+        ],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
@@ -0,0 +1,32 @@
+from poker_club_manager.common.tests.factories import SeasonMembershipFactory
+from poker_club_manager.events.tests.factories import EventFactory
+from poker_club_manager.points.balances import (
+    balance_as_of,
+    create_checkpoints,
+    standings_as_of,
+)
+from poker_club_manager.points.services import apply_scoring
+
+
+def test_balance_as_of_event_uses_checkpoint_and_tail(db):
+    first = EventFactory()
+    membership = SeasonMembershipFactory(season=first.season)
+    rival = SeasonMembershipFactory(season=first.season)
+    second = EventFactory(season=first.season)
+    third = EventFactory(season=first.season)
+
+    apply_scoring(first, {membership.id: 10, rival.id: 3}, "first")
+    assert create_checkpoints(first.season) == 2  # noqa: PLR2004
+    apply_scoring(second, {membership.id: -4, rival.id: 8}, "second")
+    apply_scoring(third, {membership.id: 1}, "third")
+
+    assert balance_as_of(membership, event=first) == 10  # noqa: PLR2004
+    assert balance_as_of(membership, event=second) == 6  # noqa: PLR2004
+    assert balance_as_of(membership) == 7  # noqa: PLR2004
+
+    standings = standings_as_of(first.season, event=second)
+    assert [m.id for m in standings] == [rival.id, membership.id]
+
+    assert create_checkpoints(first.season) == 2  # noqa: PLR2004
+    assert create_checkpoints(first.season) == 0
+    assert membership.balance_checkpoints.first().points == 7  # noqa: PLR2004
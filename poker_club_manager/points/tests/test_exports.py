@@ -0,0 +1,91 @@
+import asyncio
+import io
+
+import pytest
+from django.core.management import call_command
+from django.test import AsyncClient
+from django.urls import reverse
+
+from poker_club_manager.common.tests.factories import SeasonMembershipFactory
+from poker_club_manager.events.tests.factories import EventFactory, ParticipantFactory
+from poker_club_manager.points.exports import EXPORT_TABLES, stream_table
+from poker_club_manager.points.services import apply_scoring
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def season_data(db):
+    event = EventFactory()
+    memberships = SeasonMembershipFactory.create_batch(5, season=event.season)
+    for position, membership in enumerate(memberships, start=1):
+        ParticipantFactory(event=event, user=membership.user, final_position=position)
+    apply_scoring(event, {m.id: 10 - i for i, m in enumerate(memberships)}, "test")
+    SeasonMembershipFactory()  # another season
+    return event.season, memberships
+
+
+def test_export_command_writes_every_table_in_chunks(season_data, tmp_path):
+    season, memberships = season_data
+
+    call_command(
+        "export_season",
+        season.id,
+        output_dir=tmp_path,
+        chunk_size=2,
+        stdout=io.StringIO(),
+    )
+
+    ledger = pq.ParquetFile(tmp_path / f"season-{season.id}-ledger.parquet")
+    assert ledger.metadata.num_row_groups == 3  # noqa: PLR2004
+    assert ledger.read().column("points_delta").to_pylist() == [10, 9, 8, 7, 6]
+
+    members = pq.read_table(tmp_path / f"season-{season.id}-memberships.parquet")
+    assert members.column("id").to_pylist() == [m.id for m in memberships]
+
+    results = pq.read_table(tmp_path / f"season-{season.id}-results.parquet")
+    assert results.column("final_position").to_pylist() == [1, 2, 3, 4, 5]
+    assert (tmp_path / f"season-{season.id}-rsvps.parquet").exists()
+
+
+def test_stream_table_writes_arrow_ipc(season_data):
+    season, memberships = season_data
+
+    data = b"".join(
+        stream_table(
+            EXPORT_TABLES["memberships"],
+            season,
+            file_format="arrow",
+            chunk_size=2,
+        ),
+    )
+
+    table = pa.ipc.open_file(pa.BufferReader(data)).read_all()
+    assert table.column("user_id").to_pylist() == [m.user_id for m in memberships]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_endpoint_is_staff_only(client, admin_user):
+    season = SeasonMembershipFactory().season
+    url = reverse("points:season-export", args=[season.id, "memberships"])
+
+    assert client.get(url).status_code == 302  # noqa: PLR2004
+
+    admin_client = AsyncClient()
+    admin_client.force_login(admin_user)
+
+    async def download():
+        response = await admin_client.get(url)
+        return response, [chunk async for chunk in response.streaming_content]
+
+    # Served as an async stream, so ASGI sends it chunk by chunk
+    response, chunks = asyncio.run(download())
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.is_async
+    assert "attachment" in response["Content-Disposition"]
+    table = pq.read_table(io.BytesIO(b"".join(chunks)))
+    assert table.num_rows == 1
+
+    csv_response = asyncio.run(admin_client.get(f"{url}?f=csv"))
+    assert csv_response.status_code == 404  # noqa: PLR2004
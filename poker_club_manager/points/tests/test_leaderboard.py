@@ -0,0 +1,119 @@
+import asyncio
+import csv
+
+import pytest
+from django.test import AsyncClient
+from django.urls import reverse
+
+from poker_club_manager.common.tests.factories import (
+    SeasonFactory,
+    SeasonMembershipFactory,
+)
+from poker_club_manager.events.tests.factories import EventFactory
+from poker_club_manager.points.models import LeaderboardEntry
+from poker_club_manager.points.services import apply_scoring, refresh_leaderboard
+
+
+def _csv(url: str, data=None):
+    async def download():
+        response = await AsyncClient().get(url, data)
+        # An async stream, so ASGI sends it chunk by chunk
+        assert response.is_async
+        content = b"".join([chunk async for chunk in response.streaming_content])
+        return response, list(csv.reader(content.decode().splitlines()))
+
+    return asyncio.run(download())
+
+
+def test_refresh_leaderboard_assigns_competition_ranks(db):
+    season = SeasonFactory()
+    top = SeasonMembershipFactory(season=season, points=30)
+    tied = SeasonMembershipFactory.create_batch(2, season=season, points=20)
+    last = SeasonMembershipFactory(season=season, points=5)
+
+    refresh_leaderboard(season.id)
+
+    ranks = dict(LeaderboardEntry.objects.values_list("membership_id", "rank"))
+    assert ranks == {top.id: 1, tied[0].id: 2, tied[1].id: 2, last.id: 4}
+
+
+def test_refresh_leaderboard_only_rewrites_changed_rows(db):
+    season = SeasonFactory()
+    first = SeasonMembershipFactory(season=season, points=10)
+    SeasonMembershipFactory(season=season, points=5)
+    refresh_leaderboard(season.id)
+
+    assert refresh_leaderboard(season.id) == 0
+
+    first.points = 1
+    first.save()
+
+    assert refresh_leaderboard(season.id) == 2  # noqa: PLR2004
+    assert LeaderboardEntry.objects.get(membership=first).rank == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db(transaction=True)
+def test_leaderboard_csv_streams_filtered_standings():
+    season = SeasonFactory()
+    SeasonMembershipFactory(season=season, points=30, user__name="Alice Ace")
+    SeasonMembershipFactory(season=season, points=20, user__name="Bob Bluff")
+    refresh_leaderboard(season.id)
+    url = reverse("points:leaderboard-csv", args=[season.id])
+
+    response, rows = _csv(url)
+    assert response["Content-Type"] == "text/csv"
+    assert rows[0] == ["rank", "name", "points"]
+    assert [row[2] for row in rows[1:]] == ["30", "20"]
+
+    _, rows = _csv(url, {"q": "bluff"})
+    assert [row[2] for row in rows[1:]] == ["20"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_leaderboard_csv_escapes_formulas():
+    season = SeasonFactory()
+    SeasonMembershipFactory(season=season, points=-5, user__name="=HYPERLINK(1)")
+    refresh_leaderboard(season.id)
+
+    _, rows = _csv(reverse("points:leaderboard-csv", args=[season.id]))
+
+    assert rows[1] == ["1", "'=HYPERLINK(1)", "-5"]
+
+
+def test_incremental_refresh_matches_full_refresh(
+    db,
+    django_capture_on_commit_callbacks,
+):
+    event = EventFactory()
+    memberships = [
+        SeasonMembershipFactory(season=event.season, points=points)
+        for points in (50, 40, 40, 30, 20, 20, 10, 0)
+    ]
+    refresh_leaderboard(event.season_id)
+    # Out of range of the change below, so the incremental refresh skips it
+    LeaderboardEntry.objects.filter(membership=memberships[7]).update(rank=99)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        # 30 -> 45 and 40 -> 20: only entries between 20 and 45 move
+        apply_scoring(
+            event,
+            {memberships[3].id: 15, memberships[1].id: -20},
+            "test",
+        )
+    assert LeaderboardEntry.objects.get(membership=memberships[7]).rank == 99  # noqa: PLR2004
+
+    # A full recompute only has the planted rank left to correct
+    assert refresh_leaderboard(event.season_id) == 1
+    ranks = dict(LeaderboardEntry.objects.values_list("membership_id", "rank"))
+    assert [ranks[m.id] for m in memberships] == [1, 4, 3, 2, 4, 4, 7, 8]
+
+
+def test_renaming_user_updates_display_name(db):
+    membership = SeasonMembershipFactory()
+    refresh_leaderboard(membership.season_id)
+
+    membership.user.name = "Renamed Player"
+    membership.user.save()
+
+    entry = LeaderboardEntry.objects.get(membership=membership)
+    assert entry.display_name == "Renamed Player"
@@ -0,0 +1,93 @@
+from unittest import mock
+
+import fakeredis
+import pytest
+import redis
+
+from poker_club_manager.common.tests.factories import (
+    SeasonFactory,
+    SeasonMembershipFactory,
+)
+from poker_club_manager.points.leaderboards import DatabaseLeaderboard, RedisLeaderboard
+from poker_club_manager.points.services import refresh_leaderboard
+
+
+@pytest.fixture
+def backend() -> RedisLeaderboard:
+    return RedisLeaderboard(client=fakeredis.FakeRedis())
+
+
+def test_redis_leaderboard_rebuild_and_rank(db, backend: RedisLeaderboard):
+    season = SeasonFactory()
+    top = SeasonMembershipFactory(season=season, points=30)
+    tied = SeasonMembershipFactory.create_batch(2, season=season, points=20)
+    last = SeasonMembershipFactory(season=season, points=5)
+
+    backend.rebuild(season.id)
+
+    assert backend.count(season.id) == 4  # noqa: PLR2004
+    assert backend.rank(season.id, top.id) == 1
+    assert backend.rank(season.id, tied[0].id) == 2  # noqa: PLR2004
+    assert backend.rank(season.id, last.id) == 4  # noqa: PLR2004
+    assert [row.rank for row in backend.page(season.id, 1, 4)] == [2, 2, 4]
+    assert backend.top(season.id, 1)[0].display_name == top.user.name
+
+
+def test_redis_leaderboard_record_applies_deltas(db, backend: RedisLeaderboard):
+    season = SeasonFactory()
+    first = SeasonMembershipFactory(season=season, points=10)
+    second = SeasonMembershipFactory(season=season, points=5)
+    backend.rebuild(season.id)
+
+    backend.record(season.id, {second.id: 10})
+
+    assert backend.rank(season.id, second.id) == 1
+    assert backend.rank(season.id, first.id) == 2  # noqa: PLR2004
+
+
+def test_redis_leaderboard_ranks_match_materialized_table(
+    db,
+    backend: RedisLeaderboard,
+):
+    season = SeasonFactory()
+    SeasonMembershipFactory(season=season, points=30)
+    SeasonMembershipFactory.create_batch(2, season=season, points=20)
+    SeasonMembershipFactory(season=season, points=5)
+    refresh_leaderboard(season.id)
+    backend.rebuild(season.id)
+
+    database = DatabaseLeaderboard().page(season.id, 0, 4)
+    redis_rows = backend.page(season.id, 0, 4)
+
+    # Ties may be listed in a different order, but never ranked differently
+    assert {(r.membership_id, r.rank) for r in redis_rows} == {
+        (r.membership_id, r.rank) for r in database
+    }
+    assert [row.rank for row in database] == [1, 2, 2, 4]
+
+
+def test_redis_leaderboard_record_rebuilds_missing_set(db, backend: RedisLeaderboard):
+    season = SeasonFactory()
+    first = SeasonMembershipFactory(season=season, points=10)
+    second = SeasonMembershipFactory(season=season, points=15)
+
+    # Balances already include the delta when record runs after commit
+    backend.record(season.id, {second.id: 10})
+
+    assert backend.count(season.id) == 2  # noqa: PLR2004
+    assert backend.rank(season.id, first.id) == 2  # noqa: PLR2004
+
+
+def test_redis_leaderboard_record_drops_set_on_error(db, backend: RedisLeaderboard):
+    season = SeasonFactory()
+    membership = SeasonMembershipFactory(season=season, points=10)
+    backend.rebuild(season.id)
+
+    with mock.patch.object(
+        backend.client,
+        "pipeline",
+        side_effect=redis.ConnectionError("down"),
+    ):
+        backend.record(season.id, {membership.id: 5})
+
+    assert not backend.client.exists(backend.season_key(season.id))
@@ -0,0 +1,58 @@
+from django.db.models import Sum
+
+from poker_club_manager.common.tests.factories import (
+    SeasonFactory,
+    SeasonMembershipFactory,
+)
+from poker_club_manager.events.models import EventCompletionJob
+from poker_club_manager.events.tests.factories import EventFactory, ParticipantFactory
+from poker_club_manager.points.decay import GlobalAttendanceDecayStrategy
+from poker_club_manager.points.models import PointsLedger
+from poker_club_manager.points.replay import replay_season
+
+
+def _seed_event(season, users, *, completed=True):
+    event = EventFactory(season=season)
+    for position, user in enumerate(users, start=1):
+        ParticipantFactory(event=event, user=user, final_position=position)
+    if completed:
+        EventCompletionJob.objects.create(
+            event=event,
+            status=EventCompletionJob.SUCCEEDED,
+        )
+    return event
+
+
+def test_replay_season_rewrites_ledger_and_balances(db):
+    season = SeasonFactory()
+    memberships = SeasonMembershipFactory.create_batch(10, season=season)
+    users = [m.user for m in memberships]
+    _seed_event(season, users)
+    _seed_event(season, list(reversed(users)))
+
+    dry = replay_season(season, GlobalAttendanceDecayStrategy(), dry_run=True)
+    assert dry.events_replayed == 2  # noqa: PLR2004
+    assert dry.diff
+    assert not PointsLedger.objects.exists()
+
+    result = replay_season(season, GlobalAttendanceDecayStrategy())
+
+    for m in memberships:
+        m.refresh_from_db()
+        ledger_total = m.points_ledger.aggregate(total=Sum("points_delta"))["total"]
+        assert m.points == ledger_total == result.balances[m.id]
+    assert replay_season(season, GlobalAttendanceDecayStrategy()).diff == {}
+
+
+def test_replay_season_skips_events_that_were_never_completed(db):
+    season = SeasonFactory()
+    memberships = SeasonMembershipFactory.create_batch(3, season=season)
+    users = [m.user for m in memberships]
+    completed = _seed_event(season, users)
+    pending = _seed_event(season, users, completed=False)
+
+    result = replay_season(season, GlobalAttendanceDecayStrategy())
+
+    assert result.events_replayed == 1
+    assert PointsLedger.objects.filter(event=completed).exists()
+    assert not PointsLedger.objects.filter(event=pending).exists()
@@ -0,0 +1,43 @@
+from poker_club_manager.common.tests.factories import SeasonMembershipFactory
+from poker_club_manager.events.tests.factories import EventFactory, ParticipantFactory
+from poker_club_manager.points.scoring import (
+    BuyInDistributionScoringStrategy,
+    EventResults,
+)
+
+
+def test_calculate_many_matches_single_rank_payouts():
+    strategy = BuyInDistributionScoringStrategy()
+    ranks = [0, 1, 2, 3, 5, 8, 40]
+
+    payouts = strategy.calculate_many(40, ranks)
+
+    assert payouts == [strategy.calculate_points(40, rank) for rank in ranks]
+    assert payouts[0] == 0
+    assert payouts[-1] == 0
+    assert payouts[1] > payouts[2] > payouts[3]
+
+
+def test_calculate_many_pays_nothing_below_minimum_field():
+    strategy = BuyInDistributionScoringStrategy()
+
+    assert strategy.calculate_many(4, [1, 2]) == [0, 0]
+
+
+def test_event_results_load_in_constant_queries(db, django_assert_num_queries):
+    event = EventFactory()
+    members = ParticipantFactory.create_batch(6, event=event)
+    for position, participant in enumerate(members, start=1):
+        participant.final_position = position
+        participant.save()
+        SeasonMembershipFactory(season=event.season, user=participant.user)
+    ParticipantFactory(event=event)  # not a season member
+
+    with django_assert_num_queries(2):
+        results = EventResults.load(event)
+
+    assert results.total_participants == 7  # noqa: PLR2004
+    assert sum(p.membership_id is not None for p in results.participants) == 6  # noqa: PLR2004
+
+    deltas = BuyInDistributionScoringStrategy().calculate_results(results)
+    assert len(deltas) == 6  # noqa: PLR2004
@@ -0,0 +1,106 @@
+import pytest
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from poker_club_manager.common.models import SeasonMembership
+from poker_club_manager.common.tests.factories import SeasonMembershipFactory
+from poker_club_manager.events.tests.factories import EventFactory
+from poker_club_manager.points.models import PointsLedger
+from poker_club_manager.points.services import apply_decay, apply_scoring
+
+
+def test_apply_scoring_updates_balances_and_ledger(db):
+    event = EventFactory()
+    first = SeasonMembershipFactory(season=event.season, points=10)
+    second = SeasonMembershipFactory(season=event.season, points=0)
+    outsider = SeasonMembershipFactory(points=7)
+
+    apply_scoring(event, {first.id: 5, second.id: -3, outsider.id: 100}, "test")
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+    outsider.refresh_from_db()
+    assert first.points == 15  # noqa: PLR2004
+    assert second.points == -3  # noqa: PLR2004
+    assert outsider.points == 7  # noqa: PLR2004
+    assert set(
+        PointsLedger.objects.values_list("membership_id", "points_delta"),
+    ) == {(first.id, 5), (second.id, -3)}
+
+
+def test_apply_scoring_query_count_is_constant(db):
+    event = EventFactory()
+    memberships = SeasonMembershipFactory.create_batch(30, season=event.season)
+
+    with CaptureQueriesContext(connection) as ctx:
+        apply_scoring(event, {m.id: 1 for m in memberships}, "test")
+
+    # lock + update + statistics upsert/update + insert, plus savepoints
+    assert len(ctx.captured_queries) <= 7  # noqa: PLR2004
+
+
+def test_apply_decay_updates_balances_and_ledger(db):
+    event = EventFactory()
+    capped = SeasonMembershipFactory(season=event.season, points=300)
+    small = SeasonMembershipFactory(season=event.season, points=30)
+    tiny = SeasonMembershipFactory(season=event.season, points=4)
+    broke = SeasonMembershipFactory(season=event.season, points=0)
+    outsider = SeasonMembershipFactory(points=300)
+
+    decayed = apply_decay(event, rate=0.1, cap=100, reason="decay")
+
+    # round(min(cap, points) * rate); a zero amount writes nothing
+    assert decayed == 2  # noqa: PLR2004
+    balances = dict(
+        SeasonMembership.objects.filter(
+            id__in=[capped.id, small.id, tiny.id, broke.id, outsider.id],
+        ).values_list("id", "points"),
+    )
+    assert balances == {
+        capped.id: 290,
+        small.id: 27,
+        tiny.id: 4,
+        broke.id: 0,
+        outsider.id: 300,
+    }
+    assert set(
+        PointsLedger.objects.values_list("membership_id", "kind", "points_delta"),
+    ) == {
+        (capped.id, PointsLedger.DECAY, -10),
+        (small.id, PointsLedger.DECAY, -3),
+    }
+
+
+def test_apply_decay_is_idempotent_per_event(db):
+    event = EventFactory()
+    membership = SeasonMembershipFactory(season=event.season, points=60)
+    apply_decay(event, rate=0.1, cap=100, reason="decay")
+
+    assert apply_decay(event, rate=0.1, cap=100, reason="decay") == 0
+
+    membership.refresh_from_db()
+    assert membership.points == 54  # noqa: PLR2004
+    assert PointsLedger.objects.filter(membership=membership).count() == 1
+
+    # A later event decays again
+    apply_decay(EventFactory(season=event.season), rate=0.1, cap=100, reason="decay")
+    membership.refresh_from_db()
+    assert membership.points == 49  # noqa: PLR2004
+
+
+def test_ledger_allows_one_row_per_membership_event_and_kind(db):
+    event = EventFactory()
+    membership = SeasonMembershipFactory(season=event.season, points=50)
+    apply_decay(event, rate=0.1, cap=100, reason="decay")
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        PointsLedger.objects.create(
+            membership=membership,
+            event=event,
+            kind=PointsLedger.DECAY,
+            points_delta=-1,
+            reason="duplicate",
+        )
+    # Scoring for the same event is a different kind
+    apply_scoring(event, {membership.id: 5}, "score")
+    assert PointsLedger.objects.filter(membership=membership).count() == 2  # noqa: PLR2004
@@ -0,0 +1,143 @@
+import datetime
+
+from django.utils import timezone
+
+from poker_club_manager.common.models import MemberStatistics, SeasonMembership
+from poker_club_manager.common.tests.factories import SeasonMembershipFactory
+from poker_club_manager.events.tests.factories import EventFactory, ParticipantFactory
+from poker_club_manager.points.decay import GlobalAttendanceDecayStrategy
+from poker_club_manager.points.models import PointsLedger
+from poker_club_manager.points.replay import replay_season
+from poker_club_manager.points.services import apply_decay, apply_scoring
+from poker_club_manager.points.statistics import (
+    COUNTER_FIELDS,
+    record_ledger_deltas,
+    refresh_statistics,
+)
+
+
+def _counters(membership):
+    stats = MemberStatistics.objects.get(membership=membership)
+    return {field: getattr(stats, field) for field in COUNTER_FIELDS}
+
+
+def test_scoring_updates_counters_incrementally(db):
+    event = EventFactory()
+    winner = SeasonMembershipFactory(season=event.season)
+    loser = SeasonMembershipFactory(season=event.season)
+
+    apply_scoring(event, {winner.id: 5, loser.id: -3}, "test")
+    record_ledger_deltas({winner.id: -2, loser.id: -1}, kind=PointsLedger.DECAY)
+
+    winner_stats = MemberStatistics.objects.get(membership=winner)
+    assert winner_stats.points_won == 5  # noqa: PLR2004
+    assert winner_stats.points_lost == 2  # noqa: PLR2004
+    assert winner_stats.cashes == 1
+    assert winner_stats.net_points == 3  # noqa: PLR2004
+
+    loser_stats = MemberStatistics.objects.get(membership=loser)
+    assert loser_stats.points_won == 0
+    assert loser_stats.points_lost == 4  # noqa: PLR2004
+    assert loser_stats.cashes == 0
+
+
+def test_manual_ledger_rows_update_counters(db):
+    membership = SeasonMembershipFactory()
+
+    PointsLedger.objects.create(
+        membership=membership,
+        points_delta=7,
+        reason="adjustment",
+    )
+
+    assert _counters(membership)["points_won"] == 7  # noqa: PLR2004
+
+
+def test_refresh_matches_incremental_counters(db):
+    event = EventFactory()
+    later = EventFactory(season=event.season)
+    memberships = SeasonMembershipFactory.create_batch(3, season=event.season)
+    for position, membership in enumerate(memberships, start=1):
+        ParticipantFactory(
+            event=event,
+            user=membership.user,
+            final_position=position,
+            eliminations=3 - position,
+        )
+    ParticipantFactory(event=later, user=memberships[0].user, final_position=2)
+
+    apply_scoring(event, {memberships[0].id: 10, memberships[1].id: 4}, "test")
+    apply_scoring(later, {memberships[0].id: 6}, "test")
+    apply_scoring(
+        later,
+        {m.id: -1 for m in memberships},
+        "decay",
+        kind=PointsLedger.DECAY,
+    )
+    incremental = {m.id: _counters(m) for m in memberships}
+
+    written = refresh_statistics(SeasonMembership.objects.filter(season=event.season))
+
+    assert written == 3  # noqa: PLR2004
+
+    for membership in memberships:
+        refreshed = _counters(membership)
+        for field in ("cashes", "points_won", "points_lost"):
+            assert refreshed[field] == incremental[membership.id][field]
+
+    first = MemberStatistics.objects.get(membership=memberships[0])
+    assert first.events_played == 2  # noqa: PLR2004
+    assert first.cashes == 2  # noqa: PLR2004
+    assert first.itm_rate == 1
+    assert first.average_finish == 1.5  # noqa: PLR2004
+    assert first.total_eliminations == 2  # noqa: PLR2004
+
+    third = MemberStatistics.objects.get(membership=memberships[2])
+    assert third.events_played == 1
+    assert third.cashes == 0
+    assert third.itm_rate == 0
+    assert third.points_lost == 1
+
+
+def test_open_ended_events_count_as_played_once_started(db):
+    event = EventFactory(end_date=None)
+    upcoming = EventFactory(
+        season=event.season,
+        start_date=timezone.now() + datetime.timedelta(days=1),
+        end_date=None,
+    )
+    membership = SeasonMembershipFactory(season=event.season)
+    ParticipantFactory(event=event, user=membership.user, final_position=1)
+    ParticipantFactory(event=upcoming, user=membership.user)
+    apply_scoring(event, {membership.id: 10}, "test")
+
+    refresh_statistics(SeasonMembership.objects.filter(id=membership.id))
+
+    stats = MemberStatistics.objects.get(membership=membership)
+    assert stats.events_played == 1
+    assert stats.cashes == 1
+    assert stats.itm_rate == 1
+
+
+def test_decay_updates_counters(db):
+    event = EventFactory()
+    membership = SeasonMembershipFactory(season=event.season, points=40)
+
+    apply_decay(event, rate=0.25, cap=100, reason="decay")
+
+    assert _counters(membership)["points_lost"] == 10  # noqa: PLR2004
+
+
+def test_replay_recounts_counters(db):
+    event = EventFactory()
+    memberships = SeasonMembershipFactory.create_batch(3, season=event.season)
+    for position, membership in enumerate(memberships, start=1):
+        ParticipantFactory(event=event, user=membership.user, final_position=position)
+    apply_scoring(event, {memberships[0].id: 1000}, "stale")
+
+    replay_season(event.season, GlobalAttendanceDecayStrategy())
+
+    written = {m.id: _counters(m) for m in memberships}
+    refresh_statistics(SeasonMembership.objects.filter(season=event.season))
+    assert {m.id: _counters(m) for m in memberships} == written
+    assert written[memberships[0].id]["points_won"] != 1000  # noqa: PLR2004
@@ -11,4 +11,19 @@ urlpatterns = [
         views.leaderboard,
         name="archived-leaderboard",
     ),
+    path(
+        "archive/<int:season_id>/leaderboard.csv",
+        views.leaderboard_csv,
+        name="leaderboard-csv",
+    ),
+    path(
+        "archive/<int:season_id>/history/",
+        views.season_history,
+        name="season-history",
+    ),
+    path(
+        "archive/<int:season_id>/export/<slug:table>/",
+        views.export_season_table,
+        name="season-export",
+    ),
 ]
@@ -1,25 +1,72 @@
 from types import SimpleNamespace
 
-from django.core.paginator import Paginator
-from django.http import HttpRequest
-from django.shortcuts import get_object_or_404, render
-
-from poker_club_manager.common.models import Season
+from asgiref.sync import sync_to_async
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db import transaction
+from django.http import Http404, HttpRequest, StreamingHttpResponse
+from django.shortcuts import aget_object_or_404, get_object_or_404, render
+
+from poker_club_manager.common.models import MemberStatistics, Season, SeasonMembership
+from poker_club_manager.common.utils.asyncviews import aget_user, aiterate, arender
+from poker_club_manager.common.utils.conditional import (
+    alatest_changes,
+    conditional_page,
+    last_modified,
+)
+from poker_club_manager.common.utils.csvstream import stream_csv
+from poker_club_manager.common.utils.fragments import arender_cached_fragment
+from poker_club_manager.common.utils.pagination import apaginate
 from poker_club_manager.common.utils.params import parse_int
 
+from .balances import standings_as_of
+from .exports import (
+    CONTENT_TYPES,
+    EXPORT_TABLES,
+    EXTENSIONS,
+    PARQUET,
+    stream_table,
+)
 from .filters import SeasonMemberListFilter
+from .leaderboards import get_leaderboard_backend
+from .models import LeaderboardEntry
+
+
+async def _leaderboard_validators(
+    request: HttpRequest,
+    season_id: int | None = None,
+):
+    user = await aget_user(request)
+    seasons = (
+        Season.objects.filter(id=season_id)
+        if season_id is not None
+        else Season.objects.filter(is_active=True)
+    )
+    changes = await alatest_changes(
+        seasons,
+        LeaderboardEntry.objects.filter(season__in=seasons.values("id")),
+        MemberStatistics.objects.filter(
+            membership__season__in=seasons.values("id"),
+            membership__user_id=user.pk,
+        ),
+    )
+    # The user only matters for "Your rank" and their stats on the full page
+    return last_modified(changes), (changes, user.pk)
 
 
-def leaderboard(request: HttpRequest, season_id: int | None = None):
+@transaction.non_atomic_requests
+@conditional_page(_leaderboard_validators)
+async def leaderboard(request: HttpRequest, season_id: int | None = None):
+    user = await aget_user(request)
     if season_id is not None:
-        season = get_object_or_404(Season, id=season_id)
+        season = await aget_object_or_404(Season, id=season_id)
     else:
-        season = Season.get_active_season()
-        if not season:
-            return render(
+        active = await Season.objects.filter(is_active=True).afirst()
+        if not active:
+            return await arender(
                 request,
                 "points/out_of_season.html",
             )
+        season = active
 
     default_filters = SimpleNamespace(
         {
@@ -32,10 +79,10 @@ def leaderboard(request: HttpRequest, season_id: int | None = None):
     search_query = request.GET.get("q", "").strip()
     order = request.GET.get("s", default_filters.order)
 
-    members = SeasonMemberListFilter(
+    member_filter = SeasonMemberListFilter(
         search_query=search_query,
         order=order,
-    ).apply(season)
+    )
 
     members_per_page = parse_int(
         request.GET.get("v"),
@@ -44,26 +91,51 @@ def leaderboard(request: HttpRequest, season_id: int | None = None):
         max_value=50,
     )
 
-    paginator = Paginator(members, members_per_page)
-
-    page = parse_int(
-        request.GET.get("p"),
-        default=1,
-        min_value=1,
-        max_value=paginator.num_pages,
-    )
-    page_members = paginator.get_page(page)
-
-    context = {"members": page_members, "page": page, "max_page": paginator.num_pages}
+    async def get_context():
+        page_members, page_context = await apaginate(
+            request,
+            member_filter.apply(season),
+            members_per_page,
+            keyset_ordering=member_filter.keyset_ordering,
+        )
+        return {
+            "season": season,
+            "members": page_members,
+            **page_context,
+        }
 
     if request.headers.get("HX-Request") == "true":
-        return render(request, "points/leaderboard.html#member_list", context=context)
+        return await arender_cached_fragment(
+            request,
+            "points/leaderboard.html#member_list",
+            get_context,
+            scopes=[f"season:{season.id}"],
+        )
+
+    my_rank = None
+    my_stats = None
+    if user.is_authenticated:
+        membership = await SeasonMembership.objects.filter(
+            user=user,
+            season=season,
+        ).afirst()
+        if membership is not None:
+            # Backends are synchronous (database or Redis)
+            my_rank = await sync_to_async(get_leaderboard_backend().rank)(
+                season.id,
+                membership.id,
+            )
+            my_stats = await MemberStatistics.objects.filter(
+                membership=membership,
+            ).afirst()
 
-    return render(
+    return await arender(
         request,
         "points/leaderboard.html",
         context={
-            **context,
+            **await get_context(),
+            "my_rank": my_rank,
+            "my_stats": my_stats,
             "filters": SimpleNamespace(
                 {
                     "order": order,
@@ -76,6 +148,19 @@ def leaderboard(request: HttpRequest, season_id: int | None = None):
     )
 
 
+@transaction.non_atomic_requests
+def leaderboard_csv(request: HttpRequest, season_id: int):
+    season = get_object_or_404(Season, id=season_id)
+    member_filter = SeasonMemberListFilter(
+        search_query=request.GET.get("q", "").strip(),
+    )
+    return stream_csv(
+        f"season-{season.id}-leaderboard.csv",
+        ["rank", "name", "points"],
+        member_filter.entries(season).values_list("rank", "display_name", "points"),
+    )
+
+
 def archive(request: HttpRequest):
     seasons = Season.objects.filter(is_active=False).order_by("-start_date")
     return render(
@@ -83,3 +168,49 @@ def archive(request: HttpRequest):
         "points/archive.html",
         {"seasons": seasons},
     )
+
+
+HISTORY_STANDINGS_LIMIT = 50
+
+
+def season_history(request: HttpRequest, season_id: int):
+    season = get_object_or_404(Season, id=season_id)
+    events = season.events.finished().order_by("start_date", "id")
+
+    event_id = parse_int(request.GET.get("event"), default=None)
+    event = events.filter(id=event_id).first() if event_id is not None else None
+    standings = (
+        standings_as_of(season, event=event)[:HISTORY_STANDINGS_LIMIT]
+        if event is not None
+        else []
+    )
+
+    return render(
+        request,
+        "points/history.html",
+        {
+            "season": season,
+            "events": events,
+            "event": event,
+            "standings": standings,
+        },
+    )
+
+
+# The stream is produced after the view returns, so its server-side cursor
+# must not live in the request's transaction
+@transaction.non_atomic_requests
+@staff_member_required
+def export_season_table(request: HttpRequest, season_id: int, table: str):
+    season = get_object_or_404(Season, id=season_id)
+    file_format = request.GET.get("f", PARQUET)
+    if table not in EXPORT_TABLES or file_format not in EXTENSIONS:
+        raise Http404
+
+    filename = f"season-{season.id}-{table}.{EXTENSIONS[file_format]}"
+    content = stream_table(EXPORT_TABLES[table], season, file_format=file_format)
+    return StreamingHttpResponse(
+        aiterate(content),
+        content_type=CONTENT_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
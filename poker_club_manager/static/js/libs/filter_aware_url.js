@@ -24,6 +24,14 @@ function updateHistory() {
         params.delete("p");
     }
 
+    // Cursor-paginated lists carry their position as an opaque cursor
+    const cursor = document.getElementById("current-cursor");
+    if (cursor && cursor.getAttribute("value")) {
+        params.set("c", cursor.getAttribute("value"));
+    } else {
+        params.delete("c");
+    }
+
     const basePath = window.location.pathname;
     const url =
         params.toString() === ""
@@ -0,0 +1,46 @@
+// Counts down locally between pushes; every push from the stream resets
+// the clock to the server's state, corrected for the client's clock skew.
+let deadline = null;
+
+function formatSeconds(seconds) {
+    const minutes = Math.floor(seconds / 60);
+    return `${minutes}:${String(seconds % 60).padStart(2, '0')}`;
+}
+
+function renderClock(remaining) {
+    document.getElementById('timer-clock').textContent = formatSeconds(remaining);
+}
+
+function applyState(state) {
+    if (state.ends_at === null) {
+        deadline = null;
+        renderClock(state.remaining_seconds);
+    } else {
+        const skew = Date.now() / 1000 - state.server_time;
+        deadline = state.ends_at + skew;
+    }
+
+    const level = document.getElementById('timer-level');
+    if (state.is_finished) {
+        level.textContent = 'Finished';
+    } else if (state.level_type === 'break') {
+        level.textContent = 'Break';
+    } else {
+        level.textContent = `Blinds ${state.small_blind} / ${state.big_blind}`;
+    }
+    document.getElementById('timer-status').textContent = state.is_paused ? 'Paused' : '';
+}
+
+function tick() {
+    if (deadline !== null) {
+        renderClock(Math.max(0, Math.ceil(deadline - Date.now() / 1000)));
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    const container = document.getElementById('timer');
+    // EventSource reconnects on its own and receives the current state first
+    const source = new EventSource(container.dataset.streamUrl);
+    source.onmessage = (event) => applyState(JSON.parse(event.data));
+    setInterval(tick, 250);
+});
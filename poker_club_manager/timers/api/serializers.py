@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+
+class TimelineEntrySerializer(serializers.Serializer):
+    level_index = serializers.IntegerField(source="level.level_index")
+    level_type = serializers.CharField(source="level.level_type")
+    duration_seconds = serializers.IntegerField(source="level.duration_seconds")
+    small_blind = serializers.IntegerField(source="level.small_blind", allow_null=True)
+    big_blind = serializers.IntegerField(source="level.big_blind", allow_null=True)
+    starts_at = serializers.DateTimeField()
+    ends_at = serializers.DateTimeField()
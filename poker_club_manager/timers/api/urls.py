@@ -0,0 +1,11 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import BlindsTemplateViewSet, BlindsTimerViewSet
+
+router = DefaultRouter()
+router.register(r"timers", BlindsTimerViewSet, basename="timer")
+router.register(
+    r"blinds-templates",
+    BlindsTemplateViewSet,
+    basename="blinds-template",
+)
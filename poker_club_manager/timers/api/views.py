@@ -0,0 +1,67 @@
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from poker_club_manager.timers.models import BlindsTemplate, BlindsTimer
+
+from .serializers import TimelineEntrySerializer
+
+
+class BlindsTimerViewSet(viewsets.GenericViewSet):
+    queryset = BlindsTimer.objects.select_related("template")
+
+    @action(detail=True)
+    def timeline(self, request, pk=None):
+        """
+        The projected start and end of every level, so clients can render
+        the whole structure locally.
+        """
+        timer = self.get_object()
+        now = timezone.now()
+        entries = timer.projected_timeline(now)
+        return Response(
+            {
+                "timer_id": timer.id,
+                "current_level_index": timer.current_level_index,
+                "is_paused": timer.is_paused,
+                "is_finished": timer.is_finished,
+                "server_time": now,
+                "levels": TimelineEntrySerializer(entries, many=True).data,
+            },
+        )
+
+
+class BlindsTemplateViewSet(viewsets.GenericViewSet):
+    queryset = BlindsTemplate.objects.all()
+
+    def get_queryset(self):
+        return BlindsTemplate.objects.global_or_owned(self.request.user.id)
+
+    @action(detail=True)
+    def timeline(self, request, pk=None):
+        """
+        Level times for play starting at ``start`` (ISO 8601, default now).
+        """
+        template = self.get_object()
+        start = timezone.now()
+        if "start" in request.query_params:
+            try:
+                parsed = parse_datetime(request.query_params["start"])
+            except ValueError:
+                # Well formatted but impossible, such as February 30th
+                parsed = None
+            if parsed is None:
+                return Response(
+                    {"error": "start must be an ISO 8601 datetime."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            start = timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+        entries = template.timeline(start)
+        return Response(
+            {
+                "template_id": template.id,
+                "levels": TimelineEntrySerializer(entries, many=True).data,
+            },
+        )
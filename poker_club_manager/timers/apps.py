@@ -10,4 +10,4 @@ class TimersConfig(AppConfig):
 
     def ready(self):
         with contextlib.suppress(ImportError):
-            from . import signals  # noqa: F401, PLC0415
+            from . import receivers  # noqa: F401, PLC0415
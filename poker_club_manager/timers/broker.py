@@ -0,0 +1,115 @@
+import asyncio
+import functools
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import AsyncIterator
+
+from django.conf import settings
+
+
+class TimerBroker(ABC):
+    """
+    Fans timer state changes out to every open stream of a timer.
+    """
+
+    key: str
+
+    @abstractmethod
+    def publish(self, timer_id: int, payload: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def subscribe(self, timer_id: int, heartbeat: float) -> AsyncIterator[str | None]:
+        """
+        Yield every payload published for the timer, and None whenever
+        ``heartbeat`` seconds pass without one.
+        """
+        raise NotImplementedError
+
+
+class InProcessBroker(TimerBroker):
+    """
+    Delivers only to streams served by the same process; suitable for a
+    single worker or local development.
+    """
+
+    key = "memory"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def publish(self, timer_id, payload):
+        with self._lock:
+            subscribers = list(self._subscribers[timer_id])
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, payload)
+
+    async def subscribe(self, timer_id, heartbeat):
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers[timer_id].add(subscriber)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), heartbeat)
+                except TimeoutError:
+                    yield None
+        finally:
+            with self._lock:
+                self._subscribers[timer_id].discard(subscriber)
+                if not self._subscribers[timer_id]:
+                    del self._subscribers[timer_id]
+
+
+class RedisBroker(TimerBroker):
+    """
+    Publishes through Redis pub/sub so every worker's streams receive it.
+    """
+
+    key = "redis"
+
+    CHANNEL_PREFIX = "timers:stream"
+
+    def channel(self, timer_id: int) -> str:
+        return f"{self.CHANNEL_PREFIX}:{timer_id}"
+
+    def publish(self, timer_id, payload):
+        _redis_client().publish(self.channel(timer_id), payload)
+
+    async def subscribe(self, timer_id, heartbeat):
+        import redis.asyncio  # noqa: PLC0415
+
+        client = redis.asyncio.Redis.from_url(settings.REDIS_URL)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel(timer_id))
+        try:
+            while True:
+                message = await pubsub.get_message(timeout=heartbeat)
+                yield message["data"].decode() if message else None
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
+
+@functools.cache
+def _redis_client():
+    import redis  # noqa: PLC0415
+
+    return redis.Redis.from_url(settings.REDIS_URL)
+
+
+DEFAULT_BROKER = InProcessBroker
+
+BROKER_MAP = {
+    InProcessBroker.key: InProcessBroker,
+    RedisBroker.key: RedisBroker,
+}
+
+
+@functools.cache
+def get_timer_broker() -> TimerBroker:
+    # One instance per process so in-process subscribers are shared
+    return BROKER_MAP.get(settings.TIMERS_BROKER, DEFAULT_BROKER)()
@@ -0,0 +1,44 @@
+import json
+
+from django.utils import timezone
+
+from .broker import get_timer_broker
+from .models import BlindsTimer
+
+
+def timer_state(timer: BlindsTimer) -> dict:
+    """
+    The authoritative clock state pushed to viewers. ``ends_at`` lets
+    clients count down locally until the next push.
+    """
+    now = timezone.now()
+    level = timer.current_level
+    remaining = timer.remaining_seconds
+    running = level is not None and not timer.is_paused and timer.level_started_at
+
+    return {
+        "timer_id": timer.id,
+        "level_index": timer.current_level_index,
+        "level_type": level.level_type if level else None,
+        "small_blind": level.small_blind if level else None,
+        "big_blind": level.big_blind if level else None,
+        "duration_seconds": level.duration_seconds if level else None,
+        "remaining_seconds": remaining,
+        "is_paused": timer.is_paused,
+        "is_finished": timer.is_finished,
+        "server_time": now.timestamp(),
+        "ends_at": now.timestamp() + remaining if running else None,
+    }
+
+
+def publish_timer_state(timer: BlindsTimer):
+    get_timer_broker().publish(timer.id, json.dumps(timer_state(timer)))
+
+
+def format_sse(payload: str | None) -> str:
+    """
+    An SSE ``data`` message, or a comment line to keep the connection open.
+    """
+    if payload is None:
+        return ": keepalive\n\n"
+    return f"data: {payload}\n\n"
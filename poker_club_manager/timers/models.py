@@ -1,3 +1,5 @@
+import datetime
+
 from django.db import models
 from django.db.models import Q
 from django.utils import timezone
@@ -36,6 +38,16 @@ class BlindsTemplate(AbstractTimestampedModel):
     def __str__(self):
         return self.name
 
+    def timeline(self, start: datetime.datetime):
+        """
+        When each level would start and end if play began at ``start``
+        and was never paused.
+        """
+        from .schedule import project_timeline  # noqa: PLC0415
+
+        # Callers pass the current time or their own start, neither reusable
+        return project_timeline(self, 0, start, cache=False)
+
 
 class BlindsLevel(AbstractTimestampedModel):
     LEVEL_TYPE_PLAY = "play"
@@ -98,34 +110,83 @@ class BlindsTimer(AbstractTimestampedModel):
     def __str__(self):
         return f"Clock for Event {self.event.id}"
 
+    @property
+    def schedule(self):
+        from .schedule import get_schedule  # noqa: PLC0415
+
+        return get_schedule(self.template)
+
     @property
     def current_level(self):
-        if self.is_finished:
-            return None
-        return list(self.template.levels.all())[self.current_level_index]
+        return self.schedule.level(self.current_level_index)
 
     @property
     def max_level_index(self) -> int:
-        return self.template.levels.count() - 1
+        return len(self.schedule) - 1
 
     @property
     def is_finished(self) -> bool:
         return self.max_level_index < self.current_level_index
 
     @property
-    def remaining_seconds(self) -> int:
-        if self.is_finished or self.is_paused or not self.level_started_at:
-            return 0
+    def next_break(self):
+        position = self.schedule.next_break(self.current_level_index)
+        return self.schedule.level(position) if position is not None else None
 
-        elapsed = int(
-            (timezone.now() - self.level_started_at).total_seconds(),
+    @property
+    def seconds_until_next_break(self) -> int | None:
+        schedule = self.schedule
+        position = schedule.next_break(self.current_level_index)
+        if position is None or self.is_finished:
+            return None
+        return (
+            self.remaining_seconds
+            + schedule.starts_at(position)
+            - schedule.ends[self.current_level_index]
         )
 
-        elapsed += self.accumulated_pause_seconds
+    @property
+    def remaining_seconds(self) -> int:
+        if self.is_finished or not self.level_started_at:
+            return 0
+
+        # accumulated_pause_seconds holds the level time run before the
+        # last pause; the clock is stopped while paused
+        elapsed = self.accumulated_pause_seconds
+        if not self.is_paused:
+            elapsed += int(
+                (timezone.now() - self.level_started_at).total_seconds(),
+            )
         duration = self.current_level.duration_seconds
 
         return max(0, duration - elapsed)
 
+    def projected_timeline(self, now: datetime.datetime | None = None):
+        """
+        Absolute start and end of every level from the current state.
+        Levels before the current one are back-dated by their durations.
+        While the timer is paused or not yet started, the projection assumes
+        play continues at ``now``.
+        """
+        from .schedule import project_timeline  # noqa: PLC0415
+
+        now = now or timezone.now()
+        elapsed = datetime.timedelta(seconds=self.accumulated_pause_seconds)
+        if self.is_paused or not self.level_started_at:
+            # The anchor moves with the clock, so the result is not reusable
+            return project_timeline(
+                self.template,
+                self.current_level_index,
+                now - elapsed,
+                cache=False,
+            )
+        # Fixed until the next increment, pause or resume
+        return project_timeline(
+            self.template,
+            self.current_level_index,
+            self.level_started_at - elapsed,
+        )
+
     @property
     def can_decrement_level(self) -> bool:
         return self.current_level_index > 0
@@ -160,9 +221,11 @@ class BlindsTimer(AbstractTimestampedModel):
             )
             self.paused_at = now
             self.is_paused = True
+            self.save()
 
     def resume(self):
         if self.is_paused:
+            self.level_started_at = timezone.now()
             self.is_paused = False
             self.paused_at = None
             self.save()
@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .live import publish_timer_state
+from .models import BlindsLevel, BlindsTemplate, BlindsTimer
+
+
+@receiver(post_save, sender=BlindsTimer)
+def handle_timer_saved(sender, instance, **kwargs):
+    transaction.on_commit(lambda: publish_timer_state(instance))
+
+
+@receiver([post_save, post_delete], sender=BlindsLevel)
+def touch_template(sender, instance, **kwargs):
+    # A new updated_at is a new template version for compiled schedules
+    BlindsTemplate.objects.filter(pk=instance.template_id).update(
+        updated_at=timezone.now(),
+    )
@@ -0,0 +1,144 @@
+import bisect
+import datetime
+import functools
+from array import array
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from .models import BlindsLevel
+
+SCHEDULE_CACHE_SIZE = 256
+
+
+class LevelSpec(NamedTuple):
+    level_index: int
+    level_type: str
+    duration_seconds: int
+    small_blind: int | None
+    big_blind: int | None
+
+    @property
+    def is_break(self) -> bool:
+        return self.level_type == BlindsLevel.LEVEL_TYPE_BREAK
+
+
+@dataclass(frozen=True)
+class CompiledSchedule:
+    """
+    A template's levels in play order with their cumulative end offsets,
+    so lookups are arithmetic over arrays instead of queries.
+    """
+
+    levels: tuple[LevelSpec, ...]
+    # ends[i] is the offset in seconds from the first level's start at
+    # which level i ends
+    ends: array
+    # Positions of break levels, ascending
+    breaks: array
+
+    def __len__(self):
+        return len(self.levels)
+
+    @property
+    def total_seconds(self) -> int:
+        return self.ends[-1] if self.ends else 0
+
+    def level(self, position: int) -> LevelSpec | None:
+        if 0 <= position < len(self.levels):
+            return self.levels[position]
+        return None
+
+    def starts_at(self, position: int) -> int:
+        return self.ends[position - 1] if position > 0 else 0
+
+    def level_at(self, elapsed_seconds: int) -> int:
+        """
+        Position of the level running ``elapsed_seconds`` after the first
+        level started; ``len(self)`` once every level has run.
+        """
+        return bisect.bisect_right(self.ends, elapsed_seconds)
+
+    def next_break(self, position: int) -> int | None:
+        """
+        Position of the first break after the level at ``position``.
+        """
+        i = bisect.bisect_right(self.breaks, position)
+        return self.breaks[i] if i < len(self.breaks) else None
+
+
+def compile_levels(levels) -> CompiledSchedule:
+    specs = tuple(
+        LevelSpec(
+            level.level_index,
+            level.level_type,
+            level.duration_seconds,
+            level.small_blind,
+            level.big_blind,
+        )
+        for level in levels
+    )
+    ends = array("Q")
+    total = 0
+    for spec in specs:
+        total += spec.duration_seconds
+        ends.append(total)
+    breaks = array("L", (i for i, spec in enumerate(specs) if spec.is_break))
+    return CompiledSchedule(specs, ends, breaks)
+
+
+class TimelineEntry(NamedTuple):
+    level: LevelSpec
+    starts_at: datetime.datetime
+    ends_at: datetime.datetime
+
+
+@functools.lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _compiled(template_id: int, version) -> CompiledSchedule:
+    return compile_levels(
+        BlindsLevel.objects.filter(template_id=template_id).order_by("level_index"),
+    )
+
+
+def get_schedule(template) -> CompiledSchedule:
+    """
+    The compiled levels of ``template``, built once per process for each
+    version of the template. Saving or deleting a level touches the
+    template's ``updated_at``, which retires the old entry.
+    """
+    return _compiled(template.pk, template.updated_at)
+
+
+@functools.lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _timeline(
+    template_id: int,
+    version,
+    position: int,
+    anchor: datetime.datetime,
+) -> tuple[TimelineEntry, ...]:
+    schedule = _compiled(template_id, version)
+    base = schedule.starts_at(position)
+    return tuple(
+        TimelineEntry(
+            level,
+            anchor + datetime.timedelta(seconds=schedule.starts_at(i) - base),
+            anchor + datetime.timedelta(seconds=schedule.ends[i] - base),
+        )
+        for i, level in enumerate(schedule.levels)
+    )
+
+
+def project_timeline(
+    template,
+    position: int,
+    anchor: datetime.datetime,
+    *,
+    cache: bool = True,
+) -> tuple[TimelineEntry, ...]:
+    """
+    Absolute start and end of every level of ``template``, given that the
+    level at ``position`` started (or would have, had it run without
+    stopping) at ``anchor``. Anchors that move with the clock should pass
+    ``cache=False`` rather than fill the cache with single-use entries.
+    """
+    project = _timeline if cache else _timeline.__wrapped__
+    return project(template.pk, template.updated_at, position, anchor)
@@ -0,0 +1,67 @@
+import datetime
+
+import pytest
+from django.utils.dateparse import parse_datetime
+from rest_framework.test import APIClient
+
+from poker_club_manager.timers.tests.factories import (
+    BlindsLevelFactory,
+    BlindsTimerFactory,
+)
+from poker_club_manager.users.models import User
+
+
+@pytest.fixture
+def api_client(user: User) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+@pytest.fixture
+def timer(db):
+    timer = BlindsTimerFactory(
+        level_started_at=datetime.datetime(2025, 1, 1, 18, tzinfo=datetime.UTC),
+    )
+    for index in range(3):
+        BlindsLevelFactory(template=timer.template, level_index=index)
+    timer.template.refresh_from_db()
+    return timer
+
+
+def test_timer_timeline(api_client: APIClient, timer):
+    response = api_client.get(f"/api/timers/{timer.id}/timeline/")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    levels = response.json()["levels"]
+    assert [level["level_index"] for level in levels] == [0, 1, 2]
+    second_level = datetime.datetime(2025, 1, 1, 18, 10, tzinfo=datetime.UTC)
+    assert parse_datetime(levels[1]["starts_at"]) == second_level
+
+
+def test_template_timeline(api_client: APIClient, timer):
+    response = api_client.get(
+        f"/api/blinds-templates/{timer.template.id}/timeline/",
+        {"start": "2025-01-01T18:00:00Z"},
+    )
+
+    ends_at = parse_datetime(response.json()["levels"][-1]["ends_at"])
+    assert ends_at == datetime.datetime(2025, 1, 1, 18, 30, tzinfo=datetime.UTC)
+
+
+def test_template_timeline_rejects_bad_start(api_client: APIClient, timer):
+    response = api_client.get(
+        f"/api/blinds-templates/{timer.template.id}/timeline/",
+        {"start": "soon"},
+    )
+
+    assert response.status_code == 400  # noqa: PLR2004
+
+
+def test_template_timeline_rejects_impossible_start(api_client: APIClient, timer):
+    response = api_client.get(
+        f"/api/blinds-templates/{timer.template.id}/timeline/",
+        {"start": "2025-02-30T10:00:00"},
+    )
+
+    assert response.status_code == 400  # noqa: PLR2004
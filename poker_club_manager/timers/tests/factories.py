@@ -0,0 +1,33 @@
+from factory import LazyAttribute, Sequence, SubFactory
+from factory.django import DjangoModelFactory
+
+from poker_club_manager.events.tests.factories import EventFactory
+from poker_club_manager.timers.models import BlindsLevel, BlindsTemplate, BlindsTimer
+
+
+class BlindsTemplateFactory(DjangoModelFactory[BlindsTemplate]):
+    name = Sequence(lambda n: f"Structure {n}")
+    is_global = True
+
+    class Meta:
+        model = BlindsTemplate
+
+
+class BlindsLevelFactory(DjangoModelFactory[BlindsLevel]):
+    template = SubFactory(BlindsTemplateFactory)
+    level_index = Sequence(lambda n: n)
+    level_type = BlindsLevel.LEVEL_TYPE_PLAY
+    duration_seconds = 600
+    small_blind = LazyAttribute(lambda o: 25 * (o.level_index + 1))
+    big_blind = LazyAttribute(lambda o: 50 * (o.level_index + 1))
+
+    class Meta:
+        model = BlindsLevel
+
+
+class BlindsTimerFactory(DjangoModelFactory[BlindsTimer]):
+    event = SubFactory(EventFactory)
+    template = SubFactory(BlindsTemplateFactory)
+
+    class Meta:
+        model = BlindsTimer
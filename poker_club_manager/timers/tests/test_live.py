@@ -0,0 +1,94 @@
+import asyncio
+import datetime
+import json
+
+import pytest
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+
+from poker_club_manager.timers.broker import InProcessBroker
+from poker_club_manager.timers.live import format_sse, timer_state
+
+from .factories import BlindsLevelFactory, BlindsTimerFactory
+
+
+@pytest.fixture
+def timer(db):
+    timer = BlindsTimerFactory(
+        level_started_at=timezone.now() - datetime.timedelta(seconds=100),
+    )
+    for index in range(2):
+        BlindsLevelFactory(template=timer.template, level_index=index)
+    return timer
+
+
+def test_remaining_seconds_stop_while_paused(timer):
+    timer.pause()
+    timer.level_started_at -= datetime.timedelta(hours=1)
+
+    assert timer.remaining_seconds == 500  # noqa: PLR2004
+
+
+def test_resume_continues_from_paused_time(timer):
+    timer.pause()
+    timer.resume()
+
+    assert timer.remaining_seconds == 500  # noqa: PLR2004
+
+
+def test_timer_state(timer):
+    state = timer_state(timer)
+
+    assert state["remaining_seconds"] == 500  # noqa: PLR2004
+    assert state["small_blind"] == 25  # noqa: PLR2004
+    assert state["ends_at"] == pytest.approx(state["server_time"] + 500)
+
+
+def test_timer_state_paused_has_no_deadline(timer):
+    timer.pause()
+
+    assert timer_state(timer)["ends_at"] is None
+
+
+def test_format_sse():
+    assert format_sse(json.dumps({"a": 1})) == 'data: {"a": 1}\n\n'
+    assert format_sse(None) == ": keepalive\n\n"
+
+
+def test_in_process_broker_fans_out():
+    broker = InProcessBroker()
+
+    async def run():
+        first = broker.subscribe(1, heartbeat=1)
+        second = broker.subscribe(1, heartbeat=1)
+        other = broker.subscribe(2, heartbeat=0.01)
+        # Start the subscriptions before publishing
+        pending = [
+            asyncio.ensure_future(anext(stream)) for stream in (first, second, other)
+        ]
+        await asyncio.sleep(0)
+        broker.publish(1, "state")
+        received = await asyncio.gather(*pending)
+        for stream in (first, second, other):
+            await stream.aclose()
+        return received
+
+    assert asyncio.run(run()) == ["state", "state", None]
+    assert not broker._subscribers  # noqa: SLF001
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_starts_with_current_state(timer):
+    async def first_event():
+        response = await AsyncClient().get(
+            reverse("timers:stream", args=[timer.id]),
+        )
+        chunk = await anext(response.streaming_content)
+        await response.streaming_content.aclose()
+        return response, chunk
+
+    response, chunk = asyncio.run(first_event())
+
+    assert response["Content-Type"] == "text/event-stream"
+    assert json.loads(chunk.decode().removeprefix("data: "))["timer_id"] == timer.id
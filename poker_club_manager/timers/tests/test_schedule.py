@@ -0,0 +1,115 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from poker_club_manager.timers.models import BlindsTimer
+from poker_club_manager.timers.schedule import compile_levels, get_schedule
+
+from .factories import BlindsLevelFactory, BlindsTemplateFactory, BlindsTimerFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def template():
+    template = BlindsTemplateFactory()
+    for index, level_type in enumerate(["play", "play", "break", "play", "break"]):
+        BlindsLevelFactory(
+            template=template,
+            level_index=index,
+            level_type=level_type,
+            duration_seconds=600 if level_type == "play" else 300,
+        )
+    template.refresh_from_db()
+    return template
+
+
+def test_compile_levels_cumulative_ends(template):
+    schedule = compile_levels(template.levels.all())
+
+    assert list(schedule.ends) == [600, 1200, 1500, 2100, 2400]
+    assert list(schedule.breaks) == [2, 4]
+    assert schedule.total_seconds == 2400  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("elapsed", "position"),
+    [(0, 0), (599, 0), (600, 1), (1499, 2), (2399, 4), (2400, 5)],
+)
+def test_level_at(template, elapsed, position):
+    assert get_schedule(template).level_at(elapsed) == position
+
+
+def test_next_break(template):
+    schedule = get_schedule(template)
+
+    assert schedule.next_break(0) == 2  # noqa: PLR2004
+    assert schedule.next_break(2) == 4  # noqa: PLR2004
+    assert schedule.next_break(4) is None
+
+
+def test_timer_lookups_run_no_queries(template, django_assert_num_queries):
+    timer = BlindsTimerFactory(
+        template=template,
+        level_started_at=timezone.now() - datetime.timedelta(seconds=100),
+    )
+    timer = BlindsTimer.objects.select_related("template").get(pk=timer.pk)
+    get_schedule(timer.template)
+
+    with django_assert_num_queries(0):
+        assert timer.current_level.small_blind == 25  # noqa: PLR2004
+        assert timer.max_level_index == 4  # noqa: PLR2004
+        assert not timer.is_finished
+        assert timer.remaining_seconds == 500  # noqa: PLR2004
+        assert timer.next_break.level_index == 2  # noqa: PLR2004
+        assert timer.seconds_until_next_break == 500 + 600
+
+
+def test_level_changes_invalidate_schedule(template):
+    before = get_schedule(template)
+    template.levels.get(level_index=0).delete()
+    template.refresh_from_db()
+
+    assert len(get_schedule(template)) == len(before) - 1
+
+
+def test_template_timeline(template):
+    start = datetime.datetime(2025, 1, 1, 18, tzinfo=datetime.UTC)
+
+    entries = template.timeline(start)
+
+    assert entries[0].starts_at == start
+    assert entries[2].starts_at == start + datetime.timedelta(seconds=1200)
+    assert entries[-1].ends_at == start + datetime.timedelta(seconds=2400)
+
+
+def test_projected_timeline_from_running_level(template):
+    started = timezone.now() - datetime.timedelta(seconds=100)
+    timer = BlindsTimerFactory(
+        template=template,
+        current_level_index=1,
+        level_started_at=started,
+    )
+
+    entries = timer.projected_timeline()
+
+    assert entries[1].starts_at == started
+    assert entries[0].starts_at == started - datetime.timedelta(seconds=600)
+    assert entries[2].starts_at == started + datetime.timedelta(seconds=600)
+    assert timer.projected_timeline() is entries
+
+
+def test_projected_timeline_while_paused(template):
+    now = timezone.now()
+    timer = BlindsTimerFactory(
+        template=template,
+        level_started_at=now - datetime.timedelta(hours=1),
+        is_paused=True,
+        paused_at=now - datetime.timedelta(minutes=50),
+        accumulated_pause_seconds=600 - 60,
+    )
+
+    entries = timer.projected_timeline(now)
+
+    assert entries[0].ends_at == now + datetime.timedelta(seconds=60)
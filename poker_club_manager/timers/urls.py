@@ -7,4 +7,5 @@ urlpatterns = [
     path("", views.active_timers, name="active"),
     path("new/", views.new_timer, name="new"),
     path("<int:timer_id>/", views.timer_detail, name="detail"),
+    path("<int:timer_id>/stream/", views.timer_stream, name="stream"),
 ]
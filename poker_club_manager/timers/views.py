@@ -1,6 +1,13 @@
-from django.http import HttpRequest
-from django.shortcuts import get_object_or_404, render
+import json
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpRequest, StreamingHttpResponse
+from django.shortcuts import aget_object_or_404, get_object_or_404, render
+
+from .broker import get_timer_broker
+from .live import format_sse, timer_state
 from .models import BlindsTemplate, BlindsTimer
 
 
@@ -10,10 +17,41 @@ def active_timers(request: HttpRequest):
 
 
 def timer_detail(request: HttpRequest, timer_id: int):
-    timer = get_object_or_404(BlindsTimer, id=timer_id)
+    timer = get_object_or_404(
+        BlindsTimer.objects.select_related("template"),
+        id=timer_id,
+    )
     return render(request, "timers/detail.html", {"timer": timer})
 
 
+@transaction.non_atomic_requests
+async def timer_stream(request: HttpRequest, timer_id: int):
+    """
+    Server-Sent Events stream of a timer's state: the current state, then
+    every change published after a save. Viewers never query the database.
+    """
+    timer = await aget_object_or_404(
+        BlindsTimer.objects.select_related("template"),
+        id=timer_id,
+    )
+    initial = json.dumps(await sync_to_async(timer_state)(timer))
+    broker = get_timer_broker()
+
+    async def events():
+        yield format_sse(initial)
+        async for payload in broker.subscribe(
+            timer_id,
+            heartbeat=settings.TIMERS_STREAM_HEARTBEAT_SECONDS,
+        ):
+            yield format_sse(payload)
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx-style proxies from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 def new_timer(request: HttpRequest):
     blinds_templates = BlindsTemplate.objects.global_or_owned(request.user.id).order_by(
         "updated_at",
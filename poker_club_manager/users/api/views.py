@@ -1,7 +1,12 @@
-from rest_framework import status
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.http import JsonResponse
+from rest_framework import exceptions, status
 from rest_framework.decorators import action
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin, UpdateModelMixin
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet
 
 from poker_club_manager.users.models import User
@@ -23,23 +28,44 @@ class UserViewSet(RetrieveModelMixin, ListModelMixin, UpdateModelMixin, GenericV
         serializer = UserSerializer(request.user, context={"request": request})
         return Response(status=status.HTTP_200_OK, data=serializer.data)
 
-    @action(detail=False, url_path="fetch-matching-names")
-    def fetch_matching_names(self, request):
-        requested_query = request.query_params.get("query", "").strip()
-        if not requested_query:
-            return Response(
-                status=status.HTTP_400_BAD_REQUEST,
-                data={"detail": "Query parameter 'query' is required."},
-            )
-
-        users = (
-            User.objects
-            .only("id", "username", "name")
-            .filter_by_name(requested_query)[:3]
+
+@transaction.non_atomic_requests
+async def fetch_matching_names(request):
+    """
+    Typeahead for the manage page, served by a plain async view: DRF views
+    are synchronous and would hold a worker thread for every keystroke.
+    Accepts the same session and token authentication as the API.
+    """
+    try:
+        user = await _aauthenticate(request)
+    except exceptions.AuthenticationFailed as e:
+        return JsonResponse({"detail": e.detail}, status=status.HTTP_403_FORBIDDEN)
+    if not user.is_authenticated:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."},
+            status=status.HTTP_403_FORBIDDEN,
         )
-        serializer = UserSerializer(users, many=True, context={"request": request})
 
-        return Response(
-            status=status.HTTP_200_OK,
-            data={"results": serializer.data},
+    requested_query = request.GET.get("query", "").strip()
+    if not requested_query:
+        return JsonResponse(
+            {"detail": "Query parameter 'query' is required."},
+            status=status.HTTP_400_BAD_REQUEST,
         )
+
+    users = await User.objects.only("id", "username", "name").atypeahead(
+        requested_query,
+        limit=3,
+    )
+    serializer = UserSerializer(users, many=True, context={"request": request})
+
+    return JsonResponse({"results": serializer.data})
+
+
+async def _aauthenticate(request):
+    """
+    The user as the API's configured authentication classes see it. DRF
+    authenticators are synchronous, so they run in a worker thread.
+    """
+    drf_request = Request(request, authenticators=APIView().get_authenticators())
+    return await sync_to_async(getattr)(drf_request, "user")
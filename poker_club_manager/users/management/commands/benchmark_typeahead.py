@@ -0,0 +1,128 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from poker_club_manager.common.utils.db import table_name
+from poker_club_manager.users.models import TYPEAHEAD_MIN_SUBSTRING_LENGTH, User
+
+SYLLABLES = [
+    "an",
+    "bel",
+    "cor",
+    "da",
+    "el",
+    "fin",
+    "gar",
+    "ho",
+    "is",
+    "jo",
+    "ka",
+    "li",
+    "mar",
+    "no",
+    "or",
+    "pe",
+    "qui",
+    "ro",
+    "sa",
+    "ty",
+    "ul",
+    "vi",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time User.objects.typeahead against filter_by_name over synthetic "
+        "users. Everything runs in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100_000)
+        parser.add_argument("--queries", type=int, default=200)
+        parser.add_argument("--limit", type=int, default=3)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        # Seeded so runs generate the same users; nothing here is secret
+        rng = random.Random(options["seed"])  # noqa: S311
+        limit = options["limit"]
+
+        with transaction.atomic():
+            names = self._create_users(rng, options["users"])
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(f"ANALYZE {table_name(User)}")
+
+            fragments = self._fragments(rng, names, options["queries"])
+            users = User.objects.only("id", "username", "name")
+
+            mismatches = 0
+            for fragment in fragments:
+                expected = users.filter_by_name(fragment)
+                if len(fragment) < TYPEAHEAD_MIN_SUBSTRING_LENGTH:
+                    # Short fragments deliberately skip substring-only matches
+                    expected = expected.filter(match_rank__lte=1)
+                actual = users.typeahead(fragment, limit=limit)
+                if [u.id for u in actual] != [u.id for u in expected[:limit]]:
+                    mismatches += 1
+
+            self._report(
+                "filter_by_name",
+                fragments,
+                lambda f: list(users.filter_by_name(f)[:limit]),
+            )
+            self._report(
+                "typeahead",
+                fragments,
+                lambda f: users.typeahead(f, limit=limit),
+            )
+            self.stdout.write(f"{mismatches} fragments returned different users")
+
+            transaction.set_rollback(True)
+
+    def _create_users(self, rng, count):
+        names = []
+        users = []
+        for i in range(count):
+            first = "".join(rng.choices(SYLLABLES, k=rng.randint(1, 3))).title()
+            last = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).title()
+            username = f"{first.lower()}{last.lower()[:4]}{i}"
+            names.append((username, f"{first} {last}"))
+            users.append(User(username=username, name=f"{first} {last}"))
+        User.objects.bulk_create(users, batch_size=5000)
+        return names
+
+    def _fragments(self, rng, names, count):
+        fragments = []
+        for _ in range(count):
+            username, name = rng.choice(names)
+            source = rng.choice([username, name])
+            match rng.randrange(4):
+                case 0:
+                    fragments.append(source)
+                case 1:
+                    fragments.append(source[: rng.randint(1, 4)])
+                case 2:
+                    start = rng.randrange(max(1, len(source) - 3))
+                    fragments.append(source[start : start + rng.randint(3, 5)])
+                case _:
+                    fragments.append("zz" + source[:3])
+        return fragments
+
+    def _report(self, label, fragments, run):
+        timings = []
+        for fragment in fragments:
+            started = time.perf_counter()
+            run(fragment)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(
+            f"{label}: p50 {statistics.median(timings):.2f} ms, "
+            f"p95 {p95:.2f} ms, max {timings[-1]:.2f} ms",
+        )
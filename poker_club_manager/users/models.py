@@ -1,9 +1,14 @@
 from django.contrib.auth.models import AbstractUser, UserManager
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 from django.db.models import Case, Q, When
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
+# Substring matches below this length cannot use the trigram indexes
+TYPEAHEAD_MIN_SUBSTRING_LENGTH = 3
+
 
 class UserQuerySet(models.QuerySet):
     def filter_by_name(self, name_fragment: str) -> "UserQuerySet":
@@ -36,6 +41,67 @@ class UserQuerySet(models.QuerySet):
             .order_by("match_rank", "username")
         )
 
+    def typeahead(self, name_fragment: str, limit: int = 3) -> list["User"]:
+        """Return the first ``limit`` users of ``filter_by_name``, in the same
+        match_rank order, without ranking every match.
+
+        Each rank (exact, prefix, substring) is fetched by its own indexed
+        query and later ranks are only queried while results are missing.
+        Substring matches need at least TYPEAHEAD_MIN_SUBSTRING_LENGTH
+        characters.
+
+        Args:
+            name_fragment (str): Fragment of name to match.
+            limit (int): Maximum number of users to return.
+
+        Returns:
+            list[User]: Matching users annotated with ``match_rank``.
+
+        """
+        users: list[User] = []
+        for match_rank, condition in enumerate(self._typeahead_stages(name_fragment)):
+            remaining = limit - len(users)
+            if remaining <= 0:
+                break
+
+            for user in self._typeahead_stage(condition, users, remaining):
+                user.match_rank = match_rank
+                users.append(user)
+
+        return users
+
+    async def atypeahead(self, name_fragment: str, limit: int = 3) -> list["User"]:
+        """Async version of ``typeahead``."""
+        users: list[User] = []
+        for match_rank, condition in enumerate(self._typeahead_stages(name_fragment)):
+            remaining = limit - len(users)
+            if remaining <= 0:
+                break
+
+            async for user in self._typeahead_stage(condition, users, remaining):
+                user.match_rank = match_rank
+                users.append(user)
+
+        return users
+
+    def _typeahead_stages(self, name_fragment: str) -> list[Q]:
+        stages = [
+            Q(username__iexact=name_fragment) | Q(name__iexact=name_fragment),
+            Q(username__istartswith=name_fragment) | Q(name__istartswith=name_fragment),
+        ]
+        if len(name_fragment) >= TYPEAHEAD_MIN_SUBSTRING_LENGTH:
+            stages.append(
+                Q(username__icontains=name_fragment) | Q(name__icontains=name_fragment),
+            )
+        return stages
+
+    def _typeahead_stage(self, condition: Q, found: list["User"], limit: int):
+        return (
+            self.filter(condition)
+            .exclude(id__in=[user.id for user in found])
+            .order_by("username")[:limit]
+        )
+
 
 class CustomUserManager(UserManager.from_queryset(UserQuerySet)):
     pass
@@ -55,6 +121,29 @@ class User(AbstractUser):
 
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):  # type: ignore[name-defined]
+        # Trigram indexes over UPPER(...) so that the icontains lookups used by
+        # member and leaderboard search can use an index scan; the pattern ops
+        # indexes serve the iexact and istartswith typeahead stages
+        indexes = [
+            models.Index(
+                OpClass(Upper("username"), name="text_pattern_ops"),
+                name="user_username_upper_idx",
+            ),
+            models.Index(
+                OpClass(Upper("name"), name="text_pattern_ops"),
+                name="user_name_upper_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                name="user_username_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="user_name_trgm_idx",
+            ),
+        ]
+
     def get_absolute_url(self) -> str:
         """Get URL for user's detail view.
 
@@ -19,3 +19,13 @@ def test_user_list():
 def test_user_me():
     assert reverse("api:user-me") == "/api/users/me/"
     assert resolve("/api/users/me/").view_name == "api:user-me"
+
+
+def test_user_fetch_matching_names():
+    assert (
+        reverse("api:user-fetch-matching-names") == "/api/users/fetch-matching-names/"
+    )
+    assert (
+        resolve("/api/users/fetch-matching-names/").view_name
+        == "api:user-fetch-matching-names"
+    )
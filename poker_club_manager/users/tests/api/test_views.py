@@ -1,8 +1,10 @@
 import pytest
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIRequestFactory
 
 from poker_club_manager.users.api.views import UserViewSet
 from poker_club_manager.users.models import User
+from poker_club_manager.users.tests.factories import UserFactory
 
 
 class TestUserViewSet:
@@ -33,3 +35,45 @@ class TestUserViewSet:
             "url": f"http://testserver/api/users/{user.username}/",
             "name": user.name,
         }
+
+
+class TestFetchMatchingNames:
+    url = "/api/users/fetch-matching-names/"
+
+    def test_returns_typeahead_results(self, client, user: User):
+        UserFactory(username="annabel", name="Annabel Lee")
+        client.force_login(user)
+
+        response = client.get(self.url, {"query": "annab"})
+
+        assert response.status_code == 200  # noqa: PLR2004
+        assert [r["username"] for r in response.json()["results"]] == ["annabel"]
+        assert response.json()["results"][0]["url"].endswith("/api/users/annabel/")
+
+    def test_accepts_token_authentication(self, client, user: User):
+        token = Token.objects.create(user=user)
+
+        response = client.get(
+            self.url,
+            {"query": user.username},
+            headers={"Authorization": f"Token {token.key}"},
+        )
+
+        assert response.status_code == 200  # noqa: PLR2004
+
+    def test_rejects_invalid_token(self, client, db):
+        response = client.get(
+            self.url,
+            {"query": "a"},
+            headers={"Authorization": "Token not-a-token"},
+        )
+
+        assert response.status_code == 403  # noqa: PLR2004
+
+    def test_requires_authentication(self, client, db):
+        assert client.get(self.url, {"query": "a"}).status_code == 403  # noqa: PLR2004
+
+    def test_requires_query(self, client, user: User):
+        client.force_login(user)
+
+        assert client.get(self.url).status_code == 400  # noqa: PLR2004
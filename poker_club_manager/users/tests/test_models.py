@@ -1,5 +1,38 @@
+import asyncio
+
 from poker_club_manager.users.models import User
+from poker_club_manager.users.tests.factories import UserFactory
 
 
 def test_user_get_absolute_url(user: User):
     assert user.get_absolute_url() == f"/users/{user.username}/"
+
+
+def test_typeahead_matches_filter_by_name_ordering(db):
+    UserFactory(username="annabel", name="Zed")
+    UserFactory(username="anna", name="Someone")
+    UserFactory(username="bob", name="Anna Smith")
+    UserFactory(username="joanna", name="Jo")
+    UserFactory(username="zoe", name="Anna")
+
+    expected = list(User.objects.filter_by_name("anna")[:4])
+    actual = User.objects.typeahead("anna", limit=4)
+
+    assert actual == expected
+    assert [user.match_rank for user in actual] == [0, 0, 1, 1]
+
+
+def test_typeahead_skips_substring_matches_for_short_fragments(db):
+    UserFactory(username="joanna", name="Jo")
+
+    assert User.objects.typeahead("an") == []
+    assert [user.username for user in User.objects.typeahead("ann")] == ["joanna"]
+
+
+def test_atypeahead_matches_typeahead(transactional_db):
+    UserFactory(username="anna", name="Someone")
+    UserFactory(username="joanna", name="Jo")
+
+    users = asyncio.run(User.objects.atypeahead("anna"))
+
+    assert [(u.username, u.match_rank) for u in users] == [("anna", 0), ("joanna", 2)]